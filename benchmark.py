@@ -0,0 +1,312 @@
+"""
+This script generates synthetic cases and measures how
+edith.py, edith2.py and edith3.py scale on them.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+You can execute this script by running this:
+>>> python3 benchmark.py --engines edith2 edith3 --pairs 4 8 --output results.json
+
+Every engine reads the same corpus files through stdin in
+a subprocess. The time and the peak memory of every run are
+written as JSON, together with the answers, so results can
+be compared between engines and between commits.
+
+The corpus is made of the following families:
+- planted: Cases built around a survivor of a given length,
+           plus random genes.
+- random: Random genes, which usually have no survivor
+          and make the engines mutate every age.
+- impossible-length: Every gene 'a' is longer than its gene 'b'.
+- impossible-count: Both genes have the same length, but every
+                    gene 'a' has more of the first character.
+- hard: Known cases whose populations grow very fast,
+        regardless of the amount of genes.
+
+Engines can also be measured in this process, so the time
+of every case is not hidden by the startup of the interpreter.
+The timeout is not enforced and the peak memory is not measured:
+>>> python3 benchmark.py --in-process --engines edith2-bidirectional edith2-best-first
+
+A single family can be printed in the input format:
+>>> python3 benchmark.py --generate planted --pairs 6 --cases 3
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import collections
+
+import engines
+
+ENGINES = {
+    "edith": ["edith.py"],
+    "edith2": ["edith2.py"],
+    "edith3": ["edith3.py"],
+    "edith2-best-first": ["cli.py", "--engine", "edith2-best-first"],
+    "edith2-bidirectional": ["cli.py", "--engine", "edith2-bidirectional"],
+}
+
+FAMILIES = (
+    "planted",
+    "random",
+    "impossible-length",
+    "impossible-count",
+    "hard",
+)
+
+# Cases whose populations grow very fast.
+HARD = [
+    [("abb", "ababa"), ("ab", "aaba"), ("bababa", "bbaa"), ("a", "aaaaa"),
+     ("a", "aba"), ("ab", "babba"), ("aa", "ba"), ("abaa", "abb"),
+     ("babab", "aaa"), ("aa", "aabbbb")],
+    [("aaa", "babab"), ("bba", "baabb"), ("aabaaa", "ba"), ("a", "aaaa"),
+     ("ababa", "abbabb"), ("a", "aaaab"), ("a", "baab"), ("aa", "abb"),
+     ("baabb", "baaaa"), ("bbbab", "ba")],
+    [("100", "1"), ("0", "100"), ("1", "00")],
+]
+
+
+def get_alphabet(size: int) -> str:
+    """
+    This function returns the first characters of the alphabet.
+
+    @param size: The amount of characters.
+    """
+    return "".join(chr(ord("a") + i) for i in range(size))
+
+
+def get_string(rnd: random.Random, alphabet: str, length: int) -> str:
+    """
+    This function returns a random string.
+
+    @param rnd: The random number generator.
+    @param alphabet: The characters of the string.
+    @param length: The length of the string.
+    """
+    return "".join(rnd.choice(alphabet) for _ in range(length))
+
+
+def split(rnd: random.Random, string: str, parts: int) -> list:
+    """
+    This function splits a string into non-empty parts at random positions.
+
+    @param rnd: The random number generator.
+    @param string: The string to split.
+    @param parts: The amount of parts.
+    """
+    cuts = sorted(rnd.sample(range(1, len(string)), parts - 1))
+    return [string[i:j] for i, j in zip([0] + cuts, cuts + [len(string)])]
+
+
+def generate(family: str="planted", pairs: int=5, length: int=3,
+             alphabet: int=2, solution: int=10, seed: int=0) -> list:
+    """
+    This function generates a case of a family.
+
+    @param family: One of FAMILIES.
+    @param pairs: The amount of genes.
+    @param length: The maximum length of the random genes.
+    @param alphabet: The amount of characters.
+    @param solution: The length of the planted survivor.
+    @param seed: The seed of the random number generator.
+    """
+    if family not in FAMILIES:
+        raise ValueError("Invalid family:", family)
+    if pairs < 1 or length < 1 or alphabet < 1:
+        raise ValueError("Invalid size:", pairs, length, alphabet)
+    if family == "impossible-count" and alphabet < 2:
+        raise ValueError("Invalid alphabet:", alphabet)
+    rnd = random.Random(seed)
+    characters = get_alphabet(alphabet)
+    genes = []
+    if family == "hard":
+        return list(HARD[seed % len(HARD)])
+    if family == "planted":
+        # Both splits of the survivor use the same amount of genes,
+        # which is at most the amount of genes of the case.
+        parts = max(1, min(pairs, solution, -(-solution // length)))
+        survivor = get_string(rnd, characters, max(solution, parts))
+        genes = list(zip(split(rnd, survivor, parts),
+                         split(rnd, survivor, parts)))
+    while len(genes) < pairs:
+        size = rnd.randint(1, length)
+        a = get_string(rnd, characters, size)
+        b = get_string(rnd, characters, size)
+        if family == "impossible-length":
+            a += get_string(rnd, characters, rnd.randint(1, length))
+        elif family == "impossible-count":
+            a = characters[0] + a[1:]
+            b = b.replace(characters[0], characters[-1])
+        elif rnd.random() < 0.5:
+            b = get_string(rnd, characters, rnd.randint(1, length))
+        genes.append((a, b))
+    rnd.shuffle(genes)
+    return genes
+
+
+def write(cases: list, stream):
+    """
+    This function writes cases in the input format.
+
+    @param cases: A list of cases, each one a list of (a, b) pairs.
+    @param stream: A text stream such as sys.stdout.
+    """
+    for pairs in cases:
+        stream.write("{}\n".format(len(pairs)))
+        for a, b in pairs:
+            stream.write("{} {}\n".format(a, b))
+
+
+def measure(engine: str, path: str, timeout: float=60) -> dict:
+    """
+    This function runs an engine on a corpus file in a subprocess
+    and returns its time in seconds, its peak memory in kilobytes
+    and its answers.
+
+    @param engine: One of ENGINES.
+    @param path: The path of the corpus file.
+    @param timeout: The amount of seconds before the engine is killed.
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          ENGINES[engine][0])
+    arguments = [sys.executable, script] + ENGINES[engine][1:] + ["--cache", "0"]
+    with open(path) as stdin, tempfile.TemporaryFile() as stdout:
+        start = time.perf_counter()
+        process = subprocess.Popen(arguments,
+                                   stdin=stdin,
+                                   stdout=stdout,
+                                   stderr=subprocess.DEVNULL)
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        _, status, usage = os.wait4(process.pid, 0)
+        seconds = time.perf_counter() - start
+        timer.cancel()
+        process.returncode = os.waitstatus_to_exitcode(status)
+        stdout.seek(0)
+        answers = [
+            line.split(": ", 1)[-1]
+            for line in stdout.read().decode().splitlines()
+        ]
+    return {
+        "seconds": seconds,
+        "maxrss_kb": usage.ru_maxrss,
+        "timeout": seconds >= timeout,
+        "returncode": process.returncode,
+        "answers": answers,
+    }
+
+
+def measure_in_process(engine: str, cases: list) -> dict:
+    """
+    This function solves some cases with an engine in this
+    process and returns its time in seconds and its answers.
+
+    @param engine: One of ENGINES.
+    @param cases: A list of cases, each one a list of (a, b) pairs.
+    """
+    solver = engines.ENGINES[engine]
+    answers = []
+    start = time.perf_counter()
+    for pairs in cases:
+        answers.append(solver.solve(pairs))
+    return {
+        "seconds": time.perf_counter() - start,
+        "maxrss_kb": None,
+        "timeout": False,
+        "returncode": 0,
+        "answers": answers,
+    }
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmarking the engines.")
+    parser.add_argument("--engines", "-e", nargs="+", default=["edith", "edith2", "edith3"],
+                        choices=sorted(ENGINES),
+                        help="Engines to measure. (default: edith edith2 edith3)")
+    parser.add_argument("--families", "-f", nargs="+", default=list(FAMILIES),
+                        choices=FAMILIES,
+                        help="Families of cases. (default: all of them)")
+    parser.add_argument("--pairs", "-p", type=int, nargs="+", default=[4, 8],
+                        help="Amounts of genes per case. (default: 4 8)")
+    parser.add_argument("--length", "-l", type=int, default=3,
+                        help="Maximum length of the random genes. (default: 3)")
+    parser.add_argument("--alphabet", "-a", type=int, default=2,
+                        help="Amount of characters. (default: 2)")
+    parser.add_argument("--solution", "-s", type=int, default=10,
+                        help="Length of the planted survivors. (default: 10)")
+    parser.add_argument("--cases", "-c", type=int, default=10,
+                        help="Amount of cases per corpus file. (default: 10)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of the first case. (default: 0)")
+    parser.add_argument("--timeout", "-t", type=float, default=60,
+                        help="Seconds before an engine is killed. (default: 60)")
+    parser.add_argument("--in-process", "-i", action="store_true",
+                        help="Solve the cases in this process.")
+    parser.add_argument("--generate", "-g", choices=FAMILIES, default=None,
+                        help="Only print the cases of a family.")
+    parser.add_argument("--output", "-o", default=None,
+                        help="JSON file where results are written. (default: stdout)")
+    args = parser.parse_args()
+
+    def get_cases(family: str, pairs: int) -> list:
+        """ Generating the cases of a corpus file. """
+        return [
+            generate(family=family, pairs=pairs, length=args.length,
+                     alphabet=args.alphabet, solution=args.solution,
+                     seed=args.seed + seed)
+            for seed in range(args.cases)
+        ]
+
+    if args.generate:
+        for pairs in args.pairs:
+            write(get_cases(args.generate, pairs), sys.stdout)
+        sys.exit(0)
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": vars(args),
+        "runs": [],
+    }
+    totals = collections.Counter()
+    directory = tempfile.mkdtemp()
+    for family in args.families:
+        # The hard family does not depend on the amount of genes.
+        for pairs in args.pairs[:1] if family == "hard" else args.pairs:
+            cases = get_cases(family, pairs)
+            path = os.path.join(directory, "{}-{}.in".format(family, pairs))
+            with open(path, "w") as f:
+                write(cases, f)
+            for engine in args.engines:
+                if args.in_process:
+                    run = measure_in_process(engine, cases)
+                else:
+                    run = measure(engine, path, args.timeout)
+                run.update(engine=engine, family=family, pairs=pairs)
+                totals[engine] += run["seconds"]
+                results["runs"].append(run)
+                sys.stderr.write("{:>20} {:>18} {:>4} {:>9.3f}s {:>9} KB{}\n".format(
+                    engine, family, pairs, run["seconds"], run["maxrss_kb"] or "-",
+                    " TIMEOUT" if run["timeout"] else ""))
+            os.remove(path)
+    os.rmdir(directory)
+    for engine in args.engines:
+        sys.stderr.write("{:>20} {:>33.3f}s total\n".format(engine, totals[engine]))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+    else:
+        json.dump(results, sys.stdout, indent=4)
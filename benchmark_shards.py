@@ -0,0 +1,65 @@
+"""
+This script measures the speedup of mutating the population
+of a single case with a pool of processes in edith2.py
+
+You can execute this script by running this:
+>>> python3 benchmark_shards.py --shards 1 2 4 8
+
+It prints the time taken with every amount of shards and
+the speedup compared to the first amount of shards. Shards
+can only pay off on machines with more than 1 core, since every
+shard is sent to its worker process on every age. The only
+measurement so far was taken on a single core, where they are slower:
+
+shards    seconds    speedup
+     1      4.292      1.00x
+     2      5.225      0.82x
+     4      4.890      0.88x
+
+No speedup has been shown on any machine yet, so edith2.py
+only uses shards if they are asked for. Run this script on a
+machine with more cores before using them.
+"""
+
+import time
+import argparse
+
+import edith2
+import benchmark
+
+# A case without survivors, so every age has to be mutated.
+# Its population grows to more than 100000 chromosomes.
+PAIRS = benchmark.HARD[0]
+
+
+def measure(shards: int, repeat: int=1) -> float:
+    """
+    This function returns the best time in seconds
+    taken to solve the case with some amount of shards.
+
+    @param shards: The amount of processes mutating the population.
+    @param repeat: The amount of times the case is solved.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        edith2.solve(PAIRS, shards=shards)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measuring the speedup of shards.")
+    parser.add_argument("--shards", "-s", type=int, nargs="+", default=[1, 2, 4],
+                        help="Amounts of shards to measure. (default: 1 2 4)")
+    parser.add_argument("--repeat", "-r", type=int, default=1,
+                        help="Amount of times each case is solved. (default: 1)")
+    args = parser.parse_args()
+
+    print("{:>6} {:>10} {:>10}".format("shards", "seconds", "speedup"))
+    baseline = None
+    for shards in args.shards:
+        seconds = measure(shards, args.repeat)
+        baseline = baseline or seconds
+        print("{:>6} {:>10.3f} {:>9.2f}x".format(shards, seconds, baseline / seconds))
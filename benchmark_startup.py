@@ -0,0 +1,64 @@
+"""
+This script measures the time taken to solve a tiny input,
+which is dominated by the startup of the interpreter and
+the imports of each engine.
+
+You can execute this script by running this:
+>>> python3 benchmark_startup.py --repeat 20
+
+It prints the median time of every command and how much
+slower it is than starting bare Python. The engines are run
+through cli.py, which only imports the chosen one, and through
+their own scripts.
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+# A single case with a single gene.
+INPUT = b"1\na a\n"
+
+COMMANDS = [
+    ("python", ["-c", "pass"]),
+    ("cli.py edith3", ["cli.py", "--engine", "edith3"]),
+    ("cli.py edith2", ["cli.py", "--engine", "edith2"]),
+    ("cli.py edith", ["cli.py", "--engine", "edith"]),
+    ("edith3.py", ["edith3.py"]),
+    ("edith2.py", ["edith2.py"]),
+    ("edith.py", ["edith.py"]),
+]
+
+
+def measure(arguments: list, repeat: int=10) -> float:
+    """
+    This function returns the median time in seconds
+    taken by a command to solve the tiny input.
+
+    @param arguments: The arguments passed to the interpreter.
+    @param repeat: The amount of times the command is run.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + arguments, input=INPUT,
+                       stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measuring the startup time.")
+    parser.add_argument("--repeat", "-r", type=int, default=10,
+                        help="Amount of times each command is run. (default: 10)")
+    args = parser.parse_args()
+
+    print("{:>14} {:>10} {:>10}".format("command", "seconds", "overhead"))
+    baseline = None
+    for name, arguments in COMMANDS:
+        seconds = measure(arguments, args.repeat)
+        baseline = baseline or seconds
+        print("{:>14} {:>10.3f} {:>9.2f}x".format(name, seconds, seconds / baseline))
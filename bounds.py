@@ -0,0 +1,202 @@
+"""
+This is the lower bound of the characters needed to resolve an overhang.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+A chromosome is made of a resolved part and an overhang, and
+its longest gene is a prefix of every survivor it can lead to.
+The bounds say how many more characters the longest gene needs
+before the overhang is resolved, so the length of the longest
+gene plus the bound is never longer than the survivor.
+
+Every overhang reachable from the start is mutated once, as long
+as it is not longer than MAX_LENGTH and there are no more than
+MAX_OVERHANGS of them. Then the bounds are relaxed backwards from
+the empty overhang, like a shortest path. Mutated overhangs that can
+not be resolved have no bound at all, so their chromosomes can be removed.
+
+Overhangs that were not mutated are estimated by their balance: an
+overhang in 'a' with k characters needs genes adding k more characters
+to 'b' than to 'a', and the genes doing that with the least characters
+in 'a' give the bound. The same is true for every character.
+
+For example:
+>>> b = Bounds([("ab", "a"), ("c", "bc")])
+>>> b.get("b", "")
+1
+>>> b.get("", "")
+0
+"""
+
+import heapq
+import logging
+import fractions
+
+logger = logging.getLogger(__name__)
+
+
+class Bounds(object):
+    """
+    This class represents the bounds of the overhangs of a genetic code.
+
+    @constant MAX_LENGTH: The longest overhang that is mutated.
+    @constant MAX_OVERHANGS: The amount of overhangs that are mutated.
+    """
+
+    MAX_LENGTH = 12
+    MAX_OVERHANGS = 1000
+
+    def __init__(self, pairs: list=None, max_length: int=MAX_LENGTH,
+                 max_overhangs: int=MAX_OVERHANGS):
+        """
+        Bounds constructor.
+
+        @param pairs: A list of (a, b) pairs of strings.
+        @param max_length: The longest overhang that is mutated.
+        @param max_overhangs: The amount of overhangs that are mutated.
+        """
+        if not pairs:
+            raise ValueError("Invalid pairs:", pairs)
+        self.pairs = pairs
+        self.max_length = max_length
+        self.max_overhangs = max_overhangs
+        self.mutated = set()
+        self.bounds = {}
+        self.rates = self.__get_rates()
+        self.__relax(self.__mutate())
+
+    def __str__(self):
+        """ To String method. """
+        return "<Bounds: {}>".format(len(self.bounds))
+
+    def __get_rates(self) -> list:
+        """
+        This private method returns the least amount of characters
+        added to the longest gene for each character added to the
+        balance of the other gene, for the total length and for every
+        character, as a (numerator, denominator) pair, or None if no
+        gene can add to that balance.
+        """
+        alphabet = sorted({char for pair in self.pairs for gene in pair for char in gene})
+        rates = []
+        for char in [None] + alphabet:
+            def count(gene: str, char=char) -> int:
+                return len(gene) if char is None else gene.count(char)
+            rate = []
+            for a, b in (zip(*self.pairs), reversed(list(zip(*self.pairs)))):
+                rate.append(min((
+                    fractions.Fraction(len(x), count(y) - count(x))
+                    for x, y in zip(a, b)
+                    if count(y) > count(x)
+                ), default=None))
+            rates.append((char, [
+                None if r is None else (r.numerator, r.denominator)
+                for r in rate
+            ]))
+        return rates
+
+    def estimate(self, a: str, b: str) -> int:
+        """
+        Estimation getter.
+
+        This function returns the least amount of characters the
+        longest gene needs to balance its overhang, or None if it can
+        not be balanced. See the docstring of this module.
+
+        @param a: The overhang of gene 'a', if any.
+        @param b: The overhang of gene 'b', if any.
+        """
+        overhang, side = (a, 0) if a else (b, 1)
+        bound = 0
+        for char, rate in self.rates:
+            balance = len(overhang) if char is None else overhang.count(char)
+            if not balance:
+                continue
+            if rate[side] is None:
+                return None
+            numerator, denominator = rate[side]
+            bound = max(bound, -(-balance * numerator // denominator))
+        return bound
+
+    def get_mutations(self, a: str, b: str):
+        """
+        This function yields the overhangs left by every
+        gene that can fuse with some overhangs, together with
+        the amount of characters added to the longest gene.
+
+        @param a: The overhang of gene 'a', if any.
+        @param b: The overhang of gene 'b', if any.
+        """
+        for gene in self.pairs:
+            new_a = a + gene[0]
+            new_b = b + gene[1]
+            shared = min(len(new_a), len(new_b))
+            if new_a[:shared] != new_b[:shared]:
+                continue
+            yield ((new_a[shared:], new_b[shared:]),
+                   max(len(new_a), len(new_b)) - max(len(a), len(b)))
+
+    def __mutate(self) -> dict:
+        """
+        This private method mutates every overhang reachable from
+        the start, and returns the overhangs each one comes from.
+        """
+        parents = {}
+        generation = {overhang for overhang, _ in self.get_mutations("", "")}
+        while generation:
+            new_generation = set()
+            for a, b in generation:
+                if not a and not b:
+                    continue
+                if len(a + b) > self.max_length or \
+                        len(self.mutated) >= self.max_overhangs:
+                    continue
+                self.mutated.add((a, b))
+                for overhang, length in self.get_mutations(a, b):
+                    parents.setdefault(overhang, []).append(((a, b), length))
+                    if overhang not in self.mutated:
+                        new_generation.add(overhang)
+            generation = new_generation
+        logger.debug("Mutated %s overhang(s).", len(self.mutated))
+        return parents
+
+    def __relax(self, parents: dict):
+        """
+        This private method finds the bound of every mutated overhang,
+        starting from the empty overhang and from the overhangs that
+        were not mutated, whose bound is estimated.
+        """
+        queue = [(0, ("", ""))] + [
+            (self.estimate(*overhang), overhang)
+            for overhang in parents
+            if overhang not in self.mutated
+            and self.estimate(*overhang) is not None
+        ]
+        while queue:
+            bound, overhang = heapq.heappop(queue)
+            if overhang in self.bounds:
+                continue
+            self.bounds[overhang] = max(bound, self.estimate(*overhang) or 0)
+            for parent, length in parents.get(overhang, []):
+                if parent not in self.bounds:
+                    heapq.heappush(queue, (bound + length, parent))
+
+    def get(self, a: str, b: str) -> int:
+        """
+        Bound getter.
+
+        This function returns the least amount of characters the
+        longest gene of a chromosome needs before its overhang is
+        resolved, or None if it can not be resolved.
+
+        @param a: The overhang of gene 'a', if any.
+        @param b: The overhang of gene 'b', if any.
+        """
+        if (a, b) in self.bounds:
+            return self.bounds[a, b]
+        if (a, b) in self.mutated:
+            return None
+        return self.estimate(a, b)
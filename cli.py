@@ -0,0 +1,129 @@
+"""
+This is the command line interface shared by edith.py, edith2.py and edith3.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+Engines are only imported once they are chosen, so Pandas,
+NumPy and begins are only loaded by the 'edith' engines, and
+a pool of processes is only loaded if there are workers.
+By default, every case is solved by the bidirectional search
+of edith2.py, which is the fastest engine on the benchmark corpus.
+A search mode without an engine is a search mode of edith2.py:
+>>> python3 cli.py sample-01.in --search a-star
+
+You can execute this script by running this:
+>>> cat sample-01.in | python3 cli.py --engine edith3
+
+The input can also be read from a file through mmap:
+>>> python3 cli.py sample-01.in --engine edith --search best-first
+
+Cases can be solved by a pool of processes:
+>>> cat sample-01.in | python3 cli.py --workers 4
+
+You can measure the startup time of every engine by running this:
+>>> python3 benchmark_startup.py
+"""
+
+import sys
+import argparse
+import functools
+
+import reader
+import engines
+import solutions
+
+DEFAULT = "edith2-bidirectional"
+
+
+def get_solver(engine: str=None, search: str=None) -> engines.Engine:
+    """
+    This function returns the engine that solves every case.
+
+    @param engine: One of engines.ENGINES. By default, it is DEFAULT,
+                   or 'edith2' if there is a search mode.
+    @param search: The search mode, if the engine has one.
+    """
+    if engine is None:
+        engine = DEFAULT if search is None else "edith2"
+    if search not in (None, "generations"):
+        engine = "{}-{}".format(engine, search)
+    if engine not in engines.ENGINES:
+        raise ValueError("Invalid engine:", engine)
+    return engines.ENGINES[engine]
+
+
+def main(argv: list=None):
+    """
+    This function solves every case of the input
+    and prints the survivors to STDOUT.
+
+    @param argv: The command line arguments.
+                 By default, they are taken from sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Solving every case of the input.")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="Input file, read through mmap instead of stdin.")
+    parser.add_argument("--engine", "-e", choices=sorted(engines.ENGINES),
+                        default=None,
+                        help="Engine solving the cases. (default: edith2-bidirectional, "
+                             "or edith2 if there is a search mode)")
+    parser.add_argument("--search", "-s", default=None,
+                        help="Search mode of edith and edith2: 'generations', "
+                             "'best-first' or 'bidirectional', or "
+                             "'iterative-deepening' or 'a-star' for edith2. "
+                             "(default: bidirectional without an engine, "
+                             "generations otherwise)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Amount of processes solving cases. (default: 1)")
+    parser.add_argument("--cache", "-c", type=int, default=1024,
+                        help="Amount of survivors cached in memory, "
+                             "0 disables the cache. (default: 1024)")
+    parser.add_argument("--results", "-r", default=None,
+                        help="SQLite file where survivors are cached between runs.")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        raise ValueError("Invalid amount of workers:", args.workers)
+
+    # The following piece of code reads the whole input
+    # in a single pass and splits it by case length.
+    cases = reader.read_cases(args.path or sys.stdin, use_mmap=bool(args.path))
+
+    # Cases that were already solved are taken from the cache.
+    engine = get_solver(args.engine, args.search)
+    case_solver = engine.solve
+    if args.cache or args.results:
+        case_solver = functools.partial(solutions.solve,
+                                        solver=case_solver,
+                                        size=args.cache,
+                                        path=args.results,
+                                        namespace=engine.namespace)
+
+    # Cases are independent, so they can be solved by a pool
+    # of processes. Survivors are still returned in input order.
+    pool = None
+    if args.workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(args.workers)
+    try:
+        if pool:
+            survivors = pool.imap(case_solver, cases, reader.CHUNKSIZE)
+        else:
+            survivors = map(case_solver, cases)
+
+        # Printing results to STDOUT as soon as
+        # every previous case has been solved.
+        for case_number, survivor in enumerate(survivors):
+            sys.stdout.write("Case {}: {}\n".format(case_number + 1, survivor))
+            if pool:
+                sys.stdout.flush()
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+
+if __name__ == "__main__":
+    main()
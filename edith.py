@@ -35,6 +35,30 @@ optional arguments:
                         (default: False)
   --no-debug
   --ages AGES, -a AGES  Amount of iterations. (default: 10)
+  --mutation MUTATION, -m MUTATION
+                        Mutation mode: 'cross' or 'prefix'. (default: cross)
+  --fitness FITNESS, -f FITNESS
+                        Fitness mode: 'rowwise' or 'vectorized'. (default:
+                        rowwise)
+  --search SEARCH, -s SEARCH
+                        Search mode: 'generations', 'best-first' or
+                        'bidirectional'. (default: generations)
+  --layout LAYOUT, -l LAYOUT
+                        Layout mode: 'frame' or 'columnar'. (default: frame)
+  --path PATH, -p PATH  Input file, read through mmap instead of stdin.
+                        (default: None)
+  --workers WORKERS, -w WORKERS
+                        Amount of processes solving cases. (default: 1)
+  --cache CACHE, -c CACHE
+                        Amount of survivors cached in memory, 0 disables the
+                        cache. (default: 1024)
+  --results RESULTS, -r RESULTS
+                        SQLite file where survivors are cached between runs.
+                        (default: None)
+  --trace TRACE, -t TRACE
+                        File where the metrics of every generation are
+                        written, as CSV or as JSON lines if it ends with
+                        '.jsonl'. (default: None)
 
 You can run unit tests by executing the following command:
 >>> python -m unittest test_edith.py
@@ -47,12 +71,22 @@ You can check it by running the following instruction:
 
 import os
 import sys
+import time
+import heapq
+import bisect
 import logging
+import functools
+import multiprocessing
 
 import numpy as np
 import pandas as pd
 
 import begin
+import reader
+import metrics
+import proofs
+import solutions
+import transpositions
 
 from io import StringIO
 
@@ -90,8 +124,93 @@ class Genes(object):
                                  names=[self.A, self.B])
         self.genes = self.genes.reindex(columns=[self.A, self.B])
         # self.genes = self.genes[self.genes[self.A] != self.genes[self.B]]
+        self.__index = {}
         logger.debug(self.genes)
 
+    def get_positions(self, **kwargs) -> np.ndarray:
+        """
+        Positions getter.
+
+        This function returns the positions of the genes matching
+        all the given filters, in the same order as in the genetic code.
+        Without filters, the positions of all the genes are returned.
+
+        Filters are answered with a binary search over the genes
+        sorted alphabetically or by length, which are indexed only once.
+        Only the positions matching the first filter are intersected
+        with the other filters.
+
+        @param a_startswith: Genes whose 'a' starts with this string.
+        @param b_startswith: Genes whose 'b' starts with this string.
+        @param a_prefix_of: Genes whose 'a' is a prefix of this string.
+        @param b_prefix_of: Genes whose 'b' is a prefix of this string.
+        @param a_max_length: Genes whose 'a' is not longer than this.
+        @param b_max_length: Genes whose 'b' is not longer than this.
+        @param a_overhang: Genes that can fuse with this overhang of 'a',
+                           which means their 'b' starts with it
+                           or their 'b' is a prefix of it.
+        @param b_overhang: Genes that can fuse with this overhang of 'b'.
+        """
+        if not kwargs:
+            return np.arange(self.size, dtype=np.int64)
+        filters = iter(kwargs.items())
+        positions = self.__filter(*next(filters))
+        for name, value in filters:
+            positions &= self.__filter(name, value)
+        return np.array(sorted(positions), dtype=np.int64)
+
+    def __filter(self, name: str, value) -> set:
+        """
+        This private method returns the positions matching a filter.
+        """
+        if name == "a_overhang":
+            return self.__filter("b_startswith", value) | \
+                self.__filter("b_prefix_of", value)
+        if name == "b_overhang":
+            return self.__filter("a_startswith", value) | \
+                self.__filter("a_prefix_of", value)
+        if name not in ("a_startswith", "b_startswith",
+                        "a_prefix_of", "b_prefix_of",
+                        "a_max_length", "b_max_length"):
+            raise ValueError("Invalid filter:", name)
+        column = getattr(self, name[0].upper())
+        keys, order, lengths, length_order = self.__get_index(column)
+        if name.endswith("_max_length"):
+            return set(length_order[:bisect.bisect_right(lengths, value)])
+        if name.endswith("_startswith"):
+            start = bisect.bisect_left(keys, value)
+            stop = start
+            while stop < len(keys) and keys[stop].startswith(value):
+                stop += 1
+            return set(order[start:stop])
+        positions = set()
+        for end in range(len(value) + 1):
+            start = bisect.bisect_left(keys, value[:end])
+            stop = bisect.bisect_right(keys, value[:end])
+            positions.update(order[start:stop])
+        return positions
+
+    def __get_index(self, column: str) -> tuple:
+        """
+        This private method returns the index of a column.
+
+        The index contains the genes sorted alphabetically and
+        their positions in the genetic code, and the lengths of the
+        genes sorted and their positions in the genetic code.
+        It is built the first time it is required.
+        """
+        if column not in self.__index:
+            genes = list(self.genes[column])
+            order = sorted(range(len(genes)), key=genes.__getitem__)
+            length_order = sorted(range(len(genes)), key=lambda i: len(genes[i]))
+            self.__index[column] = (
+                [genes[position] for position in order],
+                order,
+                [len(genes[position]) for position in length_order],
+                length_order,
+            )
+        return self.__index[column]
+
     def get_genes(self, **kwargs) -> pd.DataFrame:
         """
         Genes getter.
@@ -99,11 +218,46 @@ class Genes(object):
         This function returns the Pandas DataFrame
         containing the genetic pairs.
 
-        The purpose of this method is to provide
-        custom mutations in the future. For example,
-        by getting only genes that start with "s".
+        Genes can be filtered using the same filters
+        as in get_positions. For example, by getting
+        only genes whose 'a' starts with "s".
+        """
+        if not kwargs:
+            return self.genes
+        return self.genes.iloc[self.get_positions(**kwargs)]
+
+    @classmethod
+    def from_pairs(cls, pairs: list) -> "Genes":
+        """
+        Constructing the genetic code from a list of (a, b) pairs,
+        such as the cases returned by reader.read_cases,
+        without parsing any string.
+
+        @param pairs: A list of (a, b) pairs of strings.
+        """
+        logger.debug("Constructing genetic code from pairs.")
+        if not pairs:
+            raise ValueError("Genetic code must not be empty.")
+        genes = cls.__new__(cls)
+        genes.genes = pd.DataFrame([list(pair) for pair in pairs],
+                                   columns=[cls.A, cls.B],
+                                   dtype=object)
+        genes.__index = {}
+        logger.debug(genes.genes)
+        return genes
+
+    def reverse(self) -> "Genes":
+        """
+        Reversed genetic code getter.
+
+        This function returns a new genetic code where
+        both genes of every pair are reversed, so survivors
+        can be built starting from their last character.
         """
-        return self.genes
+        return Genes.from_pairs([
+            (a[::-1], b[::-1])
+            for a, b in zip(self.genes[self.A], self.genes[self.B])
+        ])
 
     @property
     def size(self) -> int:
@@ -119,6 +273,313 @@ class Genes(object):
         return "<Genes: {}>".format(self.size)
 
 
+class Survivors(object):
+    """
+    This class keeps track of the winner chromosomes.
+
+    Survivors are arranged by string length and then in
+    alphabetical order, so only the first of them has to be
+    kept and it can be retrieved without sorting anything.
+    """
+
+    def __init__(self, reverse: bool=False):
+        """
+        Survivors constructor.
+
+        @param reverse: Use this flag if survivors are built from
+                        a reversed genetic code, so the alphabetical
+                        order is checked reading them backwards.
+        """
+        self.best = None
+        self.count = 0
+        self.reverse = reverse
+
+    def __str__(self):
+        """ To String method. """
+        return "<Survivors: {}>".format(self.count)
+
+    def __len__(self) -> int:
+        """ Amount of winner chromosomes found so far. """
+        return self.count
+
+    @property
+    def empty(self) -> bool:
+        """ Property to detect if there are no survivors. """
+        return self.best is None
+
+    @property
+    def shortest(self) -> int:
+        """ Property to access the length of the best survivor. """
+        return len(self.best) if self.best is not None else None
+
+    def add(self, chromosome: str):
+        """
+        This method adds a winner chromosome.
+
+        @param chromosome: The string built by the winner chromosome.
+        """
+        self.count += 1
+        if self.best is None or self.__get_key(chromosome) < self.__get_key(self.best):
+            self.best = chromosome
+
+    def __get_key(self, chromosome: str) -> tuple:
+        """
+        This private method returns the sorting key of a survivor.
+        """
+        if self.reverse:
+            return len(chromosome), chromosome[::-1]
+        return len(chromosome), chromosome
+
+
+class Strings(object):
+    """
+    This class represents a column of strings stored Arrow-style.
+
+    The characters of all the strings are kept in one contiguous
+    buffer of code units, and the string at position 'i' spans
+    from offsets[i] to offsets[i + 1]. Strings are filtered,
+    sliced and concatenated by moving code units between buffers
+    with numpy, so no Python object is created per string.
+
+    Code units are bytes unless some character does not fit in one,
+    in which case every character takes 4 bytes.
+
+    @constant ENCODINGS: The text encoding of each type of code unit.
+    """
+
+    ENCODINGS = {
+        np.dtype(np.uint8): "latin-1",
+        np.dtype(np.uint32): "utf-32-le",
+    }
+
+    def __init__(self, buffer: np.ndarray=None, offsets: np.ndarray=None):
+        """
+        Strings constructor.
+
+        @param buffer: The code units of all the strings.
+        @param offsets: The position where every string starts
+                        in the buffer, plus the length of the buffer.
+        """
+        if buffer is None or buffer.dtype not in self.ENCODINGS:
+            raise ValueError("Invalid buffer:", buffer)
+        if offsets is None or not len(offsets) or offsets[-1] != len(buffer):
+            raise ValueError("Invalid offsets:", offsets)
+        self.buffer = buffer
+        self.offsets = offsets
+
+    def __str__(self):
+        """ To String method. """
+        return "<Strings: {}>".format(len(self))
+
+    def __len__(self) -> int:
+        """ Amount of strings in the column. """
+        return len(self.offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        """
+        This method decodes the string at a position.
+
+        @param position: The position of the string in the column.
+        """
+        start, stop = self.offsets[position], self.offsets[position + 1]
+        return self.buffer[start:stop].tobytes().decode(self.encoding)
+
+    def __add__(self, other: "Strings") -> "Strings":
+        """
+        This method concatenates 2 columns string by string.
+
+        @param other: A column with the same amount of strings.
+        """
+        if len(other) != len(self) or other.buffer.dtype != self.buffer.dtype:
+            raise ValueError("Invalid strings:", other)
+        starts = np.empty(2 * len(self), dtype=np.int64)
+        starts[0::2] = self.offsets[:-1]
+        starts[1::2] = other.offsets[:-1] + len(self.buffer)
+        lengths = np.empty(2 * len(self), dtype=np.int64)
+        lengths[0::2] = self.lengths
+        lengths[1::2] = other.lengths
+        strings = self.gather(np.concatenate([self.buffer, other.buffer]),
+                              starts, lengths)
+        return Strings(strings.buffer, strings.offsets[0::2])
+
+    @property
+    def encoding(self) -> str:
+        """ Property to access the text encoding of the buffer. """
+        return self.ENCODINGS[self.buffer.dtype]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """ Property to access the length of every string. """
+        return np.diff(self.offsets)
+
+    @classmethod
+    def get_dtype(cls, strings: list) -> np.dtype:
+        """
+        This function returns the smallest type of code unit
+        that can hold every character of the given strings.
+
+        @param strings: A list of strings.
+        """
+        if all(ord(max(string or "\0")) < 256 for string in strings):
+            return np.dtype(np.uint8)
+        return np.dtype(np.uint32)
+
+    @classmethod
+    def encode(cls, strings: list, dtype: np.dtype=np.uint8) -> "Strings":
+        """
+        This function stores a list of strings as a column.
+
+        @param strings: A list of strings.
+        @param dtype: The type of code unit, as returned by get_dtype.
+        """
+        strings = list(strings)
+        dtype = np.dtype(dtype)
+        data = "".join(strings).encode(cls.ENCODINGS[dtype])
+        offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in strings], out=offsets[1:])
+        if not data:
+            return cls(np.zeros(0, dtype=dtype), offsets)
+        return cls(np.frombuffer(data, dtype=dtype), offsets)
+
+    @classmethod
+    def gather(cls, buffer: np.ndarray, starts: np.ndarray,
+               lengths: np.ndarray) -> "Strings":
+        """
+        This function copies substrings of a buffer into a new column.
+
+        @param buffer: The code units the substrings are taken from.
+        @param starts: The position where every substring starts.
+        @param lengths: The length of every substring.
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(np.asarray(starts, dtype=np.int64) - offsets[:-1],
+                              lengths)
+        positions += np.arange(offsets[-1], dtype=np.int64)
+        return cls(buffer[positions], offsets)
+
+    def decode(self) -> np.ndarray:
+        """
+        This method returns the strings of the column as Python objects.
+        """
+        text = self.buffer.tobytes().decode(self.encoding)
+        return np.array([
+            text[start:stop]
+            for start, stop in zip(self.offsets[:-1], self.offsets[1:])
+        ], dtype=object)
+
+    def take(self, positions: np.ndarray) -> "Strings":
+        """
+        This method returns the strings at the given positions.
+
+        @param positions: An array of positions or a boolean mask.
+        """
+        positions = np.asarray(positions)
+        if positions.dtype == bool:
+            positions = np.flatnonzero(positions)
+        return self.gather(self.buffer, self.offsets[:-1][positions],
+                           self.lengths[positions])
+
+    def slice(self, start: np.ndarray, stop: np.ndarray) -> "Strings":
+        """
+        This method returns a substring of every string.
+
+        @param start: The position where every substring starts.
+        @param stop: The position where every substring stops.
+        """
+        return self.gather(self.buffer, self.offsets[:-1] + start, stop - start)
+
+    def mismatch(self, other: "Strings") -> np.ndarray:
+        """
+        This method detects the strings that differ from the strings
+        of another column in the characters both of them have.
+
+        For example, 'asdf' and 'as' match, but 'asdf' and 'ax' do not.
+
+        @param other: A column with the same amount of strings.
+        """
+        shared = np.minimum(self.lengths, other.lengths)
+        strings = self.gather(self.buffer, self.offsets[:-1], shared)
+        others = self.gather(other.buffer, other.offsets[:-1], shared)
+        rows = np.repeat(np.arange(len(self)), shared)
+        rows = rows[strings.buffer != others.buffer]
+        return np.bincount(rows, minlength=len(self)) > 0
+
+    def to_matrix(self) -> np.ndarray:
+        """
+        This method returns the strings as a matrix of code units,
+        padded with zeros up to the length of the longest string.
+        """
+        lengths = self.lengths
+        width = lengths.max() if len(self) else 0
+        matrix = np.zeros((len(self), width), dtype=self.buffer.dtype)
+        rows = np.repeat(np.arange(len(self)), lengths)
+        columns = np.arange(len(self.buffer)) - \
+            np.repeat(self.offsets[:-1], lengths)
+        matrix[rows, columns] = self.buffer
+        return matrix
+
+
+class Chromosomes(object):
+    """
+    This class represents a population of chromosomes in columnar form.
+
+    Every column is either a Strings column or a numpy array.
+    Columns can be read like the columns of a DataFrame,
+    but the population is filtered by taking the same
+    positions from every column.
+    """
+
+    def __init__(self, columns: dict=None):
+        """
+        Chromosomes constructor.
+
+        @param columns: A dictionary of columns with the same length.
+        """
+        if not columns or len({len(column) for column in columns.values()}) != 1:
+            raise ValueError("Invalid columns:", columns)
+        self.columns = columns
+
+    def __str__(self):
+        """ To String method. """
+        return "<Chromosomes: {}>".format(len(self))
+
+    def __len__(self) -> int:
+        """ Amount of chromosomes. """
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, column: str) -> pd.Series:
+        """
+        This method returns a column as a Pandas Series.
+
+        @param column: The name of the column.
+        """
+        values = self.columns[column]
+        if isinstance(values, Strings):
+            return pd.Series(values.decode(), dtype=object)
+        return pd.Series(values)
+
+    @property
+    def empty(self) -> bool:
+        """ Property to detect if there are no chromosomes. """
+        return not len(self)
+
+    def take(self, positions: np.ndarray) -> "Chromosomes":
+        """
+        This method returns the chromosomes at the given positions.
+
+        @param positions: An array of positions or a boolean mask.
+        """
+        positions = np.asarray(positions)
+        if positions.dtype == bool:
+            positions = np.flatnonzero(positions)
+        return Chromosomes({
+            name: column.take(positions)
+            for name, column in self.columns.items()
+        })
+
+
 class Population(object):
     """
     This class represents the active survivors playing the game.
@@ -129,32 +590,94 @@ class Population(object):
     You can keep mutating the population endlessly until
     there are no more possible combinations.
 
+    Chromosomes only keep the unresolved overhang of genes 'A' and 'B'.
+    After fitting, at least one of them is empty. The part of the
+    solution that is already resolved is kept in the history as
+    a back-reference to the parent chromosome plus the characters
+    resolved by the last mutation, and it is only rebuilt for
+    survivors and for breaking ties between chromosomes.
+    Chromosomes with the same overhang are merged, keeping the
+    shortest and then alphabetically smallest resolved prefix.
+    Chromosomes that can only lead to survivors longer than
+    the best survivor found so far are removed.
+
     @constant A_DOMINANCE: It represents gene A being stronger than gene B.
     @constant B_DOMINANCE: It represents gene B being stronger than gene A.
 
+    @constant LENGTH: The length of the resolved prefix of a chromosome.
+    @constant PARENT: The position of the chromosome in the history.
+    @constant STEP: The characters resolved by the last mutation.
+
     @constant UNFIT: It is used to mark chromosomes as unfit.
     @constant FIT: It is used to detect winner chromosomes.
 
     @constant TMP_SUFFIX: It is a temporal constant used to merge datasets.
     @constant TMP_INDEX: It is a temporal constant used to merge datasets.
+
+    @constant CROSS_JOIN: Mutate by combining every chromosome with every gene.
+    @constant PREFIX_JOIN: Mutate by combining every chromosome only with
+                           the genes that agree with its overhang.
+
+    @constant ROWWISE_FITNESS: Evaluate fitness row by row.
+    @constant VECTORIZED_FITNESS: Evaluate fitness over the whole population.
+
+    @constant FRAME_LAYOUT: Keep chromosomes in a Pandas DataFrame.
+    @constant COLUMNAR_LAYOUT: Keep chromosomes as Chromosomes, where
+                                overhangs are stored in contiguous buffers.
+
+    Hooks are called with an event after every generation is
+    fitted. See metrics.py for the fields of the events.
+    In COLUMNAR_LAYOUT, the dominance is evaluated while removing
+    unfit chromosomes, so it is timed as part of the filter.
     """
 
     A_DOMINANCE = "A Dominance"
     B_DOMINANCE = "B Dominance"
 
+    LENGTH = "Length"
+    PARENT = "Parent"
+    STEP = "Step"
+
     UNFIT = "_unfit"
     FIT = "_fit"
 
     TMP_SUFFIX = "_new"
     TMP_INDEX = "_tmp_idx"
 
-    def __init__(self, genes: Genes=None):
+    CROSS_JOIN = "cross"
+    PREFIX_JOIN = "prefix"
+
+    ROWWISE_FITNESS = "rowwise"
+    VECTORIZED_FITNESS = "vectorized"
+
+    FRAME_LAYOUT = "frame"
+    COLUMNAR_LAYOUT = "columnar"
+
+    def __init__(self, genes: Genes=None, mutation: str=CROSS_JOIN,
+                 fitness: str=ROWWISE_FITNESS, reverse: bool=False,
+                 layout: str=FRAME_LAYOUT, hooks: list=None,
+                 max_overhangs: int=transpositions.Transpositions.MAX_SIZE):
         """
         Population constructor.
 
         @param genes: A Genes instance is required.
                       Mutations will take genes from this
                       instance and generate variations.
+        @param mutation: Either CROSS_JOIN or PREFIX_JOIN.
+                         Both of them produce the same survivors,
+                         but PREFIX_JOIN never creates the rows
+                         that would be removed as unfit.
+        @param fitness: Either ROWWISE_FITNESS or VECTORIZED_FITNESS.
+                        Both of them produce the same dominance.
+        @param reverse: Use this flag if the genetic code is reversed.
+        @param layout: Either FRAME_LAYOUT or COLUMNAR_LAYOUT.
+                       Both of them produce the same survivors.
+                       COLUMNAR_LAYOUT always evaluates fitness
+                       and mutates over the buffers.
+        @param hooks: Functions called with an event after
+                      every generation is fitted.
+        @param max_overhangs: The amount of overhangs kept in the
+                              transposition table. 0 disables it.
 
         NOTE: The initial set of chromosomes will only contain
               pairs of genes whose first character match in order
@@ -165,11 +688,50 @@ class Population(object):
             raise ValueError("Invalid genes:", genes)
         if not genes.size:
             raise RuntimeError("Empty genetic code.")
+        if mutation not in (self.CROSS_JOIN, self.PREFIX_JOIN):
+            raise ValueError("Invalid mutation:", mutation)
+        if fitness not in (self.ROWWISE_FITNESS, self.VECTORIZED_FITNESS):
+            raise ValueError("Invalid fitness:", fitness)
+        if layout not in (self.FRAME_LAYOUT, self.COLUMNAR_LAYOUT):
+            raise ValueError("Invalid layout:", layout)
+        if not isinstance(max_overhangs, int) or max_overhangs < 0:
+            raise ValueError("Invalid amount of overhangs:", max_overhangs)
         self.genes = genes
+        self.mutation = mutation
+        self.fitness = fitness
+        self.layout = layout
+        self.reverse = reverse
+        self.hooks = list(hooks or [])
+        self.generation = 0
+        self.max_overhangs = max_overhangs
+        self.transpositions = None
+        if max_overhangs:
+            self.transpositions = transpositions.Transpositions(max_overhangs)
         genes = self.genes.get_genes()
-        self.survivors = pd.DataFrame()
+        self.survivors = Survivors(reverse=reverse)
+        self.history = []
         condition = genes[self.genes.A].str[0] == genes[self.genes.B].str[0]
-        self.chromosomes = genes[condition][[self.genes.A, self.genes.B]]
+        if self.layout == self.COLUMNAR_LAYOUT:
+            dtype = Strings.get_dtype(list(genes[self.genes.A]) +
+                                      list(genes[self.genes.B]))
+            self.codes = {
+                column: Strings.encode(genes[column], dtype)
+                for column in (self.genes.A, self.genes.B)
+            }
+            positions = np.flatnonzero(np.asarray(condition, dtype=bool))
+            self.chromosomes = Chromosomes({
+                self.genes.A: self.codes[self.genes.A].take(positions),
+                self.genes.B: self.codes[self.genes.B].take(positions),
+                self.LENGTH: np.zeros(len(positions), dtype=np.int64),
+                self.PARENT: np.full(len(positions), -1, dtype=np.int64),
+            })
+        else:
+            self.chromosomes = genes[condition][[self.genes.A, self.genes.B]]
+            self.chromosomes = self.chromosomes.assign(**{
+                self.LENGTH: 0,
+                self.PARENT: -1,
+            })
+        self.event = metrics.new_event(0, reverse, self.size) if self.hooks else None
         self.fit()
 
     def __str__(self):
@@ -201,10 +763,16 @@ class Population(object):
         """
         if self.survivors.empty:
             return default
-        self.survivors[self.TMP_INDEX] = self.survivors[self.genes.A].str.len()
-        s = self.survivors.sort_values([self.TMP_INDEX, self.genes.A],
-                                       ascending=[True, True])
-        return s.iloc[0][self.genes.A]
+        return self.survivors.best
+
+    def survive(self, chromosome: str):
+        """
+        This method adds a winner chromosome to the survivors.
+
+        @param chromosome: A string that can be built
+                           both from genes 'A' and from genes 'B'.
+        """
+        self.survivors.add(chromosome)
 
     def fit(self):
         """
@@ -214,20 +782,90 @@ class Population(object):
         After that, unfit chromosomes will be removed.
         """
         logger.debug("Fitting population.")
-        self.__calculate_dominance()
-        self.__remove_unfit()
-        self.__remove_fit()
-        logger.debug(self.chromosomes)
+        if self.layout == self.COLUMNAR_LAYOUT:
+            self.__fit_columns()
+        else:
+            self.__measure("dominance", self.__calculate_dominance)
+            self.__measure("unfit", self.__remove_unfit)
+            self.__measure("resolve", self.__resolve)
+            self.__measure("fit", self.__remove_fit)
+            self.__measure("dominated", self.__remove_dominated)
+            self.__measure("duplicated", self.__merge)
+            self.__measure("duplicated", self.__remove_transposed)
+            self.__measure("record", self.__record)
+            logger.debug(self.chromosomes)
+        if self.hooks:
+            self.event["fitted"] = self.size
+            self.event["peak_memory_kb"] = metrics.get_peak_memory()
+            if self.transpositions is not None:
+                self.event["transposition_hits"] = self.transpositions.stats["hits"]
+                self.event["transposition_evictions"] = \
+                    self.transpositions.stats["evictions"]
+            for hook in self.hooks:
+                hook(self.event)
+            self.event = None
+
+    def __measure(self, phase: str, method):
+        """
+        This private method runs a phase of a generation.
+
+        If there are hooks, the time it takes and the amount
+        of chromosomes it removes are added to the event.
+        The dominance and the mutation are timed on their own,
+        every other phase is timed as part of the filter.
+        """
+        if not self.hooks:
+            method()
+            return
+        size = self.size
+        start = time.perf_counter()
+        method()
+        seconds = time.perf_counter() - start
+        if phase + "_seconds" in self.event:
+            self.event[phase + "_seconds"] += seconds
+        else:
+            self.event["filter_seconds"] += seconds
+        if phase in self.event:
+            self.event[phase] += size - self.size
 
     @property
     def shortest_survivor(self) -> int:
         """ Property to access the length of the shortest survivor. """
-        return self.survivors[self.genes.A].str.len().min()
+        if self.survivors.empty:
+            return np.nan
+        return self.survivors.shortest
 
     @property
     def shortest_chromosome(self) -> int:
         """ Property to access the length of the shortest chromosome. """
-        return self.chromosomes[self.genes.A].str.len().min()
+        if self.layout == self.COLUMNAR_LAYOUT:
+            if self.chromosomes.empty:
+                return np.nan
+            columns = self.chromosomes.columns
+            return (columns[self.LENGTH] + columns[self.genes.A].lengths).min()
+        a_length = self.chromosomes[self.genes.A].str.len()
+        return (self.chromosomes[self.LENGTH] + a_length).min()
+
+    def get_prefix(self, position: int, generation: int=None) -> str:
+        """
+        Prefix getter.
+
+        This function follows the back-references of a chromosome
+        and returns the part of the solution it has already resolved.
+
+        @param position: The position of the chromosome in the history.
+        @param generation: The generation of the chromosome.
+                           By default, the latest recorded generation.
+        """
+        if generation is None:
+            generation = len(self.history) - 1
+        steps = []
+        while position >= 0:
+            parents, genes = self.history[generation]
+            steps.append(genes[position])
+            position = parents[position]
+            generation -= 1
+        return "".join(reversed(steps))
 
     def __calculate_dominance(self):
         """
@@ -239,6 +877,22 @@ class Population(object):
 
         This can be later used to remove unfit chromosomes.
         """
+        if self.chromosomes.empty:
+            # NOTE: DataFrame.apply returns a DataFrame on empty input.
+            self.chromosomes = self.chromosomes.assign(**{
+                self.A_DOMINANCE: self.UNFIT,
+                self.B_DOMINANCE: self.UNFIT,
+            })
+            return
+        if self.fitness == self.VECTORIZED_FITNESS:
+            a_dominance, b_dominance = self.get_dominance(
+                self.chromosomes[self.genes.A],
+                self.chromosomes[self.genes.B])
+            self.chromosomes = self.chromosomes.assign(**{
+                self.A_DOMINANCE: a_dominance,
+                self.B_DOMINANCE: b_dominance,
+            })
+            return
         a_dominance = self.chromosomes[[self.genes.A,
                                         self.genes.B]].apply(self.get_fitness,
                                                              axis=1)
@@ -248,6 +902,55 @@ class Population(object):
                                                              axis=1)
         self.chromosomes[self.B_DOMINANCE] = b_dominance
 
+    @classmethod
+    def get_dominance(cls, a: pd.Series, b: pd.Series) -> tuple:
+        """
+        This function calculates the dominance of 'A' over 'B'
+        and the dominance of 'B' over 'A' for the whole population.
+
+        It returns the same values as calling get_fitness on
+        every row, but the strings are encoded as a matrix of
+        code points and compared with length-aligned masks,
+        so no Python code runs per row, except for slicing
+        the overhangs of the compatible chromosomes.
+
+        @param a: The 'A' genes of the population.
+        @param b: The 'B' genes of the population.
+        """
+        a = np.asarray(a, dtype=object)
+        b = np.asarray(b, dtype=object)
+        a_codes = np.array(a, dtype=str)
+        b_codes = np.array(b, dtype=str)
+        a_length = np.char.str_len(a_codes)
+        b_length = np.char.str_len(b_codes)
+
+        # Only the characters shared by both genes are compared.
+        a_codes = a_codes.view(np.uint32).reshape(len(a), -1)
+        b_codes = b_codes.view(np.uint32).reshape(len(b), -1)
+        width = min(a_codes.shape[1], b_codes.shape[1])
+        shared = np.minimum(a_length, b_length)
+        mismatch = a_codes[:, :width] != b_codes[:, :width]
+        mismatch &= np.arange(width) < shared[:, np.newaxis]
+        compatible = ~mismatch.any(axis=1)
+
+        # Building the dominance columns.
+        equal = compatible & (a_length == b_length)
+        a_longer = compatible & (a_length > b_length)
+        b_longer = compatible & (a_length < b_length)
+        a_dominance = np.full(len(a), cls.UNFIT, dtype=object)
+        b_dominance = np.full(len(b), cls.UNFIT, dtype=object)
+        a_dominance[equal] = cls.FIT
+        b_dominance[equal] = cls.FIT
+        a_dominance[a_longer] = [
+            gene[length:]
+            for gene, length in zip(a[a_longer], b_length[a_longer])
+        ]
+        b_dominance[b_longer] = [
+            gene[length:]
+            for gene, length in zip(b[b_longer], a_length[b_longer])
+        ]
+        return a_dominance, b_dominance
+
     @classmethod
     def get_fitness(cls, row: list) -> str:
         """
@@ -292,6 +995,33 @@ class Population(object):
                          condition.value_counts()[True])
         self.chromosomes = self.chromosomes[~condition]
 
+    def __resolve(self):
+        """
+        This private method moves the part of genes 'A' and 'B'
+        that both of them agree on into the resolved prefix.
+
+        For example, if 'A' is 'asdf' and 'B' is 'as', then 'as'
+        is resolved, 'A' becomes 'df' and 'B' becomes empty.
+        """
+        a = np.asarray(self.chromosomes[self.genes.A], dtype=object)
+        b = np.asarray(self.chromosomes[self.genes.B], dtype=object)
+        a_dominance = np.asarray(self.chromosomes[self.A_DOMINANCE],
+                                 dtype=object)
+        b_dominance = np.asarray(self.chromosomes[self.B_DOMINANCE],
+                                 dtype=object)
+        is_a_dominant = a_dominance != self.UNFIT
+        is_b_dominant = b_dominance != self.UNFIT
+        step = np.where(is_a_dominant, b, a)
+        a_overhang = is_a_dominant & (a_dominance != self.FIT)
+        b_overhang = is_b_dominant & (b_dominance != self.FIT)
+        length = np.array([len(s) for s in step], dtype=np.int64)
+        self.chromosomes = self.chromosomes.assign(**{
+            self.genes.A: np.where(a_overhang, a_dominance, ""),
+            self.genes.B: np.where(b_overhang, b_dominance, ""),
+            self.LENGTH: self.chromosomes[self.LENGTH] + length,
+            self.STEP: step,
+        })
+
     def __remove_fit(self):
         """
         This private method detects winners in the population.
@@ -308,10 +1038,115 @@ class Population(object):
         is_b_fit = self.chromosomes[self.B_DOMINANCE] == self.FIT
         condition = is_a_fit | is_b_fit
         local_survivors = self.chromosomes[condition]
-        local_survivors = local_survivors.reset_index()
-        self.survivors = pd.concat([self.survivors, local_survivors])
+
+        # Only the shortest local survivors can replace the best one,
+        # so prefixes are not rebuilt for the rest of them.
+        length = local_survivors[self.LENGTH]
+        local_survivors = local_survivors[length == length.min()]
+        for parent, step in zip(local_survivors[self.PARENT],
+                                local_survivors[self.STEP]):
+            self.survivors.add(self.get_prefix(parent) + step)
+        self.chromosomes = self.chromosomes[~condition]
+
+    def __remove_dominated(self):
+        """
+        This private method removes chromosomes that can not
+        lead to a survivor as good as the best survivor.
+
+        The resolved prefix plus the overhang is a prefix of every
+        survivor the chromosome can lead to, so chromosomes where
+        it is longer than the best survivor are removed.
+        """
+        if self.survivors.empty:
+            return
+        length = self.chromosomes[self.LENGTH] + \
+            self.chromosomes[self.genes.A].str.len() + \
+            self.chromosomes[self.genes.B].str.len()
+        condition = length > self.survivors.shortest
+        if condition.any():
+            logger.debug("Removing %s dominated chromosome(s).",
+                         condition.sum())
         self.chromosomes = self.chromosomes[~condition]
 
+    def __merge(self):
+        """
+        This private method merges chromosomes with the same overhang.
+
+        Chromosomes with the same overhang will mutate in the same way,
+        so only the one with the shortest and then alphabetically
+        smallest prefix can lead to the final survivor.
+
+        Prefixes are only rebuilt for chromosomes that have
+        the same overhang and the same prefix length.
+        """
+        key = [self.genes.A, self.genes.B]
+        length = self.chromosomes.groupby(key)[self.LENGTH].transform("min")
+        chromosomes = self.chromosomes[self.chromosomes[self.LENGTH] == length]
+        tied = chromosomes.duplicated(key, keep=False)
+        prefixes = np.full(len(chromosomes), "", dtype=object)
+        prefixes[tied.values] = [
+            self.get_prefix(parent) + step
+            for parent, step in zip(chromosomes[self.PARENT][tied],
+                                    chromosomes[self.STEP][tied])
+        ]
+        chromosomes = chromosomes.assign(**{self.TMP_INDEX: prefixes})
+        chromosomes = chromosomes.sort_values(key + [self.TMP_INDEX])
+        chromosomes = chromosomes.drop_duplicates(key)
+        if len(chromosomes) < len(self.chromosomes):
+            logger.debug("Merging %s chromosome(s).",
+                         len(self.chromosomes) - len(chromosomes))
+        self.chromosomes = chromosomes
+
+    def __remove_transposed(self):
+        """
+        This private method removes chromosomes whose overhang was
+        already seen with a shorter resolved prefix, in this or in a
+        previous generation. See transpositions.py.
+
+        Resolved prefixes are only kept in the history, so they are
+        not passed to the table, and chromosomes whose overhang was
+        seen with a prefix of the same length are never removed.
+        Those ties can happen across generations, such as a gene
+        resolving 3 characters and then 2 genes resolving 1 and 2.
+        """
+        if self.transpositions is None:
+            return
+        condition = np.fromiter((
+            self.transpositions.visit(a, b, length)
+            for a, b, length in zip(self.chromosomes[self.genes.A],
+                                    self.chromosomes[self.genes.B],
+                                    self.chromosomes[self.LENGTH])
+        ), dtype=bool, count=len(self.chromosomes))
+        if not condition.all():
+            logger.debug("Removing %s transposed chromosome(s).",
+                         (~condition).sum())
+            if self.layout == self.COLUMNAR_LAYOUT:
+                self.chromosomes = self.chromosomes.take(condition)
+            else:
+                self.chromosomes = self.chromosomes[condition]
+
+    def __record(self):
+        """
+        This private method appends the current generation to the history.
+
+        Each chromosome keeps its back-reference and the characters
+        resolved by the last mutation. After that, the chromosome
+        points to its own position in the history.
+        """
+        self.history.append((
+            np.asarray(self.chromosomes[self.PARENT], dtype=np.int64),
+            np.asarray(self.chromosomes[self.STEP], dtype=object),
+        ))
+        self.chromosomes = pd.DataFrame({
+            self.genes.A: np.asarray(self.chromosomes[self.genes.A],
+                                     dtype=object),
+            self.genes.B: np.asarray(self.chromosomes[self.genes.B],
+                                     dtype=object),
+            self.LENGTH: np.asarray(self.chromosomes[self.LENGTH],
+                                    dtype=np.int64),
+            self.PARENT: np.arange(len(self.chromosomes), dtype=np.int64),
+        }, columns=[self.genes.A, self.genes.B, self.LENGTH, self.PARENT])
+
     def mutate(self):
         """
         Genetic Mutation method.
@@ -322,6 +1157,23 @@ class Population(object):
         in order to create more chromosomes from both.
         """
         logger.debug("Mutating population.")
+        self.generation += 1
+        if self.hooks:
+            self.event = metrics.new_event(self.generation, self.reverse, self.size)
+        if self.layout == self.COLUMNAR_LAYOUT:
+            self.__measure("mutate", self.__join_columns)
+        elif self.mutation == self.PREFIX_JOIN:
+            self.__measure("mutate", self.__prefix_join)
+        else:
+            self.__measure("mutate", self.__cross_join)
+        if self.hooks:
+            self.event["mutated"] = self.size
+        logger.debug(self.chromosomes)
+
+    def __cross_join(self):
+        """
+        This private method combines every chromosome with every gene.
+        """
 
         # The following code is requied to merge 2 DataFrames.
         query = {
@@ -349,9 +1201,219 @@ class Population(object):
 
         # Chromosomes in this population will be replaced
         # with the new generation of chromosomes.
-        self.chromosomes = new_generation[[self.genes.A, self.genes.B]]
+        self.chromosomes = new_generation[[self.genes.A,
+                                           self.genes.B,
+                                           self.LENGTH,
+                                           self.PARENT]]
+
+    def __prefix_join(self):
+        """
+        This private method combines every chromosome only with
+        the genes that agree with its overhang.
+
+        If 'A' is dominant, the overhang must fuse with gene 'B'.
+        If 'B' is dominant, the overhang must fuse with gene 'A'.
+        The candidates are taken from the prefix index of the genes,
+        and they are computed once per distinct overhang.
+        """
+        a = np.asarray(self.chromosomes[self.genes.A], dtype=object)
+        b = np.asarray(self.chromosomes[self.genes.B], dtype=object)
+        candidates = {}
+        positions = []
+        for a_overhang, b_overhang in zip(a, b):
+            if a_overhang:
+                key = "a_overhang", a_overhang
+            else:
+                key = "b_overhang", b_overhang
+            if key not in candidates:
+                candidates[key] = self.genes.get_positions(**{key[0]: key[1]})
+            positions.append(candidates[key])
+
+        # Each chromosome is repeated once per compatible gene.
+        counts = [len(position) for position in positions]
+        previous = np.repeat(np.arange(len(positions)), counts)
+        new = np.concatenate(positions) if positions else previous
+        genes = self.genes.get_genes()
+        new_generation = {
+            column: (np.asarray(self.chromosomes[column], dtype=object)[previous] +
+                     np.asarray(genes[column], dtype=object)[new])
+            for column in (self.genes.A, self.genes.B)
+        }
+        for column in (self.LENGTH, self.PARENT):
+            new_generation[column] = np.asarray(self.chromosomes[column],
+                                                dtype=np.int64)[previous]
+        self.chromosomes = pd.DataFrame(new_generation,
+                                        columns=[self.genes.A,
+                                                 self.genes.B,
+                                                 self.LENGTH,
+                                                 self.PARENT])
+
+    def __fit_columns(self):
+        """
+        This private method fits a population in COLUMNAR_LAYOUT.
+
+        It follows the same steps as the rest of the fitness methods,
+        but chromosomes are filtered by taking positions from the
+        buffers and dominance is evaluated on their code units.
+        """
+        self.__measure("unfit", self.__resolve_columns)
+        self.__measure("fit", self.__remove_fit_columns)
+        self.__measure("dominated", self.__remove_dominated_columns)
+        self.__measure("duplicated", self.__merge_columns)
+        self.__measure("duplicated", self.__remove_transposed)
+        self.__measure("record", self.__record_columns)
         logger.debug(self.chromosomes)
 
+    def __resolve_columns(self):
+        """
+        This private method removes unfit chromosomes and moves
+        the part of genes 'A' and 'B' that both of them agree
+        on into the resolved prefix.
+        """
+        columns = self.chromosomes.columns
+        condition = columns[self.genes.A].mismatch(columns[self.genes.B])
+        if condition.any():
+            logger.debug("Removing %s unfit chromosome(s).", condition.sum())
+            columns = self.chromosomes.take(~condition).columns
+        a, b = columns[self.genes.A], columns[self.genes.B]
+        shared = np.minimum(a.lengths, b.lengths)
+        self.chromosomes = Chromosomes({
+            self.genes.A: a.slice(shared, a.lengths),
+            self.genes.B: b.slice(shared, b.lengths),
+            self.LENGTH: columns[self.LENGTH] + shared,
+            self.PARENT: columns[self.PARENT],
+            self.STEP: a.slice(np.zeros(len(a), dtype=np.int64), shared),
+        })
+
+    def __remove_fit_columns(self):
+        """
+        This private method detects winners in COLUMNAR_LAYOUT.
+
+        Winners are the chromosomes without overhangs.
+        """
+        columns = self.chromosomes.columns
+        condition = (columns[self.genes.A].lengths == 0) & \
+            (columns[self.genes.B].lengths == 0)
+        if not condition.any():
+            return
+        length = columns[self.LENGTH]
+        winners = condition & (length == length[condition].min())
+        for position in np.flatnonzero(winners):
+            self.survivors.add(self.get_prefix(columns[self.PARENT][position]) +
+                               columns[self.STEP][position])
+        self.chromosomes = self.chromosomes.take(~condition)
+
+    def __remove_dominated_columns(self):
+        """
+        This private method removes chromosomes that can not lead
+        to a survivor as good as the best one in COLUMNAR_LAYOUT.
+        """
+        if self.survivors.empty:
+            return
+        columns = self.chromosomes.columns
+        length = columns[self.LENGTH] + \
+            columns[self.genes.A].lengths + \
+            columns[self.genes.B].lengths
+        condition = length > self.survivors.shortest
+        if condition.any():
+            logger.debug("Removing %s dominated chromosome(s).",
+                         condition.sum())
+            self.chromosomes = self.chromosomes.take(~condition)
+
+    def __merge_columns(self):
+        """
+        This private method merges chromosomes with the same
+        overhang in COLUMNAR_LAYOUT.
+
+        Chromosomes are sorted using their overhangs as a matrix
+        of code units, so chromosomes with the same overhang end
+        up next to each other. Prefixes are only rebuilt for
+        chromosomes that have the same overhang and the same
+        prefix length.
+        """
+        if self.chromosomes.empty:
+            return
+        columns = self.chromosomes.columns
+        side = columns[self.genes.A].lengths > 0
+        overhangs = columns[self.genes.A] + columns[self.genes.B]
+        matrix = overhangs.to_matrix()
+        lengths = overhangs.lengths
+        order = np.lexsort([columns[self.LENGTH]] +
+                           [matrix[:, i] for i in reversed(range(matrix.shape[1]))] +
+                           [lengths, side])
+        matrix, lengths, side = matrix[order], lengths[order], side[order]
+        length = columns[self.LENGTH][order]
+
+        # The first chromosome of every group has the shortest prefix.
+        changed = np.ones(len(order), dtype=bool)
+        changed[1:] = (side[1:] != side[:-1]) | (lengths[1:] != lengths[:-1])
+        if matrix.shape[1]:
+            changed[1:] |= (matrix[1:] != matrix[:-1]).any(axis=1)
+        groups = np.cumsum(changed) - 1
+        starts = np.flatnonzero(changed)
+        tied = length == length[starts][groups]
+        counts = np.bincount(groups[tied], minlength=len(starts))
+        best = {}
+        for position in np.flatnonzero(tied & (counts[groups] > 1)):
+            parent = columns[self.PARENT][order[position]]
+            prefix = self.get_prefix(parent) + columns[self.STEP][order[position]]
+            group = groups[position]
+            if group not in best or prefix < best[group][0]:
+                best[group] = prefix, position
+        for group, (_, position) in best.items():
+            starts[group] = position
+        if len(starts) < len(order):
+            logger.debug("Merging %s chromosome(s).", len(order) - len(starts))
+        self.chromosomes = self.chromosomes.take(order[starts])
+
+    def __record_columns(self):
+        """
+        This private method appends the current generation
+        to the history in COLUMNAR_LAYOUT.
+
+        The steps of the generation are kept as a Strings column.
+        """
+        columns = self.chromosomes.columns
+        self.history.append((columns[self.PARENT], columns[self.STEP]))
+        self.chromosomes = Chromosomes({
+            self.genes.A: columns[self.genes.A],
+            self.genes.B: columns[self.genes.B],
+            self.LENGTH: columns[self.LENGTH],
+            self.PARENT: np.arange(len(self.chromosomes), dtype=np.int64),
+        })
+
+    def __join_columns(self):
+        """
+        This private method mutates a population in COLUMNAR_LAYOUT.
+
+        With CROSS_JOIN, every chromosome is combined with every gene.
+        With PREFIX_JOIN, every chromosome is only combined with the
+        genes that agree with its overhang, as in the prefix join.
+        Genes are concatenated to the overhangs in the buffers.
+        """
+        columns = self.chromosomes.columns
+        if self.mutation == self.PREFIX_JOIN:
+            positions = []
+            for a_overhang, b_overhang in zip(columns[self.genes.A].decode(),
+                                              columns[self.genes.B].decode()):
+                if a_overhang:
+                    positions.append(self.genes.get_positions(a_overhang=a_overhang))
+                else:
+                    positions.append(self.genes.get_positions(b_overhang=b_overhang))
+            counts = [len(position) for position in positions]
+            previous = np.repeat(np.arange(len(positions)), counts)
+            new = np.concatenate(positions) if positions else previous
+        else:
+            previous = np.repeat(np.arange(len(self.chromosomes)), self.genes.size)
+            new = np.tile(np.arange(self.genes.size), len(self.chromosomes))
+        columns = self.chromosomes.take(previous).columns
+        self.chromosomes = Chromosomes({
+            self.genes.A: columns[self.genes.A] + self.codes[self.genes.A].take(new),
+            self.genes.B: columns[self.genes.B] + self.codes[self.genes.B].take(new),
+            self.LENGTH: columns[self.LENGTH],
+            self.PARENT: columns[self.PARENT],
+        })
+
 
 class Sequence(object):
     """
@@ -360,24 +1422,66 @@ class Sequence(object):
     are removed from the population and only the fittest survive.
 
     @constant IMPOSSIBLE: Used to mark sequences as unresolvable.
+
+    @constant GENERATIONS: Mutate the whole population once per age.
+    @constant BEST_FIRST: Always mutate the chromosome that can lead to
+                          the shortest and alphabetically smallest survivor.
+    @constant BIDIRECTIONAL: Mutate a population from the start and another
+                             one from the end, and join their overhangs.
+
+    @constant GENERATION: It is a temporal constant used to join populations.
     """
 
     IMPOSSIBLE = "IMPOSSIBLE"
 
-    def __init__(self, genes: Genes=None, ages: int=10):
+    GENERATIONS = "generations"
+    BEST_FIRST = "best-first"
+    BIDIRECTIONAL = "bidirectional"
+
+    GENERATION = "Generation"
+
+    def __init__(self, genes: Genes=None, ages: int=10,
+                 mutation: str=Population.CROSS_JOIN,
+                 fitness: str=Population.ROWWISE_FITNESS,
+                 search: str=GENERATIONS,
+                 layout: str=Population.FRAME_LAYOUT,
+                 hooks: list=None,
+                 max_overhangs: int=transpositions.Transpositions.MAX_SIZE):
         """
         Sequence Constructor.
 
         @param genes: A Genes instance containing the genetic code.
         @param ages: The amount of iterations in which the
                      population will mutate.
+        @param mutation: The mutation mode of the population.
+        @param fitness: The fitness mode of the population.
+        @param search: Either GENERATIONS, BEST_FIRST or BIDIRECTIONAL.
+                       All of them find the same survivor.
+        @param layout: The layout mode of the population.
+        @param hooks: Functions called with an event after every
+                      generation of the populations is fitted.
+                      The BEST_FIRST search only fits the initial one.
+        @param max_overhangs: The amount of overhangs kept in the
+                              transposition table of the populations
+                              in the GENERATIONS and BIDIRECTIONAL
+                              searches. 0 disables it.
         """
         if not isinstance(genes, Genes):
             raise ValueError("Invalid genes:", genes)
         if not isinstance(ages, int) or ages < 1:
             raise ValueError("Invalid amount of ages:", ages)
+        if search not in (self.GENERATIONS,
+                          self.BEST_FIRST,
+                          self.BIDIRECTIONAL):
+            raise ValueError("Invalid search:", search)
         self.ages = ages
-        self.population = Population(genes=genes)
+        self.search = search
+        self.population = Population(genes=genes,
+                                     mutation=mutation,
+                                     fitness=fitness,
+                                     layout=layout,
+                                     hooks=hooks,
+                                     max_overhangs=max_overhangs)
 
     def __str__(self):
         """ To String method. """
@@ -394,7 +1498,11 @@ class Sequence(object):
         retrieved by executing: self.population.get_survivor().
         """
         logger.debug("Analyzing sequence.")
-        if not self.population.chromosomes.empty:
+        if self.search == self.BEST_FIRST:
+            self.__run_best_first()
+        elif self.search == self.BIDIRECTIONAL:
+            self.__run_bidirectional()
+        elif not self.population.chromosomes.empty:
             for age in range(self.ages):
                 logger.debug("Running on age: %s/%s.", age + 1, self.ages)
                 self.population.mutate()
@@ -405,18 +1513,258 @@ class Sequence(object):
                 if self.population.shortest_survivor < self.population.shortest_chromosome:
                     logger.debug("Solution found.")
                     break
+            if self.population.transpositions is not None:
+                logger.debug("Transpositions: %s", self.population.transpositions.stats)
 
         logger.debug("Finished analyzing sequence.")
 
+    def __run_best_first(self):
+        """
+        This private method runs the best-first search.
+
+        Chromosomes are kept in a priority queue ordered by the
+        resolved prefix plus the overhang, which is a prefix of
+        every survivor the chromosome can lead to. Therefore,
+        ordering by its length and then alphabetically means that
+        the first winner taken from the queue is the final survivor.
+
+        Chromosomes with an overhang that was already expanded
+        using less genes are skipped. As in the GENERATIONS search,
+        at most 1 + ages genes are used.
+        """
+        population = self.population
+        genes = population.genes
+        values = genes.get_genes()
+        a_genes = np.asarray(values[genes.A], dtype=object)
+        b_genes = np.asarray(values[genes.B], dtype=object)
+        queue = [
+            (len(survivor), survivor, 1, "", "", survivor)
+            for survivor in [population.survivors.best]
+            if survivor is not None
+        ]
+        for a, b, parent in zip(population.chromosomes[genes.A],
+                                population.chromosomes[genes.B],
+                                population.chromosomes[population.PARENT]):
+            prefix = population.get_prefix(parent)
+            key = prefix + a + b
+            queue.append((len(key), key, 1, a, b, prefix))
+        heapq.heapify(queue)
+        expanded = {}
+        while queue:
+            _, _, age, a, b, prefix = heapq.heappop(queue)
+            if not a and not b:
+                logger.debug("Solution found.")
+                population.survive(prefix)
+                break
+            if expanded.get((a, b), age + 1) <= age or age > self.ages:
+                continue
+            expanded[a, b] = age
+            if a:
+                positions = genes.get_positions(a_overhang=a)
+            else:
+                positions = genes.get_positions(b_overhang=b)
+            for position in positions:
+                new_a = a + a_genes[position]
+                new_b = b + b_genes[position]
+                shared = min(len(new_a), len(new_b))
+                if new_a[:shared] != new_b[:shared]:
+                    continue
+                new_prefix = prefix + new_a[:shared]
+                key = new_prefix + new_a[shared:] + new_b[shared:]
+                heapq.heappush(queue, (len(key), key, age + 1,
+                                       new_a[shared:], new_b[shared:],
+                                       new_prefix))
+        logger.debug("Expanded %s chromosome(s).", len(expanded))
+
+    def __run_bidirectional(self):
+        """
+        This private method runs the bidirectional search.
+
+        A second population mutates the reversed genetic code,
+        which means it builds survivors starting from their end.
+        A chromosome from the start whose overhang is exactly
+        the part missing from a chromosome from the end can be
+        joined with it into a survivor, so each population only
+        has to mutate about half of the ages.
+
+        The population with less chromosomes is mutated first.
+        The search stops when the best survivor is shorter than
+        any survivor that has not been joined yet.
+        """
+        populations = (
+            self.population,
+            Population(genes=self.population.genes.reverse(),
+                       mutation=self.population.mutation,
+                       fitness=self.population.fitness,
+                       reverse=True,
+                       layout=self.population.layout,
+                       hooks=self.population.hooks,
+                       max_overhangs=self.population.max_overhangs),
+        )
+        ages = [1, 1]
+        joined = [None, None]
+        for side in (0, 1):
+            self.__join(populations, joined, side)
+        while ages[0] + ages[1] <= self.ages and \
+                not any(population.chromosomes.empty for population in populations):
+            survivors = [
+                population.survivors.shortest
+                for population in populations
+                if not population.survivors.empty
+            ]
+            if survivors and min(survivors) < self.__get_shortest(populations):
+                logger.debug("Solution found.")
+                break
+            side = int(populations[1].size < populations[0].size)
+            logger.debug("Running on age: %s/%s.", sum(ages) + 1, self.ages + 1)
+            populations[side].mutate()
+            populations[side].fit()
+            ages[side] += 1
+            self.__join(populations, joined, side)
+        if not populations[1].survivors.empty:
+            self.population.survive(populations[1].survivors.best[::-1])
+
+    def __get_overhangs(self, population: Population, side: int) -> pd.DataFrame:
+        """
+        This private method returns the overhangs of a population.
+
+        Genes 'A' and 'B' contain the overhang of the chromosomes
+        from the start this chromosome can be joined with.
+
+        @param population: The population from the start or from the end.
+        @param side: 0 if the population is from the start, 1 otherwise.
+        """
+        a = population.chromosomes[population.genes.A]
+        b = population.chromosomes[population.genes.B]
+        if side:
+            a, b = b.str[::-1], a.str[::-1]
+        return pd.DataFrame({
+            population.genes.A: np.asarray(a, dtype=object),
+            population.genes.B: np.asarray(b, dtype=object),
+            population.LENGTH: population.chromosomes[population.LENGTH].values,
+            population.PARENT: population.chromosomes[population.PARENT].values,
+            self.GENERATION: len(population.history) - 1,
+        }, columns=[population.genes.A,
+                    population.genes.B,
+                    population.LENGTH,
+                    population.PARENT,
+                    self.GENERATION])
+
+    def __join(self, populations: tuple, joined: list, side: int):
+        """
+        This private method joins the chromosomes of a population
+        with every chromosome of the other one seen so far.
+
+        Only the joins leading to the shortest survivors
+        get their resolved parts rebuilt. New survivors are
+        added to both populations, so they can remove the
+        chromosomes dominated by them.
+
+        @param populations: The populations from the start and from the end.
+        @param joined: The chromosomes seen so far in each population.
+        @param side: The population that has just mutated.
+        """
+        population = populations[0]
+        a, b = population.genes.A, population.genes.B
+        overhangs = self.__get_overhangs(populations[side], side)
+        if joined[1 - side] is not None:
+            if side:
+                joins = pd.merge(joined[0], overhangs,
+                                 on=[a, b],
+                                 suffixes=("", population.TMP_SUFFIX))
+            else:
+                joins = pd.merge(overhangs, joined[1],
+                                 on=[a, b],
+                                 suffixes=("", population.TMP_SUFFIX))
+            length = joins[population.LENGTH] + \
+                joins[population.LENGTH + population.TMP_SUFFIX] + \
+                joins[a].str.len() + joins[b].str.len()
+            joins = joins[length == length.min()]
+            for row in zip(joins[a], joins[b],
+                           joins[population.PARENT],
+                           joins[self.GENERATION],
+                           joins[population.PARENT + population.TMP_SUFFIX],
+                           joins[self.GENERATION + population.TMP_SUFFIX]):
+                start = populations[0].get_prefix(row[2], row[3])
+                end = populations[1].get_prefix(row[4], row[5])[::-1]
+                survivor = start + row[0] + row[1] + end
+                populations[0].survive(survivor)
+                populations[1].survive(survivor[::-1])
+        joined[side] = pd.concat([joined[side], overhangs])
+
+    def __get_shortest(self, populations: tuple) -> int:
+        """
+        This private method returns the length of the shortest
+        survivor that can still be found by mutating both populations.
+
+        A survivor like that is made of a chromosome from the start,
+        some more genes and a chromosome from the end.
+        """
+        lengths = []
+        for population in populations:
+            length = population.chromosomes[population.LENGTH]
+            overhang = population.chromosomes[population.genes.A].str.len() + \
+                population.chromosomes[population.genes.B].str.len()
+            lengths.append(((length + overhang).min(), length.min()))
+        return max(lengths[0][0] + lengths[1][1],
+                   lengths[0][1] + lengths[1][0])
+
+
+def solve(pairs: list, **kwargs) -> str:
+    """
+    This function runs the Genetic Algorithm on a single case
+    and returns its survivor, or IMPOSSIBLE if there is none.
+
+    @param pairs: A list of (a, b) pairs of strings,
+                  as returned by reader.read_cases.
+    @param kwargs: The mutation, fitness, search and layout
+                   modes, which are passed to the Sequence.
+    """
+    # Genes that can not be part of any survivor are removed
+    # before the search, which is skipped if the case is proven
+    # impossible. Survivors may still repeat genes, so the amount
+    # of ages depends on the genes of the case.
+    reduced, reason, stats = proofs.prove(pairs, reuse=True)
+    if reason or not reduced:
+        logger.debug("Impossible case: %s", reason)
+        return Sequence.IMPOSSIBLE
+    if kwargs.get("hooks"):
+        kwargs["hooks"] = metrics.label_hooks(kwargs["hooks"], pairs=stats["pairs"],
+                                              reduced=stats["reduced"])
+    g = Genes.from_pairs(reduced)
+    s = Sequence(genes=g, ages=len(pairs), **kwargs)
+    s.run()
+    return s.population.get_survivor(Sequence.IMPOSSIBLE)
+
 
 @begin.start
+@begin.convert(workers=int, cache=int)
 def run(debug: "Use this flag to enable the debug/verbose mode."=False,
-        ages: "Amount of iterations."=10):
+        ages: "Amount of iterations."=10,
+        mutation: "Mutation mode: 'cross' or 'prefix'."=Population.CROSS_JOIN,
+        fitness: "Fitness mode: 'rowwise' or 'vectorized'."=Population.ROWWISE_FITNESS,
+        search: "Search mode: 'generations', 'best-first' or 'bidirectional'."=Sequence.GENERATIONS,
+        layout: "Layout mode: 'frame' or 'columnar'."=Population.FRAME_LAYOUT,
+        path: "Input file, read through mmap instead of stdin."=None,
+        workers: "Amount of processes solving cases."=1,
+        cache: "Amount of survivors cached in memory, 0 disables the cache."=1024,
+        results: "SQLite file where survivors are cached between runs."=None,
+        trace: "File where the metrics of every generation are written, "
+               "as CSV or as JSON lines if it ends with '.jsonl'."=None):
     """
     This function is required by "begin" to provide shell script access.
 
     @param debug: Use this flag to enable the debug/verbose mode.
     @param ages: Amount of iterations.
+    @param mutation: Mutation mode: 'cross' or 'prefix'.
+    @param fitness: Fitness mode: 'rowwise' or 'vectorized'.
+    @param search: Search mode: 'generations', 'best-first' or 'bidirectional'.
+    @param layout: Layout mode: 'frame' or 'columnar'.
+    @param path: Input file, read through mmap instead of stdin.
+    @param workers: Amount of processes solving cases.
+    @param cache: Amount of survivors cached in memory, 0 disables the cache.
+    @param results: SQLite file where survivors are cached between runs.
+    @param trace: File where the metrics of every generation are written.
     """
 
     # If debug mode is enabled, it will log messages to stdout.
@@ -424,21 +1772,54 @@ def run(debug: "Use this flag to enable the debug/verbose mode."=False,
         logger.addHandler(logging.StreamHandler())
         logger.setLevel(logging.DEBUG)
 
-    # The following piece of code reads from stdin
-    # and truncates the input by case length..
-    for case_number, line in enumerate(sys.stdin):
-        case_length = int(line)  # WARNING: May raise ValueError.
-        case_data = "\n".join([
-            next(sys.stdin).replace("\n", "")
-            for _ in range(case_length)
-        ])
-
-        # This is where the Genetic Algorithm is executed.
-        # It will run once per case in the input file.
-        g = Genes(case_data)
-        s = Sequence(genes=g, ages=g.size)
-        s.run()
-
-        # Printing results to STDOUT.
-        title = "Case {}:".format(case_number + 1)
-        print(title, s.population.get_survivor(Sequence.IMPOSSIBLE))
+    if workers < 1:
+        raise ValueError("Invalid amount of workers:", workers)
+    if trace and workers > 1:
+        raise ValueError("Workers and trace can not be combined:", workers, trace)
+
+    # The following piece of code reads the whole input
+    # in a single pass and splits it by case length.
+    cases = reader.read_cases(path or sys.stdin, use_mmap=bool(path))
+
+    # The metrics of every generation are labeled with
+    # the number of the case that is being solved.
+    collector = metrics.Collector(trace) if trace else None
+    if collector:
+        cases = collector.label_cases(cases)
+
+    # This is where the Genetic Algorithm is executed.
+    # It will run once per case in the input file, in a pool
+    # of processes if required. Survivors are still returned
+    # in input order.
+    case_solver = functools.partial(solve,
+                                    mutation=mutation,
+                                    fitness=fitness,
+                                    search=search,
+                                    layout=layout,
+                                    hooks=[collector] if collector else None)
+
+    # Cases that were already solved are taken from the cache.
+    if cache or results:
+        case_solver = functools.partial(solutions.solve,
+                                        solver=case_solver,
+                                        size=cache,
+                                        path=results,
+                                        namespace="edith")
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        if pool:
+            survivors = pool.imap(case_solver, cases, reader.CHUNKSIZE)
+        else:
+            survivors = map(case_solver, cases)
+
+        # Printing results to STDOUT as soon as
+        # every previous case has been solved.
+        for case_number, survivor in enumerate(survivors):
+            title = "Case {}:".format(case_number + 1)
+            print(title, survivor, flush=bool(pool))
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        if collector:
+            collector.close()
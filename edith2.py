@@ -9,16 +9,70 @@ DATE: 2019, Feb 21th.
 
 You can execute this script by running this:
 >>> cat sample-01.in | python3 edith2.py
+
+The input can also be read from a file through mmap:
+>>> python3 edith2.py sample-01.in
+
+Cases can be solved by a pool of processes:
+>>> cat sample-01.in | python3 edith2.py --workers 4
+
+Survivors are cached, so repeated cases are only solved once.
+They can also be cached in a file between runs:
+>>> cat sample-01.in | python3 edith2.py --results solutions.db
+
+The population of each case can be mutated by a pool of processes,
+although no speedup has been measured yet (see benchmark_shards.py):
+>>> cat sample-01.in | python3 edith2.py --shards 4
+
+The population of each case can be written to disk
+when it takes more than some megabytes:
+>>> cat sample-01.in | python3 edith2.py --budget 512
+
+The metrics of every generation can be written as CSV or JSON lines:
+>>> cat sample-01.in | python3 edith2.py --trace generations.jsonl
 """
 
 import os
 import sys
 import json
+import time
+import heapq
+import bisect
+import argparse
+import functools
+import collections
 
 import logging
 
+import reader
+import bounds
+import metrics
+import proofs
+import frontier
+import transpositions
+import solutions
+
 logger = logging.getLogger(__name__)
 
+# Genetic codes attached from shared memory by worker processes.
+shared_genes = {}
+
+
+def get_shared_memory():
+    """
+    This function returns the shared memory module, or None
+    if it is not available.
+
+    It is imported the first time it is required, since
+    importing it takes longer than solving small inputs
+    and only sharded populations use it.
+    """
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        return None
+    return shared_memory
+
 
 class Genes(object):
     """
@@ -44,11 +98,96 @@ class Genes(object):
             raise ValueError("Expecting a string, not:", type(genes))
         self.A = []
         self.B = []
+        self.__index = {}
+        self.__bounds = None
         for gene in genes.split("\n"):
             a, b = gene.split(" ")
             self.A.append(a)
             self.B.append(b)
 
+    def get_positions(self, **kwargs) -> list:
+        """
+        Positions getter.
+
+        This function returns the positions of the genes matching
+        all the given filters, in the same order as in the genetic code.
+        Without filters, the positions of all the genes are returned.
+
+        Filters are answered with a binary search over the genes
+        sorted alphabetically or by length, which are indexed only once.
+        Only the positions matching the first filter are intersected
+        with the other filters.
+
+        @param a_startswith: Genes whose 'a' starts with this string.
+        @param b_startswith: Genes whose 'b' starts with this string.
+        @param a_prefix_of: Genes whose 'a' is a prefix of this string.
+        @param b_prefix_of: Genes whose 'b' is a prefix of this string.
+        @param a_max_length: Genes whose 'a' is not longer than this.
+        @param b_max_length: Genes whose 'b' is not longer than this.
+        @param a_overhang: Genes that can fuse with this overhang of 'a',
+                           which means their 'b' starts with it
+                           or their 'b' is a prefix of it.
+        @param b_overhang: Genes that can fuse with this overhang of 'b'.
+        """
+        if not kwargs:
+            return list(range(self.size))
+        filters = iter(kwargs.items())
+        positions = self.__filter(*next(filters))
+        for name, value in filters:
+            positions &= self.__filter(name, value)
+        return sorted(positions)
+
+    def __filter(self, name: str, value) -> set:
+        """
+        This private method returns the positions matching a filter.
+        """
+        if name == "a_overhang":
+            return self.__filter("b_startswith", value) | \
+                self.__filter("b_prefix_of", value)
+        if name == "b_overhang":
+            return self.__filter("a_startswith", value) | \
+                self.__filter("a_prefix_of", value)
+        if name not in ("a_startswith", "b_startswith",
+                        "a_prefix_of", "b_prefix_of",
+                        "a_max_length", "b_max_length"):
+            raise ValueError("Invalid filter:", name)
+        keys, order, lengths, length_order = self.__get_index(name[0].upper())
+        if name.endswith("_max_length"):
+            return set(length_order[:bisect.bisect_right(lengths, value)])
+        if name.endswith("_startswith"):
+            start = bisect.bisect_left(keys, value)
+            stop = start
+            while stop < len(keys) and keys[stop].startswith(value):
+                stop += 1
+            return set(order[start:stop])
+        positions = set()
+        for end in range(len(value) + 1):
+            start = bisect.bisect_left(keys, value[:end])
+            stop = bisect.bisect_right(keys, value[:end])
+            positions.update(order[start:stop])
+        return positions
+
+    def __get_index(self, column: str) -> tuple:
+        """
+        This private method returns the index of a column.
+
+        The index contains the genes sorted alphabetically and
+        their positions in the genetic code, and the lengths of the
+        genes sorted and their positions in the genetic code.
+        It is built the first time it is required.
+        """
+        if column not in self.__index:
+            genes = getattr(self, column)
+            order = sorted(range(len(genes)), key=genes.__getitem__)
+            length_order = sorted(range(len(genes)), key=lambda i: len(genes[i]))
+            self.__index[column] = (
+                [genes[position] for position in order],
+                order,
+                [len(genes[position]) for position in length_order],
+                length_order,
+            )
+        return self.__index[column]
+
     def get_genes(self, **kwargs) -> list:
         """
         Genes getter.
@@ -56,13 +195,78 @@ class Genes(object):
         This function returns the [dict instead of pd.DataFrame]
         containing the genetic pairs.
 
-        The purpose of this method is to provide
-        custom mutations in the future. For example,
-        by getting only genes that start with "s".
+        Genes can be filtered using the same filters
+        as in get_positions. For example, by getting
+        only genes whose 'a' starts with "s".
         """
-        for i, _ in enumerate(self.A):
+        for i in self.get_positions(**kwargs):
             yield [self.A[i], self.B[i]]
 
+    @classmethod
+    def from_pairs(cls, pairs: list) -> "Genes":
+        """
+        Constructing the genetic code from a list of (a, b) pairs,
+        such as the cases returned by reader.read_cases,
+        without parsing any string.
+
+        @param pairs: A list of (a, b) pairs of strings.
+        """
+        logger.debug("Constructing genetic code from pairs.")
+        if not pairs:
+            raise ValueError("Genetic code must not be empty.")
+        genes = cls.__new__(cls)
+        genes.A = [a for a, _ in pairs]
+        genes.B = [b for _, b in pairs]
+        genes.__index = {}
+        genes.__bounds = None
+        return genes
+
+    def to_shared_memory(self) -> tuple:
+        """
+        This function copies the genetic code into a block of shared
+        memory, so other processes can attach to it without pickling it.
+
+        It returns the block and the size of the genetic code in bytes.
+        The block must be closed and unlinked by the caller.
+        """
+        shared_memory = get_shared_memory()
+        if shared_memory is None:
+            raise RuntimeError("Shared memory is not available.")
+        data = "\n".join(
+            "{} {}".format(a, b)
+            for a, b in zip(self.A, self.B)
+        ).encode()
+        memory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        memory.buf[:len(data)] = data
+        return memory, len(data)
+
+    @classmethod
+    def from_shared_memory(cls, name: str, size: int) -> "Genes":
+        """
+        Constructing the genetic code from a block of shared memory.
+
+        @param name: The name of the block, as created by to_shared_memory.
+        @param size: The size of the genetic code in bytes.
+        """
+        memory = get_shared_memory().SharedMemory(name=name)
+        try:
+            return cls(bytes(memory.buf[:size]).decode())
+        finally:
+            memory.close()
+
+    def reverse(self) -> "Genes":
+        """
+        Reversed genetic code getter.
+
+        This function returns a new genetic code where
+        both genes of every pair are reversed, so survivors
+        can be built starting from their last character.
+        """
+        return Genes.from_pairs([
+            (a[::-1], b[::-1])
+            for a, b in zip(self.A, self.B)
+        ])
+
     @property
     def size(self) -> int:
         """
@@ -72,11 +276,86 @@ class Genes(object):
         """
         return len(self.A)
 
+    def get_bounds(self) -> bounds.Bounds:
+        """
+        Bounds getter.
+
+        This function returns the least amount of characters
+        needed to resolve every overhang. See bounds.py.
+        They are built the first time they are required.
+        """
+        if self.__bounds is None:
+            self.__bounds = bounds.Bounds(list(zip(self.A, self.B)))
+        return self.__bounds
+
+    @property
+    def max_length(self) -> int:
+        """ Property to access the length of the longest gene. """
+        return max(len(gene) for gene in self.A + self.B)
+
     def __str__(self):
         """ To String method. """
         return "<Genes: {}>".format(self.size)
 
 
+class Survivors(object):
+    """
+    This class keeps track of the winner chromosomes.
+
+    Survivors are arranged by string length and then in
+    alphabetical order, so only the first of them has to be
+    kept and it can be retrieved without sorting anything.
+    """
+
+    def __init__(self, reverse: bool=False):
+        """
+        Survivors constructor.
+
+        @param reverse: Use this flag if survivors are built from
+                        a reversed genetic code, so the alphabetical
+                        order is checked reading them backwards.
+        """
+        self.best = None
+        self.count = 0
+        self.reverse = reverse
+
+    def __str__(self):
+        """ To String method. """
+        return "<Survivors: {}>".format(self.count)
+
+    def __len__(self) -> int:
+        """ Amount of winner chromosomes found so far. """
+        return self.count
+
+    @property
+    def empty(self) -> bool:
+        """ Property to detect if there are no survivors. """
+        return self.best is None
+
+    @property
+    def shortest(self) -> int:
+        """ Property to access the length of the best survivor. """
+        return len(self.best) if self.best is not None else None
+
+    def add(self, chromosome: str):
+        """
+        This method adds a winner chromosome.
+
+        @param chromosome: The string built by the winner chromosome.
+        """
+        self.count += 1
+        if self.best is None or self.__get_key(chromosome) < self.__get_key(self.best):
+            self.best = chromosome
+
+    def __get_key(self, chromosome: str) -> tuple:
+        """
+        This private method returns the sorting key of a survivor.
+        """
+        if self.reverse:
+            return len(chromosome), chromosome[::-1]
+        return len(chromosome), chromosome
+
+
 class Population(object):
     """
     This class represents the active survivors playing the game.
@@ -95,6 +374,26 @@ class Population(object):
 
     @constant TMP_SUFFIX: It is a temporal constant used to merge datasets.
     @constant TMP_INDEX: It is a temporal constant used to merge datasets.
+
+    Chromosomes with the same genes 'A' and 'B' lead to the
+    same survivors, so only one of them is kept.
+
+    The population can be split into shards that are mutated
+    and fitted by a pool of processes. The genetic code is kept
+    in shared memory, so it is not sent with every shard.
+
+    Hooks are called with an event after every generation is
+    fitted. See metrics.py for the fields of the events.
+
+    If the chromosomes do not fit in the memory budget, they
+    are written to sorted runs on disk. The next generation is
+    mutated by streaming the runs back in chunks, and chromosomes
+    with the same genes in different runs are removed while the
+    runs are merged. The population goes back to memory as soon
+    as it fits in the budget again.
+
+    @constant CHROMOSOME_BYTES: The approximate memory taken by a
+                                chromosome, besides its characters.
     """
 
     A_DOMINANCE = "A Dominance"
@@ -106,13 +405,28 @@ class Population(object):
     TMP_SUFFIX = "_new"
     TMP_INDEX = "_tmp_idx"
 
-    def __init__(self, genes: Genes=None):
+    CHROMOSOME_BYTES = 300
+
+    def __init__(self, genes: Genes=None, reverse: bool=False,
+                 shards: int=1, hooks: list=None, max_memory: int=None,
+                 max_overhangs: int=transpositions.Transpositions.MAX_SIZE):
         """
         Population constructor.
 
         @param genes: A Genes instance is required.
                       Mutations will take genes from this
                       instance and generate variations.
+        @param reverse: Use this flag if the genetic code is reversed.
+        @param shards: The amount of processes mutating the population.
+                       Call close() to stop them.
+        @param hooks: Functions called with an event after
+                      every generation is fitted.
+        @param max_memory: The approximate amount of bytes the
+                           chromosomes can take before they are
+                           written to disk. Call close() to remove
+                           the files. By default, there is no limit.
+        @param max_overhangs: The amount of overhangs kept in the
+                              transposition table. 0 disables it.
 
         NOTE: The initial set of chromosomes will only contain
               pairs of genes whose first character match in order
@@ -123,12 +437,36 @@ class Population(object):
             raise ValueError("Invalid genes:", genes)
         if not genes.size:
             raise RuntimeError("Empty genetic code.")
+        if not isinstance(shards, int) or shards < 1:
+            raise ValueError("Invalid amount of shards:", shards)
+        if shards > 1 and get_shared_memory() is None:
+            raise RuntimeError("Shared memory is not available.")
+        if max_memory is not None and (not isinstance(max_memory, int) or max_memory < 1):
+            raise ValueError("Invalid memory budget:", max_memory)
+        if not isinstance(max_overhangs, int) or max_overhangs < 0:
+            raise ValueError("Invalid amount of overhangs:", max_overhangs)
         self.genes = genes
-        self.survivors = []
+        self.shards = shards
+        self.pool = None
+        self.memory = None
+        self.memory_size = 0
+        self.reverse = reverse
+        self.hooks = list(hooks or [])
+        self.generation = 0
+        self.max_memory = max_memory
+        self.max_overhangs = max_overhangs
+        self.transpositions = None
+        if max_overhangs:
+            self.transpositions = transpositions.Transpositions(max_overhangs)
+        self.transposed = False
+        self.runs = []
+        self.shortest_run = -1
+        self.survivors = Survivors(reverse=reverse)
         self.chromosomes = []
         for gene in self.genes.get_genes():
             if gene[0].startswith(gene[1]) or gene[1].startswith(gene[0]):
                 self.chromosomes.append(gene)
+        self.event = metrics.new_event(0, reverse, self.size) if self.hooks else None
         self.fit()
 
     def __str__(self):
@@ -141,9 +479,10 @@ class Population(object):
         Size getter.
 
         This function returns the amount of
-        active chromosomes in this population.
+        active chromosomes in this population,
+        including the ones written to disk.
         """
-        return len(self.chromosomes)
+        return len(self.chromosomes) + sum(len(run) for run in self.runs)
 
     def get_survivor(self, default: str=None) -> str:
         """
@@ -158,14 +497,18 @@ class Population(object):
         @param default: String value that will be
                         returned if there are no survivors.
         """
-        if not self.survivors:
+        if self.survivors.empty:
             return default
-        survivors = [
-            survivor[0]
-            for survivor in self.survivors
-        ]
-        survivors = sorted(survivors, key=lambda s: (len(s), s))
-        return survivors[0]
+        return self.survivors.best
+
+    def survive(self, chromosome: str):
+        """
+        This method adds a winner chromosome to the survivors.
+
+        @param chromosome: A string that can be built
+                           both from genes 'A' and from genes 'B'.
+        """
+        self.survivors.add(chromosome)
 
     def fit(self):
         """
@@ -173,21 +516,132 @@ class Population(object):
 
         The dominance of genes 'A' and 'B' will be calculated.
         logger.debug("Fitting population.")
+
+        If the population is on disk or it does not fit in the
+        memory budget, the chromosomes are written to a new run.
+        If every run fits in the memory budget, the runs are
+        merged and the population goes back to memory.
+
+        Chromosomes mutated on disk were already visited by the
+        transposition table, so they are not visited again, since
+        a chromosome would be dominated by itself.
         """
-        self.__calculate_dominance()
-        self.__remove_unfit()
-        self.__remove_fit()
+        self.__filter(transposed=not self.transposed)
+        self.transposed = False
+        if self.runs or (self.max_memory and
+                         self.get_memory(self.chromosomes) > self.max_memory):
+            self.__spill()
+            memory = sum(len(run) * self.CHROMOSOME_BYTES + run.bytes for run in self.runs)
+            if memory <= self.max_memory:
+                self.__load()
         logger.debug(json.dumps(self.chromosomes, indent=4))
+        if self.hooks:
+            self.event["fitted"] = self.size
+            self.event["peak_memory_kb"] = metrics.get_peak_memory()
+            if self.transpositions is not None:
+                self.event["transposition_hits"] = self.transpositions.stats["hits"]
+                self.event["transposition_evictions"] = \
+                    self.transpositions.stats["evictions"]
+            for hook in self.hooks:
+                hook(self.event)
+            self.event = None
+
+    def __filter(self, transposed: bool=True):
+        """
+        This private method removes unfit, duplicated, fit,
+        dominated and transposed chromosomes from the chromosomes
+        in memory.
+
+        @param transposed: Use this flag to remove transposed chromosomes.
+        """
+        self.__measure("dominance", self.__calculate_dominance)
+        self.__measure("unfit", self.__remove_unfit)
+        self.__measure("duplicated", self.__remove_duplicated)
+        self.__measure("fit", self.__remove_fit)
+        self.__measure("dominated", self.__remove_dominated)
+        if transposed:
+            self.__measure("duplicated", self.__remove_transposed)
+
+    @classmethod
+    def get_memory(cls, chromosomes: list) -> int:
+        """
+        This function returns the approximate
+        amount of bytes taken by some chromosomes.
+
+        @param chromosomes: A list of chromosomes.
+        """
+        return sum(cls.CHROMOSOME_BYTES + len(x[0]) + len(x[1]) for x in chromosomes)
+
+    def __spill(self):
+        """
+        This private method writes the chromosomes in memory to a new
+        sorted run. Only their genes are written, since their dominance
+        is calculated again when they are read.
+        """
+        if not self.chromosomes:
+            return
+        self.runs.append(frontier.Run.write([(x[0], x[1]) for x in self.chromosomes]))
+        shortest = min(len(x[0]) for x in self.chromosomes)
+        if self.shortest_run < 0 or shortest < self.shortest_run:
+            self.shortest_run = shortest
+        self.chromosomes = []
+
+    def __load(self):
+        """
+        This private method merges the runs into memory.
+        """
+        logger.debug("Reading %s run(s).", len(self.runs))
+        size = self.size
+        self.chromosomes = [list(x) for x in frontier.merge(self.runs)]
+        self.__close_runs()
+        self.__calculate_dominance()
+        if self.hooks:
+            self.event["duplicated"] += size - self.size
+
+    def __close_runs(self):
+        """
+        This private method removes the runs of the population.
+        """
+        for run in self.runs:
+            run.close()
+        self.runs = []
+        self.shortest_run = -1
+
+    def __measure(self, phase: str, method):
+        """
+        This private method runs a phase of a generation.
+
+        If there are hooks, the time it takes and the amount
+        of chromosomes it removes are added to the event.
+        The dominance and the mutation are timed on their own,
+        every other phase is timed as part of the filter.
+        """
+        if not self.hooks:
+            method()
+            return
+        size = self.size
+        start = time.perf_counter()
+        method()
+        seconds = time.perf_counter() - start
+        if phase + "_seconds" in self.event:
+            self.event[phase + "_seconds"] += seconds
+        else:
+            self.event["filter_seconds"] += seconds
+        if phase in self.event:
+            self.event[phase] += size - self.size
 
     @property
     def shortest_survivor(self) -> int:
         """ Property to access the length of the shortest survivor. """
-        return min(len(x[0]) for x in self.survivors) if self.survivors else -1
+        return self.survivors.shortest if self.survivors else -1
 
     @property
     def shortest_chromosome(self) -> int:
         """ Property to access the length of the shortest chromosome. """
-        return min(len(x[0]) for x in self.chromosomes) if self.chromosomes else -1
+        lengths = [len(x[0]) for x in self.chromosomes]
+        if self.runs:
+            lengths.append(self.shortest_run)
+        return min(lengths) if lengths else -1
 
     def __calculate_dominance(self):
         """
@@ -198,8 +652,11 @@ class Population(object):
         The dominance will be 'df' because 'asdf' - 'as' = 'df'
 
         This can be later used to remove unfit chromosomes.
+        Chromosomes fitted by a worker process already have it.
         """
         for i, chromosome in enumerate(self.chromosomes):
+            if len(chromosome) > 2:
+                continue
             a_dominance = self.get_fitness(chromosome[0], chromosome[1])
             b_dominance = self.get_fitness(chromosome[1], chromosome[0])
             self.chromosomes[i].append(a_dominance)
@@ -247,6 +704,20 @@ class Population(object):
             or (chromosome[2] != self.UNFIT and chromosome[3] != self.UNFIT)
         ]
 
+    def __remove_duplicated(self):
+        """
+        This private method removes chromosomes
+        with the same genes 'A' and 'B'.
+        """
+        chromosomes = {
+            (chromosome[0], chromosome[1]): chromosome
+            for chromosome in self.chromosomes
+        }
+        if len(chromosomes) < len(self.chromosomes):
+            logger.debug("Removing %s duplicated chromosome(s).",
+                         len(self.chromosomes) - len(chromosomes))
+            self.chromosomes = list(chromosomes.values())
+
     def __remove_fit(self):
         """
         This private method detects winners in the population.
@@ -262,11 +733,54 @@ class Population(object):
         new_generation = []
         for chromosome in self.chromosomes:
             if chromosome[2] == self.FIT:
-                self.survivors.append(chromosome)
+                self.survivors.add(chromosome[0])
             else:
                 new_generation.append(chromosome)
         self.chromosomes = new_generation
 
+    def __remove_dominated(self):
+        """
+        This private method removes chromosomes that can not
+        lead to a survivor as good as the best survivor.
+
+        The longest gene of a chromosome is a prefix of every
+        survivor the chromosome can lead to, so chromosomes where
+        it is longer than the best survivor are removed.
+        """
+        if self.survivors.empty:
+            return
+        shortest_survivor = self.survivors.shortest
+        self.chromosomes = [
+            chromosome
+            for chromosome in self.chromosomes
+            if max(len(chromosome[0]), len(chromosome[1])) <= shortest_survivor
+        ]
+
+    def __remove_transposed(self):
+        """
+        This private method removes chromosomes whose overhang
+        was already seen with a shorter, or alphabetically smaller,
+        resolved prefix in this or in a previous generation.
+        See transpositions.py. Prefixes of a reversed population
+        are compared as they would be read in the survivor.
+        """
+        if self.transpositions is None:
+            return
+        new_generation = []
+        for chromosome in self.chromosomes:
+            shared = min(len(chromosome[0]), len(chromosome[1]))
+            prefix = chromosome[0][:shared]
+            if self.reverse:
+                prefix = prefix[::-1]
+            if self.transpositions.visit(chromosome[0][shared:],
+                                         chromosome[1][shared:],
+                                         shared, prefix):
+                new_generation.append(chromosome)
+        if len(new_generation) < len(self.chromosomes):
+            logger.debug("Removing %s transposed chromosome(s).",
+                         len(self.chromosomes) - len(new_generation))
+            self.chromosomes = new_generation
+
     def mutate(self):
         """
         Genetic Mutation method.
@@ -275,17 +789,168 @@ class Population(object):
 
         Then, it will be combined with the current chromosomes
         in order to create more chromosomes from both.
+        Only the genes that can fuse with the overhang of
+        each chromosome are taken from the genetic code.
+
+        If the population has more than 1 shard, every shard is
+        mutated and fitted by a worker process.
         """
         logger.debug("Mutating population.")
+        self.generation += 1
+        if self.hooks:
+            self.event = metrics.new_event(self.generation, self.reverse, self.size)
+        if self.runs:
+            self.__mutate_runs()
+        else:
+            self.__mutate_chromosomes()
+        logger.debug(json.dumps(self.chromosomes, indent=4))
+
+    def __mutate_chromosomes(self):
+        """
+        This private method mutates the chromosomes in memory.
+        """
+        size = self.size
+        if self.shards > 1:
+            self.__measure("mutate", self.__mutate_shards)
+        else:
+            self.__measure("mutate", self.__expand)
+        if self.hooks:
+            self.event["mutated"] += self.size - size
+
+    def __mutate_runs(self):
+        """
+        This private method mutates the population on disk.
+
+        The runs are merged and read in chunks. Each chunk is
+        mutated and filtered, and the new chromosomes are written
+        to new runs whenever they do not fit in the memory budget.
+        """
+        runs = self.runs
+        self.runs = []
+        self.shortest_run = -1
+        chunk_size = max(1, self.max_memory // (4 * self.genes.size * self.CHROMOSOME_BYTES))
         new_generation = []
-        for gene in self.genes.get_genes():
-            for chromosome in self.chromosomes:
+        memory = 0
+        size = sum(len(run) for run in runs)
+        records = frontier.merge(runs)
+        while True:
+            self.chromosomes = [list(x) for _, x in zip(range(chunk_size), records)]
+            if not self.chromosomes:
+                break
+            size -= len(self.chromosomes)
+            self.__calculate_dominance()
+            self.__measure("dominated", self.__remove_dominated)
+            self.__mutate_chromosomes()
+            self.__filter()
+            new_generation.extend(self.chromosomes)
+            memory += self.get_memory(self.chromosomes)
+            if memory > self.max_memory:
+                self.chromosomes = new_generation
+                self.__spill()
+                new_generation = []
+                memory = 0
+        for run in runs:
+            run.close()
+        self.chromosomes = new_generation
+        self.transposed = True
+        if self.hooks:
+            self.event["duplicated"] += size
+
+    def __expand(self):
+        """
+        This private method mutates the population in this process.
+        """
+        self.chromosomes = self.expand(self.genes, self.chromosomes)
+
+    @classmethod
+    def expand(cls, genes: Genes, chromosomes: list) -> list:
+        """
+        This function combines every chromosome with
+        the genes that can fuse with its overhang.
+
+        @param genes: The genetic code.
+        @param chromosomes: A list of fitted chromosomes.
+        """
+        new_generation = []
+        candidates = {}
+        for chromosome in chromosomes:
+            if chromosome[2] != cls.UNFIT:
+                key = "a_overhang", chromosome[2]
+            else:
+                key = "b_overhang", chromosome[3]
+            if key not in candidates:
+                candidates[key] = list(genes.get_genes(**{key[0]: key[1]}))
+            for gene in candidates[key]:
                 new_generation.append([
                     chromosome[0] + gene[0],
                     chromosome[1] + gene[1],
                 ])
-        self.chromosomes = new_generation
-        logger.debug(json.dumps(self.chromosomes, indent=4))
+        return new_generation
+
+    def __mutate_shards(self):
+        """
+        This private method splits the population into shards
+        and sends them to the pool of processes.
+
+        The pool and the shared memory holding the genetic code
+        are created the first time they are required. Shards come
+        back mutated, with their dominance calculated and without
+        unfit chromosomes, and they are merged in order.
+        """
+        if self.pool is None:
+            import multiprocessing
+            self.memory, self.memory_size = self.genes.to_shared_memory()
+            self.pool = multiprocessing.Pool(self.shards)
+        step = max(1, -(-len(self.chromosomes) // self.shards))
+        tasks = [
+            (self.memory.name, self.memory_size, self.chromosomes[i:i + step])
+            for i in range(0, len(self.chromosomes), step)
+        ]
+        self.chromosomes = [
+            chromosome
+            for shard in self.pool.map(mutate_shard, tasks)
+            for chromosome in shard
+        ]
+
+    def close(self):
+        """
+        This method stops the pool of processes, releases
+        the shared memory and removes the runs, if any.
+        """
+        self.__close_runs()
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+
+def mutate_shard(task: tuple) -> list:
+    """
+    This function mutates and fits a shard of a population.
+    It runs in a worker process.
+
+    The genetic code is attached from shared memory
+    only once per worker process.
+
+    @param task: The name of the shared memory block holding
+                 the genetic code, the size of the genetic code
+                 and the chromosomes of the shard.
+    """
+    name, size, chromosomes = task
+    if name not in shared_genes:
+        shared_genes.clear()
+        shared_genes[name] = Genes.from_shared_memory(name, size)
+    new_generation = []
+    for chromosome in Population.expand(shared_genes[name], chromosomes):
+        a_dominance = Population.get_fitness(chromosome[0], chromosome[1])
+        b_dominance = Population.get_fitness(chromosome[1], chromosome[0])
+        if a_dominance != Population.UNFIT or b_dominance != Population.UNFIT:
+            new_generation.append(chromosome + [a_dominance, b_dominance])
+    return new_generation
 
 
 class Sequence(object):
@@ -295,24 +960,77 @@ class Sequence(object):
     are removed from the population and only the fittest survive.
 
     @constant IMPOSSIBLE: Used to mark sequences as unresolvable.
+
+    @constant GENERATIONS: Mutate the whole population once per age.
+    @constant BEST_FIRST: Always mutate the chromosome that can lead to
+                          the shortest and alphabetically smallest survivor.
+    @constant BIDIRECTIONAL: Mutate a population from the start and another
+                             one from the end, and join their overhangs.
+    @constant ITERATIVE_DEEPENING: Mutate one chromosome at a time, depth
+                                   first, under a growing survivor length.
+    @constant A_STAR: Like BEST_FIRST, but adding the least amount of
+                      characters needed to resolve every overhang.
+
+    @constant MAX_CANDIDATES: The amount of overhangs whose genes are
+                              kept by the ITERATIVE_DEEPENING search.
     """
 
     IMPOSSIBLE = "IMPOSSIBLE"
 
-    def __init__(self, genes: Genes=None, ages: int=10):
+    GENERATIONS = "generations"
+    BEST_FIRST = "best-first"
+    BIDIRECTIONAL = "bidirectional"
+    ITERATIVE_DEEPENING = "iterative-deepening"
+    A_STAR = "a-star"
+
+    MAX_CANDIDATES = 1024
+
+    def __init__(self, genes: Genes=None, ages: int=10,
+                 search: str=GENERATIONS, shards: int=1, hooks: list=None,
+                 max_memory: int=None,
+                 max_overhangs: int=transpositions.Transpositions.MAX_SIZE):
         """
         Sequence Constructor.
 
         @param genes: A Genes instance containing the genetic code.
         @param ages: The amount of iterations in which the
                      population will mutate.
+        @param search: Either GENERATIONS, BEST_FIRST, BIDIRECTIONAL,
+                       ITERATIVE_DEEPENING or A_STAR. All of them
+                       find the same survivor.
+        @param shards: The amount of processes mutating the populations
+                       in the GENERATIONS and BIDIRECTIONAL searches.
+        @param hooks: Functions called with an event after every
+                      generation of the populations is fitted.
+                      The BEST_FIRST, ITERATIVE_DEEPENING and
+                      A_STAR searches only fit the initial one.
+        @param max_memory: The approximate amount of bytes the population
+                           can take before it is written to disk.
+                           It is only supported by the GENERATIONS search.
+        @param max_overhangs: The amount of overhangs kept in the
+                              transposition table of the populations
+                              in the GENERATIONS and BIDIRECTIONAL
+                              searches. 0 disables it.
         """
         if not isinstance(genes, Genes):
             raise ValueError("Invalid genes:", genes)
         if not isinstance(ages, int) or ages < 1:
             raise ValueError("Invalid amount of ages:", ages)
+        if search not in (self.GENERATIONS,
+                          self.BEST_FIRST,
+                          self.BIDIRECTIONAL,
+                          self.ITERATIVE_DEEPENING,
+                          self.A_STAR):
+            raise ValueError("Invalid search:", search)
+        if max_memory is not None and search != self.GENERATIONS:
+            raise ValueError("Invalid search for a memory budget:", search)
         self.ages = ages
-        self.population = Population(genes=genes)
+        self.search = search
+        self.candidates = collections.OrderedDict()
+        self.overhang_length = 0
+        self.population = Population(genes=genes, shards=shards, hooks=hooks,
+                                     max_memory=max_memory,
+                                     max_overhangs=max_overhangs)
 
     def __str__(self):
         """ To String method. """
@@ -329,38 +1047,455 @@ class Sequence(object):
         retrieved by executing: self.population.get_survivor().
         """
         logger.debug("Analyzing sequence.")
-        if self.population.chromosomes:
-            for age in range(self.ages):
-                logger.debug("Running on age: %s/%s.", age + 1, self.ages)
-                self.population.mutate()
-                self.population.fit()
-                if not self.population.chromosomes:
-                    logger.debug("Breaking iteration.")
-                    break
-                if self.population.survivors and\
-                   self.population.shortest_survivor < self.population.shortest_chromosome:
-                    logger.debug("Solution found.")
-                    break
+        if self.search == self.BEST_FIRST:
+            self.__run_best_first()
+        elif self.search == self.A_STAR:
+            self.__run_best_first(self.population.genes.get_bounds())
+        elif self.search == self.BIDIRECTIONAL:
+            self.__run_bidirectional()
+        elif self.search == self.ITERATIVE_DEEPENING:
+            self.__run_iterative_deepening()
+        elif self.population.size:
+            try:
+                self.__run_generations()
+            finally:
+                self.population.close()
         logger.debug("Finished analyzing sequence.")
 
+    def __run_generations(self):
+        """
+        This private method mutates the whole population once per age.
+        """
+        for age in range(self.ages):
+            logger.debug("Running on age: %s/%s.", age + 1, self.ages)
+            self.population.mutate()
+            self.population.fit()
+            if not self.population.size:
+                logger.debug("Breaking iteration.")
+                break
+            if self.population.survivors and\
+               self.population.shortest_survivor < self.population.shortest_chromosome:
+                logger.debug("Solution found.")
+                break
+        if self.population.transpositions is not None:
+            logger.debug("Transpositions: %s", self.population.transpositions.stats)
+
+    def __run_best_first(self, bounds: bounds.Bounds=None):
+        """
+        This private method runs the best-first search.
+
+        Chromosomes are kept in a priority queue ordered by the
+        resolved prefix plus the overhang, which is a prefix of
+        every survivor the chromosome can lead to. Therefore,
+        ordering by its length and then alphabetically means that
+        the first winner taken from the queue is the final survivor.
+
+        Chromosomes with an overhang that was already expanded
+        using less genes are skipped. As in the GENERATIONS search,
+        at most 1 + ages genes are used.
+
+        @param bounds: If given, the least amount of characters needed
+                       to resolve the overhang is added to the length,
+                       which is still not longer than the survivor, and
+                       chromosomes that can not be resolved are removed.
+        """
+        def get_length(key: str, a: str, b: str) -> int:
+            if bounds is None:
+                return len(key)
+            bound = bounds.get(a, b)
+            return None if bound is None else len(key) + bound
+
+        queue = [
+            (len(survivor), survivor, 1, "", "", survivor)
+            for survivor in [self.population.survivors.best]
+            if survivor is not None
+        ]
+        for chromosome in self.population.chromosomes:
+            shared = min(len(chromosome[0]), len(chromosome[1]))
+            key = max(chromosome[0], chromosome[1], key=len)
+            a = chromosome[0][shared:]
+            b = chromosome[1][shared:]
+            length = get_length(key, a, b)
+            if length is not None:
+                queue.append((length, key, 1, a, b, chromosome[0][:shared]))
+        heapq.heapify(queue)
+        expanded = {}
+        while queue:
+            _, _, age, a, b, prefix = heapq.heappop(queue)
+            if not a and not b:
+                logger.debug("Solution found.")
+                self.population.survive(prefix)
+                break
+            if expanded.get((a, b), age + 1) <= age or age > self.ages:
+                continue
+            expanded[a, b] = age
+            if a:
+                genes = self.population.genes.get_genes(a_overhang=a)
+            else:
+                genes = self.population.genes.get_genes(b_overhang=b)
+            for gene in genes:
+                new_a = a + gene[0]
+                new_b = b + gene[1]
+                shared = min(len(new_a), len(new_b))
+                if new_a[:shared] != new_b[:shared]:
+                    continue
+                new_prefix = prefix + new_a[:shared]
+                key = new_prefix + new_a[shared:] + new_b[shared:]
+                length = get_length(key, new_a[shared:], new_b[shared:])
+                if length is None:
+                    continue
+                heapq.heappush(queue, (length, key, age + 1,
+                                       new_a[shared:], new_b[shared:],
+                                       new_prefix))
+        logger.debug("Expanded %s chromosome(s).", len(expanded))
+
+    def __run_iterative_deepening(self):
+        """
+        This private method runs the iterative deepening search.
+
+        Chromosomes are mutated depth first, so only the chromosomes
+        on the current path and their siblings are kept in memory.
+        Each iteration skips the chromosomes whose longest gene, which
+        is a prefix of every survivor they can lead to, is longer than
+        a bound. The bound starts at the shortest initial chromosome
+        and grows to the shortest chromosome skipped by the previous
+        iteration, so the first survivor found is as short as possible,
+        and the rest of the iteration only looks for alphabetically
+        smaller ones. As in the GENERATIONS search, at most 1 + ages
+        genes are used.
+
+        The genes that can fuse with the most recently used
+        overhangs are kept, up to MAX_CANDIDATES overhangs.
+        """
+        best = self.population.survivors.best
+        self.overhang_length = self.population.genes.max_length + 1
+        initial = sorted([
+            self.__get_node(chromosome[0], chromosome[1], "", 1)
+            for chromosome in self.population.chromosomes
+        ], reverse=True)
+        bound = min([len(node[0]) for node in initial] +
+                    ([len(best)] if best is not None else []), default=0)
+        iterations = 0
+        while True:
+            iterations += 1
+            logger.debug("Running with bound: %s.", bound)
+            next_bound = None
+            stack = [list(initial)]
+            while stack:
+                if not stack[-1]:
+                    stack.pop()
+                    continue
+                key, a, b, prefix, age = stack[-1].pop()
+                if len(key) > bound:
+                    if next_bound is None or len(key) < next_bound:
+                        next_bound = len(key)
+                    continue
+                # No survivor is shorter than the bound, so if the best
+                # survivor is not longer, only smaller ones are looked for.
+                if best is not None and len(best) <= bound and \
+                        key > best[:len(key)]:
+                    continue
+                if not a and not b:
+                    best = key
+                elif age <= self.ages:
+                    stack.append(self.__get_children(a, b, prefix, age + 1))
+            if next_bound is None or best is not None and len(best) <= bound:
+                break
+            bound = next_bound if best is None else min(next_bound, len(best))
+        logger.debug("Ran %s iteration(s).", iterations)
+        if best is not None:
+            self.population.survive(best)
+
+    @staticmethod
+    def __get_node(a: str, b: str, prefix: str, age: int) -> tuple:
+        """
+        This private method returns a chromosome of the iterative
+        deepening search, made of its longest gene, its overhangs,
+        its resolved part and its amount of genes.
+        """
+        shared = min(len(a), len(b))
+        prefix += a[:shared]
+        return (prefix + a[shared:] + b[shared:], a[shared:], b[shared:],
+                prefix, age)
 
-if __name__ == "__main__":
+    def __get_candidates(self, a: str, b: str) -> list:
+        """
+        This private method returns the genes that
+        can fuse with the overhangs of a chromosome.
 
-    # The following piece of code reads from stdin
-    # and truncates the input by case length..
-    for case_number, line in enumerate(sys.stdin):
-        case_length = int(line)  # WARNING: May raise ValueError.
-        case_data = "\n".join([
-            next(sys.stdin).replace("\n", "")
-            for _ in range(case_length)
-        ])
+        Genes can only fuse with the characters of an overhang that are
+        not longer than the longest gene, so the rest are not part of the
+        key. One more character is kept, so overhangs longer than every
+        gene are still longer.
+        """
+        key = a[:self.overhang_length], b[:self.overhang_length]
+        if key in self.candidates:
+            self.candidates.move_to_end(key)
+            return self.candidates[key]
+        if a:
+            genes = list(self.population.genes.get_genes(a_overhang=key[0]))
+        else:
+            genes = list(self.population.genes.get_genes(b_overhang=key[1]))
+        self.candidates[key] = genes
+        if len(self.candidates) > self.MAX_CANDIDATES:
+            self.candidates.popitem(last=False)
+        return genes
+
+    def __get_children(self, a: str, b: str, prefix: str, age: int) -> list:
+        """
+        This private method returns the chromosomes that a chromosome
+        of the iterative deepening search mutates into, in the reversed
+        order they are mutated.
 
-        # This is where the Genetic Algorithm is executed.
-        # It will run once per case in the input file.
-        g = Genes(case_data)
-        s = Sequence(genes=g, ages=g.size)
-        s.run()
+        Survivors are mutated first, and then chromosomes with an
+        overhang that less genes can fuse with, since they are the
+        ones more likely to be unfit soon.
+        """
+        children = []
+        for gene in self.__get_candidates(a, b):
+            new_a = a + gene[0]
+            new_b = b + gene[1]
+            a_dominance = Population.get_fitness(new_a, new_b)
+            b_dominance = Population.get_fitness(new_b, new_a)
+            if a_dominance == Population.UNFIT and b_dominance == Population.UNFIT:
+                continue
+            node = self.__get_node(new_a, new_b, prefix, age)
+            if a_dominance == Population.FIT:
+                followers = -1
+            else:
+                followers = len(self.__get_candidates(node[1], node[2]))
+            children.append((followers, node))
+        children.sort(reverse=True)
+        return [node for _, node in children]
+
+    def __run_bidirectional(self):
+        """
+        This private method runs the bidirectional search.
+
+        A second population mutates the reversed genetic code,
+        which means it builds survivors starting from their end.
+        A chromosome from the start whose overhang is exactly
+        the part missing from a chromosome from the end can be
+        joined with it into a survivor, so each population only
+        has to mutate about half of the ages.
+
+        The population with less chromosomes is mutated first.
+        The search stops when the best survivor is shorter than
+        any survivor that has not been joined yet.
+        """
+        populations = (
+            self.population,
+            Population(genes=self.population.genes.reverse(), reverse=True,
+                       shards=self.population.shards,
+                       hooks=self.population.hooks,
+                       max_overhangs=self.population.max_overhangs),
+        )
+        try:
+            self.__run_populations(populations)
+        finally:
+            for population in populations:
+                population.close()
+        if not populations[1].survivors.empty:
+            self.population.survive(populations[1].survivors.best[::-1])
+
+    def __run_populations(self, populations: tuple):
+        """
+        This private method mutates the populations from
+        the start and from the end of the bidirectional search.
+        """
+        ages = [1, 1]
+        joined = ({}, {})
+        for side in (0, 1):
+            self.__join(populations, joined, side)
+        while ages[0] + ages[1] <= self.ages and \
+                all(population.chromosomes for population in populations):
+            survivors = [
+                population.survivors.shortest
+                for population in populations
+                if not population.survivors.empty
+            ]
+            if survivors and min(survivors) < self.__get_shortest(populations):
+                logger.debug("Solution found.")
+                break
+            side = int(populations[1].size < populations[0].size)
+            logger.debug("Running on age: %s/%s.", sum(ages) + 1, self.ages + 1)
+            populations[side].mutate()
+            populations[side].fit()
+            ages[side] += 1
+            self.__join(populations, joined, side)
+
+    @staticmethod
+    def __get_overhangs(population: Population, side: int) -> list:
+        """
+        This private method returns the overhangs of a population.
+
+        Each element contains the overhang of the chromosomes from
+        the start this chromosome can be joined with, and its resolved
+        part as it would be read in the survivor.
+
+        @param population: The population from the start or from the end.
+        @param side: 0 if the population is from the start, 1 otherwise.
+        """
+        overhangs = []
+        for chromosome in population.chromosomes:
+            shared = min(len(chromosome[0]), len(chromosome[1]))
+            a = chromosome[0][shared:]
+            b = chromosome[1][shared:]
+            if side:
+                overhangs.append(((b[::-1], a[::-1]),
+                                  chromosome[0][:shared][::-1]))
+            else:
+                overhangs.append(((a, b), chromosome[0][:shared]))
+        return overhangs
+
+    def __join(self, populations: tuple, joined: tuple, side: int):
+        """
+        This private method joins the chromosomes of a population
+        with every chromosome of the other one seen so far.
+
+        Only the alphabetically smallest chromosome is kept for
+        each overhang and each length of the resolved part.
+        New survivors are added to both populations, so they
+        can remove the chromosomes dominated by them.
+
+        @param populations: The populations from the start and from the end.
+        @param joined: The chromosomes seen so far in each population.
+        @param side: The population that has just mutated.
+        """
+        for overhang, resolved in self.__get_overhangs(populations[side], side):
+            for other in joined[1 - side].get(overhang, {}).values():
+                if side:
+                    survivor = other + overhang[0] + overhang[1] + resolved
+                else:
+                    survivor = resolved + overhang[0] + overhang[1] + other
+                populations[0].survive(survivor)
+                populations[1].survive(survivor[::-1])
+            seen = joined[side].setdefault(overhang, {})
+            if len(resolved) not in seen or resolved < seen[len(resolved)]:
+                seen[len(resolved)] = resolved
+
+    def __get_shortest(self, populations: tuple) -> int:
+        """
+        This private method returns the length of the shortest
+        survivor that can still be found by mutating both populations.
+
+        A survivor like that is made of a chromosome from the start,
+        some more genes and a chromosome from the end.
+        """
+        lengths = []
+        for side, population in enumerate(populations):
+            overhangs = self.__get_overhangs(population, side)
+            lengths.append((
+                min(len(resolved) + len(a + b) for (a, b), resolved in overhangs),
+                min(len(resolved) for _, resolved in overhangs),
+            ))
+        return max(lengths[0][0] + lengths[1][1],
+                   lengths[0][1] + lengths[1][0])
+
+
+def solve(pairs: list, **kwargs) -> str:
+    """
+    This function runs the Genetic Algorithm on a single case
+    and returns its survivor, or IMPOSSIBLE if there is none.
+
+    @param pairs: A list of (a, b) pairs of strings,
+                  as returned by reader.read_cases.
+    @param kwargs: The search mode, the amount of shards, the hooks
+                   and the memory budget, which are passed to the Sequence.
+    """
+    # Genes that can not be part of any survivor are removed
+    # before the search, which is skipped if the case is proven
+    # impossible. Survivors may still repeat genes, so the amount
+    # of ages depends on the genes of the case.
+    reduced, reason, stats = proofs.prove(pairs, reuse=True)
+    if reason or not reduced:
+        logger.debug("Impossible case: %s", reason)
+        return Sequence.IMPOSSIBLE
+    if kwargs.get("hooks"):
+        kwargs["hooks"] = metrics.label_hooks(kwargs["hooks"], pairs=stats["pairs"],
+                                              reduced=stats["reduced"])
+    g = Genes.from_pairs(reduced)
+    s = Sequence(genes=g, ages=len(pairs), **kwargs)
+    s.run()
+    return s.population.get_survivor(Sequence.IMPOSSIBLE)
+
+
+if __name__ == "__main__":
 
-        # Printing results to STDOUT.
-        title = "Case {}:".format(case_number + 1)
-        print(title, s.population.get_survivor(Sequence.IMPOSSIBLE))
+    parser = argparse.ArgumentParser(description="Solving every case of the input.")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="Input file, read through mmap instead of stdin.")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Amount of processes solving cases. (default: 1)")
+    parser.add_argument("--shards", "-s", type=int, default=1,
+                        help="Amount of processes mutating the population "
+                             "of each case, with no speedup measured yet. "
+                             "(default: 1)")
+    parser.add_argument("--cache", "-c", type=int, default=1024,
+                        help="Amount of survivors cached in memory, "
+                             "0 disables the cache. (default: 1024)")
+    parser.add_argument("--results", "-r", default=None,
+                        help="SQLite file where survivors are cached between runs.")
+    parser.add_argument("--budget", "-b", type=int, default=None,
+                        help="Megabytes the population of each case can take "
+                             "before it is written to disk. (default: no limit)")
+    parser.add_argument("--trace", "-t", default=None,
+                        help="File where the metrics of every generation are "
+                             "written, as CSV or as JSON lines if it ends "
+                             "with '.jsonl'.")
+    args = parser.parse_args()
+    if args.workers < 1:
+        raise ValueError("Invalid amount of workers:", args.workers)
+    if args.shards > 1 and args.workers > 1:
+        raise ValueError("Workers and shards can not be combined:",
+                         args.workers, args.shards)
+    if args.trace and args.workers > 1:
+        raise ValueError("Workers and trace can not be combined:",
+                         args.workers, args.trace)
+
+    # The following piece of code reads the whole input
+    # in a single pass and splits it by case length.
+    cases = reader.read_cases(args.path or sys.stdin, use_mmap=bool(args.path))
+
+    # The metrics of every generation are labeled with
+    # the number of the case that is being solved.
+    collector = metrics.Collector(args.trace) if args.trace else None
+    if collector:
+        cases = collector.label_cases(cases)
+
+    # This is where the Genetic Algorithm is executed.
+    # It will run once per case in the input file, in a pool
+    # of processes if required. Survivors are still returned
+    # in input order.
+    case_solver = functools.partial(solve, shards=args.shards,
+                                    hooks=[collector] if collector else None,
+                                    max_memory=args.budget and args.budget * 2 ** 20)
+
+    # Cases that were already solved are taken from the cache.
+    if args.cache or args.results:
+        case_solver = functools.partial(solutions.solve,
+                                        solver=case_solver,
+                                        size=args.cache,
+                                        path=args.results,
+                                        namespace="edith")
+    pool = None
+    if args.workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(args.workers)
+    try:
+        if pool:
+            survivors = pool.imap(case_solver, cases, reader.CHUNKSIZE)
+        else:
+            survivors = map(case_solver, cases)
+
+        # Printing results to STDOUT as soon as
+        # every previous case has been solved.
+        for case_number, survivor in enumerate(survivors):
+            title = "Case {}:".format(case_number + 1)
+            print(title, survivor, flush=bool(pool))
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        if collector:
+            collector.close()
@@ -9,9 +9,31 @@ DATE: 2019, Feb 21th.
 
 You can execute this script by running this:
 >>> cat sample-01.in | python3 -m cProfile -s cumtime edith3.py
+
+Every case is read, solved and written before the next one,
+so the first winners are printed while the input is still
+being read. The same pipeline can be used from other modules:
+>>> edith3.write_cases(edith3.solve_cases(reader.read_cases(sys.stdin)))
+
+The input can also be read from a file through mmap:
+>>> python3 edith3.py sample-01.in
+
+Cases can be solved by a pool of processes:
+>>> cat sample-01.in | python3 edith3.py --workers 4
+
+Survivors are cached, so repeated cases are only solved once.
+They can also be cached in a file between runs:
+>>> cat sample-01.in | python3 edith3.py --results solutions.db
 """
 
 import sys
+import bisect
+import argparse
+import functools
+
+import proofs
+import reader
+import solutions
 
 # import timeit
 # import logging
@@ -29,6 +51,38 @@ MAX_GENERATIONS = 12  # NOTE: 1 <= k <= 11
 DEFAULT_SHORTEST_SURVIVOR = 100000
 IMPOSSIBLE = "IMPOSSIBLE"
 
+EMPTY_PREFIX = (0, 0, b"", None)
+PREFIX_BASE = 256  # NOTE: The amount of byte values.
+PREFIX_MODULUS = 2 ** 61 - 1
+
+
+class Phenotype(object):
+    """
+    This class represents a phenotype of the population.
+
+    Overhangs are UTF-8 bytes, which keep the alphabetical order
+    of the characters, and no character is a prefix of another one.
+    The genes used by the phenotype are the bits of an integer.
+    """
+
+    __slots__ = ("fitness", "prefix", "a", "b", "used")
+
+    def __init__(self, fitness: int, prefix: tuple, a: bytes, b: bytes, used: int):
+        """
+        Phenotype constructor.
+
+        @param fitness: Either UNFIT, FITTEST or FIT.
+        @param prefix: The solved prefix. See get_prefix.
+        @param a: The overhang of gene 'a', if any.
+        @param b: The overhang of gene 'b', if any.
+        @param used: The bits of the genes already used.
+        """
+        self.fitness = fitness
+        self.prefix = prefix
+        self.a = a
+        self.b = b
+        self.used = used
+
 
 def get_fitness(a: str, b: str) -> str:
     """
@@ -43,90 +97,190 @@ def get_fitness(a: str, b: str) -> str:
     return FIT
 
 
-def mutate(phenotype: tuple, genotype: tuple, shortest_survivor: int) -> tuple:
+def get_prefix(prefix: tuple) -> bytes:
+    """
+    This function rebuilds the characters of a solved prefix.
+
+    Solved prefixes are persistent chains of (length, hash, step, parent)
+    tuples, so children share the prefix of their parent instead of
+    copying it. Only the characters resolved by each mutation are kept
+    in its step. The hash of the characters of the whole prefix is kept,
+    so prefixes are compared by it before comparing their characters.
+    """
+    steps = []
+    while prefix[3] is not None:
+        steps.append(prefix[2])
+        prefix = prefix[3]
+    return b"".join(reversed(steps))
+
+
+def is_same_prefix(first: tuple, second: tuple) -> bool:
+    """
+    This function returns True if two solved prefixes of
+    the same length have the same characters.
+
+    Only the steps after the last parent they share are
+    compared, instead of rebuilding both prefixes.
+    """
+    first_steps = second_steps = b""
+    while first is not second:
+        if first[0] >= second[0]:
+            first_steps = first[2] + first_steps
+            first = first[3]
+        else:
+            second_steps = second[2] + second_steps
+            second = second[3]
+    return first_steps == second_steps
+
+
+def get_hashes(gene: bytes) -> tuple:
+    """
+    This function returns the hash of every prefix of a gene,
+    together with the power of PREFIX_BASE for its length,
+    so a prefix can be appended to a hash in constant time.
+    """
+    hashes = [(0, 1)]
+    for c in gene:
+        h, power = hashes[-1]
+        hashes.append(((h * PREFIX_BASE + c) % PREFIX_MODULUS,
+                       power * PREFIX_BASE % PREFIX_MODULUS))
+    return tuple(hashes)
+
+
+def mutate(phenotype: Phenotype, genotype: tuple, shortest_survivor: int) -> Phenotype:
     """
     This function will combine a phenotype and a genotype
     into a new phenotype, as if the phenotype mutated
     with the new genetic code.
     """
-    a = phenotype[2] + genotype[0]
-    b = phenotype[3] + genotype[1]
-    path = phenotype[4][:]  # The fastest way to clone is slicing.
-    path[genotype[4]] = False
+    a = phenotype.a + genotype[0]
+    b = phenotype.b + genotype[1]
     f = get_fitness(a, b)
+    if f == UNFIT:  # Unfit phenotypes are discarded right away.
+        return Phenotype(f, phenotype.prefix, a, b, phenotype.used)
+    prefix = phenotype.prefix
+    step = a[:len(b)]
+    if step:  # Children resolving nothing share the prefix of their parent.
+        # The step is a prefix of the gene added to the side without overhang.
+        h, power = genotype[5 if phenotype.b else 6][len(step)]
+        prefix = (
+            prefix[0] + len(step),
+            (prefix[1] * power + h) % PREFIX_MODULUS,
+            step,
+            prefix,
+        )
     if f == FITTEST:
-        shortest_survivor = min(shortest_survivor, len(phenotype[1] + a[:len(b)]))
-    return (
+        shortest_survivor = min(shortest_survivor, prefix[0])
+    return Phenotype(
         f,
-        phenotype[1] + a[:len(b)],
+        prefix,
         a[len(b):],
         b[len(a):],
-        path,
+        phenotype.used | genotype[4],
     )
 
-# The following piece of code reads from stdin
-# and truncates the input by case length..
-winners = []
-for line in sys.stdin:
 
-    # Reading block of characters from stdin.
-    genotypes = (
-        next(sys.stdin).rstrip().split()
-        for _ in range(int(line))  # WARNING: May raise ValueError.
-    )
-    genotypes = {
-        (
-            tuple(ord(g) for g in genotype[0]),
-            tuple(ord(g) for g in genotype[1]),
-            len(genotype[0]),
-            len(genotype[1]),
-            genotype_id,
-        )
-        for genotype_id, genotype in enumerate(genotypes)
-    }
-
-    # Cleaning genes by removing the
-    # ones with wierd characters not
-    # in the other pair.
-    a_all = {
-        char
-        for genotype in genotypes
-        for char in genotype[0]
-    }
-    b_all = {
-        char
-        for genotype in genotypes
-        for char in genotype[0]
-    }
-    genotypes = {
-        genotype
-        for genotype in genotypes
-        if not set(genotype[0]) - b_all
-        and not set(genotype[1]) - a_all
-    }
-
-    # Detecting systems that might diverge.
-    # If all elements on the left or the right
-    # are longer than the other genotype, it means
-    # the system will inevitable diverge.
-    a_diverges = all(
-        genotype[2] > genotype[3]
-        for genotype in genotypes
-    )
-    b_diverges = all(
-        genotype[2] < genotype[3]
-        for genotype in genotypes
-    )
-    if a_diverges or b_diverges:
-        winners.append(IMPOSSIBLE)
-        continue
+def get_index(genotypes: tuple) -> tuple:
+    """
+    This function indexes the genotypes by their genes.
+
+    For each gene, it returns the genes sorted alphabetically
+    and the position of their genotypes, so genotypes can be
+    looked up by prefix with a binary search.
+    """
+    index = []
+    for gene in (0, 1):
+        order = sorted(range(len(genotypes)),
+                       key=lambda position: genotypes[position][gene])
+        index.append(([genotypes[position][gene] for position in order], order))
+    return tuple(index)
+
+
+def merge(phenotypes) -> list:
+    """
+    This function removes unfit and duplicated phenotypes,
+    which have the same fitness, prefix and overhangs.
+
+    Prefixes are compared by their length and hash. If two of them
+    have the same hash, they are only merged if their characters are
+    the same, so a collision never drops a different prefix.
+    """
+    merged = {}
+    collided = []
+    for phenotype in phenotypes:
+        if phenotype.fitness == UNFIT:
+            continue
+        key = (phenotype.fitness, phenotype.prefix[0], phenotype.prefix[1],
+               phenotype.a, phenotype.b)
+        kept = merged.get(key)
+        if kept is not None and not is_same_prefix(kept.prefix, phenotype.prefix):
+            collided.append(kept)
+        merged[key] = phenotype
+    return list(merged.values()) + collided
+
+
+def get_genotypes(genotypes: tuple, index: tuple, phenotype: Phenotype) -> list:
+    """
+    This function returns the genotypes that can fuse
+    with the overhang of a phenotype, which means the
+    genotypes whose gene starts with the overhang or
+    is a prefix of it. They are returned in the same
+    order as in the genotypes tuple.
+    """
+    if phenotype.a:
+        keys, order = index[1]
+        overhang = phenotype.a
+    elif phenotype.b:
+        keys, order = index[0]
+        overhang = phenotype.b
+    else:
+        return genotypes
+    start = bisect.bisect_left(keys, overhang)
+    stop = start
+    while stop < len(keys) and keys[stop][:len(overhang)] == overhang:
+        stop += 1
+    positions = order[start:stop]
+    for end in range(1, len(overhang)):
+        start = bisect.bisect_left(keys, overhang[:end])
+        stop = bisect.bisect_right(keys, overhang[:end])
+        positions = positions + order[start:stop]
+    return [genotypes[position] for position in sorted(positions)]
+
+
+def solve(pairs: list) -> str:
+    """
+    This function runs the genetic algorithm on a single case
+    and returns its winner, or IMPOSSIBLE if there is none.
+
+    @param pairs: A list of (a, b) pairs of strings,
+                  as returned by reader.read_cases.
+    """
+
+    # Removing genes that can not be part of any survivor,
+    # and skipping the search if the case is proven impossible.
+    # Genes can not be repeated, so repeated genes are kept.
+    # There are no hooks, so the stats of the reduction are not measured.
+    pairs, reason, _ = proofs.prove(pairs, reuse=False)
+    if reason or not pairs:
+        return IMPOSSIBLE
+
+    # Encoding the genes of the case.
+    # Every genotype is marked by its own bit.
+    genotypes = []
+    for genotype_id, genotype in enumerate(pairs):
+        a = genotype[0].encode()
+        b = genotype[1].encode()
+        genotypes.append((a, b, len(a), len(b), 1 << genotype_id,
+                          get_hashes(a), get_hashes(b)))
+    genotypes = tuple(genotypes)
+    index = get_index(genotypes)
 
     # Detecting the amount of generations.
     generations = max(len(genotypes), MAX_GENERATIONS)
 
     # Generating initial population.
     phenotypes = (
-        (FIT, (), (), (), [True] * generations),
+        Phenotype(FIT, EMPTY_PREFIX, b"", b"", 0),
     )
 
     # Initializing survivors.
@@ -138,54 +292,130 @@ for line in sys.stdin:
     for generation in range(generations):  # [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
 
         # Generating mutations.
+        # Only potentially useful genotypes are retrieved from the index.
         phenotypes = (
             mutate(phenotype=phenotype,
                    genotype=genotype,
                    shortest_survivor=shortest_survivor)
             for phenotype in phenotypes
-            for genotype in genotypes
-            if phenotype[0] == FIT  # Discard unfit phenotypes.
-            and phenotype[4][genotype[4]]  # Avoid repeating an element.
-            and len(phenotype[1]) < shortest_survivor  # Discarding long solutions.
-            and (  # Only retrieve potentially useful genotypes.
-                genotype[0][:len(phenotype[3])] == phenotype[3][:genotype[2]]
-                or genotype[1][:len(phenotype[2])] == phenotype[2][:genotype[3]]
-            )
+            if phenotype.fitness == FIT  # Discard unfit phenotypes.
+            and phenotype.prefix[0] < shortest_survivor  # Discarding long solutions.
+            for genotype in get_genotypes(genotypes, index, phenotype)
+            if not phenotype.used & genotype[4]  # Avoid repeating an element.
         )
 
         # Removing unfit and duplicated phenotypes.
-        phenotypes = {
-            phenotype[:3]: phenotype
-            for phenotype in phenotypes 
-            if phenotype[0] != UNFIT
-        }.values()
+        phenotypes = merge(phenotypes)
 
         # Stopping if there are no more mutations.
         if not phenotypes:
             break
 
         # Detecting fittest chrosomes.
-        survivors.extend(list(filter(lambda phenotype: phenotype[0] == FITTEST,
+        survivors.extend(list(filter(lambda phenotype: phenotype.fitness == FITTEST,
                          phenotypes)))
 
     # Detecting the final survivor.
-    survivors = sorted(survivors, key=lambda s: (len(s[1]), s[1]))
-    winner = "".join(
-        chr(s)
-        for s in survivors[0][1]
-    ) if survivors else IMPOSSIBLE
-    winners.append(winner)
-
-# Printing results to STDOUT.
-sys.stdout.write("\n".join(
-    "".join([
-        "Case ",
-        str(case_number + 1),
-        ": ",
-        winner,
-    ])
-    for case_number, winner in enumerate(winners)
-))
-sys.stdout.write("\n")
+    # Only the shortest survivors get their prefixes rebuilt,
+    # unless some characters take more than a byte.
+    if not survivors:
+        return IMPOSSIBLE
+    if all(genotype[2] == len(pair[0]) and genotype[3] == len(pair[1])
+           for genotype, pair in zip(genotypes, pairs)):
+        shortest = min(s.prefix[0] for s in survivors)
+        survivors = [s for s in survivors if s.prefix[0] == shortest]
+    return min((get_prefix(s.prefix).decode() for s in survivors),
+               key=lambda survivor: (len(survivor), survivor))
+
+
+def solve_cases(cases, case_solver=solve, workers: int=1):
+    """
+    This function yields the winner of every case in input order,
+    as soon as it and every previous case have been solved.
+
+    @param cases: An iterable of cases, as returned by reader.read_cases.
+    @param case_solver: The function solving a single case.
+    @param workers: The amount of processes solving cases.
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("Invalid amount of workers:", workers)
+
+    # Cases are independent, so they can be solved by a pool
+    # of processes. Winners are still returned in input order.
+    # The pool is only imported if it is required,
+    # since it takes longer than solving small inputs.
+    if workers == 1:
+        yield from map(case_solver, cases)
+        return
+    import multiprocessing
+    pool = multiprocessing.Pool(workers)
+    try:
+        yield from pool.imap(case_solver, cases, reader.CHUNKSIZE)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def write_cases(winners, stream=None):
+    """
+    This function writes every winner as soon as it is
+    yielded, so the first cases can be read before
+    the last ones are solved.
+
+    @param winners: An iterable of winners, in input order.
+    @param stream: The output stream. By default, sys.stdout.
+    """
+    stream = stream or sys.stdout
+    for case_number, winner in enumerate(winners):
+        stream.write("".join([
+            "Case ",
+            str(case_number + 1),
+            ": ",
+            winner,
+            "\n",
+        ]))
+        stream.flush()
+
+
+def main(argv: list=None):
+    """
+    This function solves every case of the input
+    and prints the winners to STDOUT.
+
+    @param argv: The command line arguments.
+                 By default, they are taken from sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Solving every case of the input.")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="Input file, read through mmap instead of stdin.")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Amount of processes solving cases. (default: 1)")
+    parser.add_argument("--cache", "-c", type=int, default=1024,
+                        help="Amount of survivors cached in memory, "
+                             "0 disables the cache. (default: 1024)")
+    parser.add_argument("--results", "-r", default=None,
+                        help="SQLite file where survivors are cached between runs.")
+    args = parser.parse_args(argv)
+
+    # The following piece of code reads the input one case
+    # at a time and splits it by case length.
+    cases = reader.read_cases(args.path or sys.stdin, use_mmap=bool(args.path))
+
+    # Cases that were already solved are taken from the cache.
+    case_solver = solve
+    if args.cache or args.results:
+        case_solver = functools.partial(solutions.solve,
+                                        solver=solve,
+                                        size=args.cache,
+                                        path=args.results,
+                                        namespace="edith3")
+
+    # Printing results to STDOUT as soon as
+    # every previous case has been solved.
+    write_cases(solve_cases(cases, case_solver=case_solver, workers=args.workers))
+
+
+if __name__ == "__main__":
+    main()
 
 # logger.debug("Took: %s", timeit.timeit() - start)
@@ -0,0 +1,114 @@
+"""
+This is the external memory used by populations that
+do not fit in their memory budget.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+Records are tuples of strings, which are written to files
+in sorted runs, one record per line. Runs are read back through
+mmap, and every run can be merged with the others while records
+are streamed, so repeated records are removed without loading
+the runs into memory.
+
+For example:
+>>> r1 = Run.write([("a", "ab"), ("b", "bb")])
+>>> r2 = Run.write([("a", "ab"), ("c", "cc")])
+>>> list(merge([r1, r2]))
+[('a', 'ab'), ('b', 'bb'), ('c', 'cc')]
+"""
+
+import os
+import mmap
+import heapq
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+class Run(object):
+    """
+    This class represents a sorted run of records in a file.
+
+    @constant SEPARATOR: The character between the fields of a record.
+    """
+
+    SEPARATOR = "\t"
+
+    def __init__(self, path: str=None, size: int=0):
+        """
+        Run constructor.
+
+        @param path: The path of the file.
+        @param size: The amount of records in the file.
+        """
+        if not path or not os.path.isfile(path):
+            raise ValueError("Invalid path:", path)
+        self.path = path
+        self.size = size
+
+    def __str__(self):
+        """ To String method. """
+        return "<Run: {}>".format(self.size)
+
+    def __len__(self) -> int:
+        """ Returns the amount of records. """
+        return self.size
+
+    @property
+    def bytes(self) -> int:
+        """ Property to access the size of the file. """
+        return os.path.getsize(self.path)
+
+    @classmethod
+    def write(cls, records: list, directory: str=None) -> "Run":
+        """
+        This function sorts some records and writes them to a new file.
+
+        @param records: A list of tuples of strings without
+                        separators or line breaks.
+        @param directory: The directory of the file.
+                          By default, it is the temporary directory.
+        """
+        if not records:
+            raise ValueError("Invalid records:", records)
+        descriptor, path = tempfile.mkstemp(prefix="run-", suffix=".tsv",
+                                            dir=directory)
+        logger.debug("Writing %s record(s) to %s.", len(records), path)
+        with os.fdopen(descriptor, "w") as f:
+            for record in sorted(records):
+                f.write(cls.SEPARATOR.join(record) + "\n")
+        return cls(path=path, size=len(records))
+
+    def __iter__(self):
+        """
+        This function yields every record of the run in order.
+        """
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                for line in iter(m.readline, b""):
+                    yield tuple(line.decode().rstrip("\n").split(self.SEPARATOR))
+
+    def close(self):
+        """
+        This method removes the file.
+        """
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+def merge(runs: list):
+    """
+    This function yields the records of some runs in order,
+    removing repeated records.
+
+    @param runs: A list of Run instances.
+    """
+    previous = None
+    for record in heapq.merge(*runs):
+        if record != previous:
+            yield record
+        previous = record
@@ -0,0 +1,210 @@
+"""
+This is the instrumentation shared by edith.py and edith2.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+A Population can receive hooks, which are functions called
+with an event after every generation is fitted. The first
+event of each population is its initial fit, generation 0.
+Populations without hooks do not measure anything.
+
+Every event contains the following fields:
+- generation: The amount of mutations of the population.
+- reverse: True if the population builds survivors from their end.
+- size: Chromosomes before mutating.
+- mutated: Chromosomes after mutating.
+- fitted: Chromosomes after fitting.
+- unfit: Chromosomes removed as unfit. Chromosomes removed
+         by the worker processes of a sharded population
+         are not counted.
+- fit: Chromosomes removed as survivors.
+- dominated: Chromosomes removed because they can not lead
+             to a survivor as good as the best survivor.
+- duplicated: Chromosomes removed because another one
+              with the same genes or overhang was kept.
+- mutate_seconds: Time taken by the mutation.
+- dominance_seconds: Time taken by the dominance calculation.
+- filter_seconds: Time taken by everything else in the fit.
+- peak_memory_kb: Peak memory of the process so far.
+- transposition_hits: Chromosomes removed so far because their
+                      overhang was in the transposition table
+                      (see transpositions.py), if there is one.
+- transposition_evictions: Overhangs evicted so far from the
+                           transposition table, if there is one.
+- pairs: Genes of the case, if the population was created by solve.
+- reduced: Genes left by the reduction of the genetic code (see
+           reduction.py), if the population was created by solve.
+
+For example:
+>>> c = Collector("generations.csv")
+>>> edith2.solve(pairs, hooks=[c])
+>>> c.close()
+"""
+
+import csv
+import json
+import functools
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+FIELDS = (
+    "generation",
+    "reverse",
+    "size",
+    "mutated",
+    "fitted",
+    "unfit",
+    "fit",
+    "dominated",
+    "duplicated",
+    "mutate_seconds",
+    "dominance_seconds",
+    "filter_seconds",
+    "peak_memory_kb",
+    "transposition_hits",
+    "transposition_evictions",
+    "pairs",
+    "reduced",
+)
+
+
+def get_peak_memory() -> int:
+    """
+    This function returns the peak memory of
+    this process in kilobytes, if it is available.
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def new_event(generation: int, reverse: bool, size: int) -> dict:
+    """
+    This function returns an event without measurements.
+
+    @param generation: The amount of mutations of the population.
+    @param reverse: True if the population builds survivors from their end.
+    @param size: Chromosomes before mutating.
+    """
+    event = dict.fromkeys(FIELDS, 0)
+    event.update(generation=generation, reverse=reverse,
+                 size=size, mutated=size)
+    for field in ("mutate_seconds", "dominance_seconds", "filter_seconds"):
+        event[field] = 0.0
+    event["pairs"] = event["reduced"] = None
+    return event
+
+
+def call_labeled(hook, fields: dict, event: dict):
+    """
+    This function calls a hook with an event, after
+    updating the event with some fields.
+
+    @param hook: A function called with an event.
+    @param fields: The fields updated in the event.
+    @param event: A dict containing every field in FIELDS.
+    """
+    event.update(fields)
+    hook(event)
+
+
+def label_hooks(hooks: list, **fields) -> list:
+    """
+    This function returns hooks that update every event with
+    some fields before calling the given hooks.
+
+    @param hooks: Functions called with an event, or None.
+    @param fields: The fields updated in every event.
+    """
+    if not hooks:
+        return hooks
+    return [functools.partial(call_labeled, hook, fields) for hook in hooks]
+
+
+class Collector(object):
+    """
+    This class is a hook that writes every event to a file,
+    either as CSV or as JSON lines.
+
+    Labels are written as extra leading fields,
+    such as the number of the case being solved.
+
+    @constant CSV: Write events as CSV, with a header.
+    @constant JSONL: Write events as JSON lines.
+    """
+
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    def __init__(self, path: str=None, stream=None, format_: str=None,
+                 labels: dict=None):
+        """
+        Collector constructor.
+
+        @param path: The path of the file, if there is no stream.
+        @param stream: A text stream such as sys.stderr.
+        @param format_: Either CSV or JSONL. By default,
+                        it is JSONL if the path ends with '.jsonl'
+                        and CSV otherwise.
+        @param labels: Fields written before the fields of every event.
+                       They can be updated between events.
+        """
+        if format_ is None:
+            format_ = self.JSONL if str(path).endswith(".jsonl") else self.CSV
+        if format_ not in (self.CSV, self.JSONL):
+            raise ValueError("Invalid format:", format_)
+        if (path is None) == (stream is None):
+            raise ValueError("Invalid output:", path, stream)
+        self.format = format_
+        self.labels = dict(labels or {})
+        self.path = path
+        self.stream = stream if stream is not None else open(path, "w", newline="")
+        self.writer = None
+        self.events = 0
+
+    def __str__(self):
+        """ To String method. """
+        return "<Collector: {}>".format(self.events)
+
+    def __call__(self, event: dict):
+        """
+        This method writes an event.
+
+        @param event: A dict containing every field in FIELDS.
+        """
+        row = dict(self.labels)
+        row.update(event)
+        if self.format == self.JSONL:
+            self.stream.write(json.dumps(row) + "\n")
+        else:
+            if self.writer is None:
+                self.writer = csv.DictWriter(self.stream, fieldnames=list(row))
+                self.writer.writeheader()
+            self.writer.writerow(row)
+        self.events += 1
+
+    def label_cases(self, cases):
+        """
+        This function yields every case, labeling the events
+        written while it is solved with the number of the case.
+
+        @param cases: The cases, as returned by reader.read_cases.
+        """
+        for case_number, case in enumerate(cases):
+            self.labels["case"] = case_number + 1
+            yield case
+
+    def close(self):
+        """
+        This method closes the file, if it was opened by the collector.
+        """
+        if self.path is not None:
+            self.stream.close()
+        else:
+            self.stream.flush()
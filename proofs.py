@@ -0,0 +1,102 @@
+"""
+This is the detection of impossible cases shared by edith.py, edith2.py and edith3.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+Without a survivor, a search only stops after mutating every
+age, which is the slowest way to find out that a case is
+impossible. Before any search, the genetic code is reduced
+(see reduction.py) and the following proofs are tried:
+
+- alphabet, balance, start, end: The reduction removed every gene.
+  The end rule also proves the cases where every overhang that can
+  be reached from the start is mutated without finding a survivor.
+- weights: For some weights of 2 characters, every gene is heavier
+           in 'a' than in 'b', or the other way around, so 'a' and
+           'b' can never have the same weight.
+
+For example:
+>>> prove([("ab", "a"), ("b", "bb")])[:2]
+([('ab', 'a'), ('b', 'bb')], None)
+>>> prove([("aab", "a"), ("ba", "bba"), ("abb", "a")])[1]
+'No gene can end a survivor.'
+"""
+
+import itertools
+
+import reduction
+
+REASONS = {
+    "alphabet": "Some character is only in the 'a' genes or only in the 'b' genes.",
+    "balance": "No genes have as many characters, or as many "
+               "of some character, in 'a' as in 'b'.",
+    "start": "No gene can start a survivor.",
+    "end": "No gene can end a survivor.",
+    "weights": "No genes have the same weight in 'a' as in 'b' "
+               "for some weights of 2 characters.",
+}
+
+
+def is_open_half_plane(vectors: list) -> bool:
+    """
+    This function returns True if there are weights that make
+    every vector positive, so no sum of them is zero.
+
+    If there are, the weights can be rotated until they are
+    orthogonal to one of the vectors, so only those are tried.
+
+    @param vectors: A list of (x, y) pairs of integers, none of them zero.
+    """
+    for x, y in vectors:
+        for sign in (1, -1):
+            wx, wy = -sign * y, sign * x
+            if all(
+                wx * u + wy * v > 0
+                or (wx * u + wy * v == 0 and x * u + y * v > 0)
+                for u, v in vectors
+            ):
+                return True
+    return False
+
+
+def has_weights(pairs: list) -> bool:
+    """
+    This function returns True if some weights of 2 characters,
+    or of a character and all the others, prove that 'a' and 'b'
+    can never have the same weight.
+
+    @param pairs: A list of (a, b) pairs of strings.
+    """
+    alphabet = sorted({char for pair in pairs for gene in pair for char in gene})
+    amounts = [
+        (lambda gene, x=x: gene.count(x), lambda gene, y=y: gene.count(y))
+        for x, y in itertools.combinations(alphabet, 2)
+    ] + [
+        (lambda gene, x=x: gene.count(x), lambda gene, x=x: len(gene) - gene.count(x))
+        for x in alphabet
+    ]
+    for x, y in amounts:
+        vectors = [(x(a) - x(b), y(a) - y(b)) for a, b in pairs]
+        if (0, 0) not in vectors and is_open_half_plane(vectors):
+            return True
+    return False
+
+
+def prove(pairs: list, reuse: bool=True) -> tuple:
+    """
+    This function reduces the genetic code and returns the remaining
+    genes, the reason why the case is impossible, or None if the
+    case was not proven impossible, and the stats of the reduction.
+
+    @param pairs: A list of (a, b) pairs of strings.
+    @param reuse: Use this flag if survivors can repeat genes.
+    """
+    pairs, stats = reduction.reduce(pairs, reuse=reuse)
+    if not pairs:
+        return pairs, REASONS[stats["rule"]] if stats["rule"] else None, stats
+    if has_weights(pairs):
+        return pairs, REASONS["weights"], stats
+    return pairs, None, stats
@@ -0,0 +1,101 @@
+"""
+This is the input reader shared by edith.py, edith2.py and edith3.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+The whole input is parsed in a single pass. Every case starts
+with a line containing the amount of genes, followed by one
+line per gene containing 'a' and 'b' separated by a space.
+
+For example:
+>>> for pairs in read_cases(sys.stdin):
+...     print(pairs)
+[('are', 'yo'), ('you', 'u'), ...]
+
+Engines can receive ready-to-use objects by passing a factory:
+>>> for genes in read_cases("sample-01.in", factory=Genes.from_pairs):
+...     print(genes)
+<Genes: 5>
+
+Cases solved by a pool of processes are sent to the workers
+in chunks of CHUNKSIZE cases, since sending every case on its
+own takes longer than solving small cases.
+"""
+
+import io
+import mmap
+
+CHUNKSIZE = 8
+
+
+def read_lines(source=None, use_mmap: bool=False):
+    """
+    This function yields every line of the input
+    together with its line number, starting at 1.
+
+    @param source: A file path or a text stream such as sys.stdin.
+    @param use_mmap: Use this flag to map the file into memory
+                     instead of reading it, if source is a file path.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            if use_mmap and f.seek(0, io.SEEK_END):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    for line_number, line in enumerate(iter(m.readline, b"")):
+                        yield line_number + 1, line.decode()
+                return
+            f.seek(0)
+            lines = f.read().decode().splitlines()
+    elif hasattr(source, "read"):
+        # Streams are read line by line, so a case can be
+        # solved before the rest of the input arrives.
+        lines = source
+    else:
+        raise ValueError("Invalid source:", source)
+    for line_number, line in enumerate(lines):
+        yield line_number + 1, line
+
+
+def read_cases(source=None, factory=None, use_mmap: bool=False):
+    """
+    This function yields every case of the input.
+
+    Each case is a list of (a, b) pairs, or whatever the factory
+    returns when it is called with that list.
+
+    A ValueError containing the line number is raised
+    if a line can not be parsed.
+
+    @param source: A file path or a text stream such as sys.stdin.
+    @param factory: A function that receives the pairs of a case,
+                    such as Genes.from_pairs.
+    @param use_mmap: Use this flag to map the file into memory.
+    """
+    lines = read_lines(source=source, use_mmap=use_mmap)
+    for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            case_length = int(line)
+        except ValueError:
+            raise ValueError("Invalid case length on line {}:".format(line_number),
+                             line.rstrip())
+        if case_length < 1:
+            raise ValueError("Invalid case length on line {}:".format(line_number),
+                             case_length)
+        pairs = []
+        for gene_number, line in lines:
+            gene = line.split()
+            if len(gene) != 2:
+                raise ValueError("Invalid gene on line {}:".format(gene_number),
+                                 line.rstrip())
+            pairs.append((gene[0], gene[1]))
+            if len(pairs) == case_length:
+                break
+        if len(pairs) < case_length:
+            raise ValueError("Missing genes after line {}:".format(line_number),
+                             case_length - len(pairs))
+        yield factory(pairs) if factory else pairs
@@ -0,0 +1,206 @@
+"""
+This is the reduction of the genetic code shared by edith.py, edith2.py and edith3.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+Before any search, genes that can not be part of any survivor
+are removed, since every gene removed cuts the amount of
+mutations of every later generation. The following rules
+are applied until none of them removes a gene:
+
+- duplicates: Repeated genes, if genes can be reused.
+- alphabet: Genes with a character in 'a' that is not in any
+            'b', or a character in 'b' that is not in any 'a'.
+- balance: If every gene has at least as many characters, or as
+           many of some character, in 'a' as in 'b', survivors can
+           only use genes where both amounts are equal, and the
+           other way around.
+- start: Survivors start from an empty overhang, so genes that are
+         never fused with an overhang reachable from it are removed.
+- end: Survivors end in an empty overhang, so genes that never leave
+       an overhang from which the empty overhang can be reached are
+       removed.
+
+The start and end rules mutate the overhangs reachable from the start,
+and they are only applied if there are no more than MAX_OVERHANGS of them.
+
+Removed genes are not part of any survivor, so the survivors
+of the reduced genetic code are the same ones.
+
+For example:
+>>> pairs, stats = reduce([("ab", "a"), ("c", "bc"), ("c", "bc"), ("x", "c")])
+>>> pairs
+[('ab', 'a'), ('c', 'bc')]
+>>> stats["duplicates"], stats["alphabet"]
+(1, 1)
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+RULES = ("duplicates", "alphabet", "balance", "start", "end")
+
+MAX_OVERHANGS = 1000
+
+# The empty overhang of a survivor in get_paths.
+SURVIVOR = "survivor"
+
+
+def get_balance(pairs: list) -> list:
+    """
+    This function returns the genes that keep a survivor balanced.
+
+    Survivors have the same length, and the same amount of every
+    character, in 'a' and in 'b'. If no gene is shorter in 'a'
+    than in 'b' for some amount, genes that are longer in 'a'
+    can never be balanced by other genes, and the other way around.
+
+    @param pairs: A list of (a, b) pairs of strings.
+    """
+    alphabet = {char for pair in pairs for gene in pair for char in gene}
+    amounts = [len] + [
+        lambda gene, char=char: gene.count(char)
+        for char in sorted(alphabet)
+    ]
+    for amount in amounts:
+        differences = [amount(a) - amount(b) for a, b in pairs]
+        if min(differences, default=0) >= 0 or max(differences) <= 0:
+            pairs = [pair for pair, d in zip(pairs, differences) if not d]
+    return pairs
+
+
+def fuse(overhang: str, side: int, a: str, b: str) -> tuple:
+    """
+    This function returns the overhang left by a gene
+    fused with an overhang, and its side, or None if
+    the gene can not fuse with the overhang.
+
+    @param overhang: The characters of a side that are
+                     not in the other side yet.
+    @param side: 0 if the overhang is in 'a', 1 if it is in 'b'.
+    @param a: The gene 'a'.
+    @param b: The gene 'b'.
+    """
+    if side:
+        b = overhang + b
+    else:
+        a = overhang + a
+    if a.startswith(b):
+        return a[len(b):], 0
+    if b.startswith(a):
+        return b[len(a):], 1
+    return None
+
+
+def get_paths(pairs: list, max_overhangs: int=MAX_OVERHANGS) -> tuple:
+    """
+    This function returns the positions of the genes fused with
+    some overhang reachable from the start, and the positions of
+    the genes on some path from the start to a survivor.
+
+    Genes are treated as if they could be reused, which
+    keeps every path of the survivors that can not reuse them.
+    If there are more than max_overhangs overhangs, any gene
+    could fuse with the overhangs that are not mutated, so the
+    positions of every gene are returned in both sets.
+
+    @param pairs: A list of (a, b) pairs of strings.
+    @param max_overhangs: The amount of overhangs that are mutated.
+    """
+    start = ("", 0)
+    edges = []
+    overhangs = {start}
+    generation = [start]
+    while generation:
+        new_generation = []
+        for overhang in generation:
+            for position, (a, b) in enumerate(pairs):
+                mutation = fuse(*overhang, a, b)
+                if mutation is None:
+                    continue
+                if not mutation[0]:
+                    mutation = SURVIVOR
+                elif mutation not in overhangs:
+                    if len(overhangs) >= max_overhangs:
+                        positions = set(range(len(pairs)))
+                        return positions, set(positions)
+                    overhangs.add(mutation)
+                    new_generation.append(mutation)
+                edges.append((overhang, position, mutation))
+        generation = new_generation
+
+    # Walking the edges backwards from the survivors.
+    parents = {}
+    for overhang, _, mutation in edges:
+        parents.setdefault(mutation, []).append(overhang)
+    alive = {SURVIVOR}
+    generation = list(alive)
+    while generation:
+        generation = {
+            parent
+            for mutation in generation
+            for parent in parents.get(mutation, [])
+            if parent not in alive
+        }
+        alive.update(generation)
+    started = {position for _, position, _ in edges}
+    ended = {position for _, position, mutation in edges if mutation in alive}
+    return started, ended
+
+
+def reduce(pairs: list, reuse: bool=True) -> tuple:
+    """
+    This function removes the genes that can not be part of any
+    survivor. It returns the remaining genes, in the same order,
+    and the amount of genes removed by every rule. If every
+    gene is removed, the 'rule' stat is the rule removing the last ones.
+
+    @param pairs: A list of (a, b) pairs of strings.
+    @param reuse: Use this flag if survivors can repeat genes.
+                  Otherwise, repeated genes are kept, since
+                  a survivor may need every copy.
+    """
+    stats = dict.fromkeys(RULES, 0)
+    stats["pairs"] = len(pairs)
+    stats["iterations"] = 0
+    stats["rule"] = None
+    pairs = list(pairs)
+    if reuse:
+        pairs = list(dict.fromkeys(pairs))
+        stats["duplicates"] = stats["pairs"] - len(pairs)
+
+    # Removing a gene can make other rules remove more
+    # genes, so rules are applied until nothing changes.
+    size = None
+    while pairs and size != len(pairs):
+        size = len(pairs)
+        stats["iterations"] += 1
+        a_all = {char for a, _ in pairs for char in a}
+        b_all = {char for _, b in pairs for char in b}
+        reduced = [
+            (a, b)
+            for a, b in pairs
+            if set(a) <= b_all and set(b) <= a_all
+        ]
+        stats["alphabet"] += len(pairs) - len(reduced)
+        if not reduced:
+            stats["rule"] = "alphabet"
+        pairs = get_balance(reduced)
+        stats["balance"] += len(reduced) - len(pairs)
+        if reduced and not pairs:
+            stats["rule"] = "balance"
+        if pairs:
+            started, ended = get_paths(pairs)
+            stats["start"] += len(pairs) - len(started)
+            stats["end"] += len(started) - len(ended)
+            if not ended:
+                stats["rule"] = "end" if started else "start"
+            pairs = [pair for position, pair in enumerate(pairs) if position in ended]
+
+    stats["reduced"] = len(pairs)
+    logger.debug("Reduced %s gene(s) to %s: %s", stats["pairs"], len(pairs), stats)
+    return pairs, stats
@@ -0,0 +1,228 @@
+"""
+This is the cache of solved cases shared by edith.py, edith2.py and edith3.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+Cases are cached by a canonical form of their genes, so a case
+with the same genes in a different order or with its characters
+renamed is only solved once. The canonical form preserves the
+order of the alphabet, which decides between survivors of the
+same length, so renaming 'a' to 'x' and 'b' to 'y' is a hit
+but swapping 'a' and 'b' is not.
+
+For example:
+>>> c = Cache(size=1024, path="solutions.db")
+>>> c.solve(edith3.solve, [("ab", "a"), ("c", "bc")])
+'abc'
+>>> c.solve(edith3.solve, [("d", "cd"), ("bc", "b")])
+'bcd'
+"""
+
+import hashlib
+import collections
+
+# Caches used by this process, by configuration.
+caches = {}
+
+
+class Cache(object):
+    """
+    This class keeps the survivors of solved cases.
+
+    The most recently used survivors are kept in memory.
+    If a path is given, every survivor is also kept in an
+    SQLite database, so it can be shared between processes
+    and between runs.
+
+    @constant IMPOSSIBLE: Used to mark cases as unresolvable.
+    """
+
+    IMPOSSIBLE = "IMPOSSIBLE"
+
+    def __init__(self, size: int=1024, path: str=None, namespace: str=""):
+        """
+        Cache constructor.
+
+        @param size: The amount of survivors kept in memory.
+        @param path: The path of the database, if any.
+        @param namespace: A name for the solvers sharing this cache.
+                          Solvers that do not find the same survivors,
+                          such as edith3.py, which can not repeat genes,
+                          must use different namespaces.
+        """
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("Invalid size:", size)
+        self.size = size
+        self.path = path
+        self.namespace = namespace
+        self.entries = collections.OrderedDict()
+        self.connection = None
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        """ To String method. """
+        return "<Cache: {}>".format(len(self.entries))
+
+    def canonicalize(self, pairs: list) -> tuple:
+        """
+        This function returns the key of a case and its alphabet.
+
+        Characters are renamed in alphabetical order, so
+        the first one becomes 'a', the second one 'b', etc.
+        After that, the genes are sorted. Repeated genes are kept.
+
+        @param pairs: A list of (a, b) pairs of strings.
+        """
+        alphabet = "".join(sorted({char for pair in pairs for gene in pair for char in gene}))
+        table = str.maketrans(alphabet, self.get_canonical_alphabet(len(alphabet)))
+        genes = sorted(
+            "{} {}".format(a.translate(table), b.translate(table))
+            for a, b in pairs
+        )
+        genes.insert(0, self.namespace)
+        key = hashlib.sha1("\n".join(genes).encode()).hexdigest()
+        return key, alphabet
+
+    @classmethod
+    def get_canonical_alphabet(cls, size: int) -> str:
+        """
+        This function returns the first characters of the canonical alphabet.
+
+        @param size: The amount of characters.
+        """
+        return "".join(chr(ord("a") + i) for i in range(size))
+
+    def get(self, pairs: list, default: str=None) -> str:
+        """
+        Survivor getter.
+
+        This function returns the cached survivor of a case,
+        written with the characters of the case, or IMPOSSIBLE.
+
+        @param pairs: A list of (a, b) pairs of strings.
+        @param default: String value that will be
+                        returned if the case is not cached.
+        """
+        key, alphabet = self.canonicalize(pairs)
+        survivor = self.__load(key)
+        if survivor is None:
+            return default
+        return self.__decode(survivor, alphabet)
+
+    def solve(self, solver, pairs: list) -> str:
+        """
+        This method returns the survivor of a case,
+        calling the solver only if it is not cached.
+
+        @param solver: A function that receives the pairs of a case
+                       and returns its survivor or IMPOSSIBLE,
+                       such as edith3.solve.
+        @param pairs: A list of (a, b) pairs of strings.
+        """
+        key, alphabet = self.canonicalize(pairs)
+        survivor = self.__load(key)
+        if survivor is not None:
+            self.hits += 1
+            return self.__decode(survivor, alphabet)
+        self.misses += 1
+        survivor = solver(pairs)
+        if survivor == self.IMPOSSIBLE:
+            self.__save(key, "")
+        else:
+            canonical = self.get_canonical_alphabet(len(alphabet))
+            self.__save(key, survivor.translate(str.maketrans(alphabet, canonical)))
+        return survivor
+
+    def __decode(self, survivor: str, alphabet: str) -> str:
+        """
+        This private method writes a cached survivor
+        with the characters of the case.
+        """
+        if not survivor:
+            return self.IMPOSSIBLE
+        canonical = self.get_canonical_alphabet(len(alphabet))
+        return survivor.translate(str.maketrans(canonical, alphabet))
+
+    def __load(self, key: str) -> str:
+        """
+        This private method returns a cached survivor in its canonical
+        form, or an empty string if the case is impossible.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if self.path is None:
+            return None
+        row = self.__connect().execute(
+            "SELECT survivor FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.__remember(key, row[0])
+        return row[0]
+
+    def __save(self, key: str, survivor: str):
+        """
+        This private method caches a survivor in its canonical form.
+        """
+        self.__remember(key, survivor)
+        if self.path is not None:
+            with self.__connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO solutions VALUES (?, ?)",
+                    (key, survivor))
+
+    def __remember(self, key: str, survivor: str):
+        """
+        This private method keeps a survivor in memory,
+        forgetting the least recently used one if required.
+        """
+        if not self.size:
+            return
+        self.entries[key] = survivor
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def __connect(self) -> "sqlite3.Connection":
+        """
+        This private method opens the database the first time it is required.
+
+        SQLite is only imported at that point, since
+        most runs only keep survivors in memory. For the
+        same reason, this module does not import logging.
+        """
+        if self.connection is None:
+            import sqlite3
+            self.connection = sqlite3.connect(self.path, timeout=60)
+            with self.connection:
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS solutions "
+                    "(key TEXT PRIMARY KEY, survivor TEXT NOT NULL)")
+        return self.connection
+
+
+def solve(pairs: list, solver=None, size: int=1024, path: str=None,
+          namespace: str="") -> str:
+    """
+    This function returns the survivor of a case using
+    the cache of this process with the given configuration.
+
+    It can be sent to a pool of processes, since
+    every process creates its own cache.
+
+    @param pairs: A list of (a, b) pairs of strings.
+    @param solver: A function that receives the pairs of a case
+                   and returns its survivor or IMPOSSIBLE.
+    @param size: The amount of survivors kept in memory.
+    @param path: The path of the database, if any.
+    @param namespace: A name for the solvers sharing the cache.
+    """
+    configuration = size, path, namespace
+    if configuration not in caches:
+        caches[configuration] = Cache(size=size, path=path, namespace=namespace)
+    return caches[configuration].solve(solver, pairs)
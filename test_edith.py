@@ -10,9 +10,33 @@ You can run unit tests by executing the following command:
 >>> python -m unittest test_edith.py
 """
 
+import io
+import os
+import sys
+import itertools
+import contextlib
+import subprocess
+import tempfile
 import unittest
+import unittest.mock
+import multiprocessing
+import pandas as pd
 from parameterized import parameterized
 
+import edith
+import edith2
+import edith3
+import bounds
+import benchmark
+import cli
+import engines
+import reader
+import metrics
+import proofs
+import transpositions
+import frontier
+import reduction
+import solutions
 from edith import Genes, Sequence
 from edith2 import Genes, Sequence
 
@@ -89,6 +113,57 @@ fixtures = [(
     ]
 )]
 
+# The survivors of every case in sample-01.in.
+sample = [
+    "abc",
+    "kiwithenewmicroservice",
+    "a",
+    "eeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee",
+    (
+        "111111111111111111111122222222222222222222223333333333333333"
+        "333333444444444444444444444455555555555555555555556666666666"
+        "666666666666777777777777777777777788888888888888888888881010"
+        "101010110101010101121212121212121212121213131313131313131313"
+        "131414141414141414141414151515155151515151515516161616161616"
+        "611661611717171717171717717171181818181881818181818119191919"
+        "19191919191919"
+    ),
+    "aaaaaaaaaaa",
+    "aa",
+    "tinistoesselsoymimejormomento",
+    "tinistoesselsoymimejormomento",
+    "tinistoesselsoymimejormomento",
+    "tinistoesselsoymimejormomento",
+    "tinistoesselsoymimejormomento",
+    "tinistoesselsoymimejormomento",
+    "tinistoesselsoymimejormomentox",
+    "tinistoesselsoymimejormomento",
+    "abbcd",
+    "holaboludocomoandas",
+    "dearalanhowareyou",
+    "ienjoycorresponding",
+    "abcd",
+    Sequence.IMPOSSIBLE,
+    "holaboludocomoandas",
+    "araaraaraara",
+    Sequence.IMPOSSIBLE,
+]
+
+# Generated cases compared with the best-first search.
+generated = [
+    (family, seed)
+    for family in ("planted", "random")
+    for seed in range(10)
+]
+
+
+def generate(family: str, seed: int) -> list:
+    """
+    This function returns a generated case of 6 genes
+    whose planted survivors have 12 characters.
+    """
+    return benchmark.generate(family, pairs=6, length=4, solution=12, seed=seed)
+
 
 
 class FunctionalTests(unittest.TestCase):
@@ -111,3 +186,1085 @@ class FunctionalTests(unittest.TestCase):
         s.run()
         self.assertEquals(s.population.get_survivor(Sequence.IMPOSSIBLE),
                           output)
+
+
+class PopulationTests(unittest.TestCase):
+    """
+    Population Tests.
+
+    The pandas population must find the same survivors
+    regardless of the mutation, fitness and layout modes.
+    """
+
+    @parameterized.expand(fixtures)
+    def test_prefix_join(self, output, input_):
+        """
+        Running functional tests with the prefix join.
+        """
+        input_ = "\n".join(input_)
+        g = edith.Genes(input_)
+        s = edith.Sequence(genes=g, ages=g.size,
+                           mutation=edith.Population.PREFIX_JOIN)
+        s.run()
+        self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                         output)
+
+    @parameterized.expand(fixtures)
+    def test_vectorized_fitness(self, output, input_):
+        """
+        Running functional tests with the vectorized fitness.
+        """
+        input_ = "\n".join(input_)
+        g = edith.Genes(input_)
+        s = edith.Sequence(genes=g, ages=g.size,
+                           fitness=edith.Population.VECTORIZED_FITNESS)
+        s.run()
+        self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                         output)
+
+    @parameterized.expand(fixtures)
+    def test_columnar_layout(self, output, input_):
+        """
+        Running functional tests with the columnar layout.
+        """
+        input_ = "\n".join(input_)
+        for mutation in (edith.Population.CROSS_JOIN,
+                         edith.Population.PREFIX_JOIN):
+            g = edith.Genes(input_)
+            s = edith.Sequence(genes=g, ages=g.size, mutation=mutation,
+                               layout=edith.Population.COLUMNAR_LAYOUT)
+            s.run()
+            self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                             output)
+
+    def test_strings(self):
+        """
+        Strings stored in buffers must behave like Python strings.
+        """
+        for a, b in ((["asdf", "", "ab", "x"], ["as", "b", "", "xyz"]),
+                     (["añ€", "", "ñ", "€"], ["añ", "ñ", "", "€€"])):
+            dtype = edith.Strings.get_dtype(a + b)
+            a_strings = edith.Strings.encode(a, dtype)
+            b_strings = edith.Strings.encode(b, dtype)
+            self.assertEqual(list(a_strings.decode()), a)
+            self.assertEqual(list((a_strings + b_strings).decode()),
+                             [x + y for x, y in zip(a, b)])
+            self.assertEqual(list(a_strings.take([3, 0, 0]).decode()),
+                             [a[3], a[0], a[0]])
+            self.assertEqual(list(a_strings.slice(a_strings.lengths // 2,
+                                                  a_strings.lengths).decode()),
+                             [x[len(x) // 2:] for x in a])
+            self.assertEqual(list(a_strings.mismatch(b_strings)),
+                             [not (x.startswith(y) or y.startswith(x))
+                              for x, y in zip(a, b)])
+
+    def test_get_dominance(self):
+        """
+        The vectorized dominance must match the row-wise fitness.
+        """
+        a = ["AJYFAJYF", "AASD", "AA", "AJY", "", "ab", "abc"]
+        b = ["AJY", "FD", "AA", "AJYFAJYF", "x", "", "abd"]
+        a_dominance, b_dominance = edith.Population.get_dominance(a, b)
+        for i, _ in enumerate(a):
+            self.assertEqual(a_dominance[i],
+                             edith.Population.get_fitness(pd.Series([a[i], b[i]])))
+            self.assertEqual(b_dominance[i],
+                             edith.Population.get_fitness(pd.Series([b[i], a[i]])))
+
+    def test_merge(self):
+        """
+        Chromosomes with the same overhang must be merged.
+        """
+        g = edith.Genes("\n".join(["aaa a", "aaa a", "a aaa", "bbbb bbbb"]))
+        p = edith.Population(genes=g)
+        self.assertEqual(p.size, 2)
+        self.assertEqual(p.get_survivor(), "bbbb")
+        for position in p.chromosomes[edith.Population.PARENT]:
+            self.assertEqual(p.get_prefix(position), "a")
+
+    def test_remove_dominated(self):
+        """
+        Chromosomes longer than the best survivor must be removed.
+        """
+        for module in (edith, edith2):
+            g = module.Genes("\n".join(["aaa a", "a aaa", "b b"]))
+            p = module.Population(genes=g)
+            self.assertEqual(p.size, 0)
+            self.assertEqual(p.get_survivor(), "b")
+
+
+class SearchTests(unittest.TestCase):
+    """
+    Search Tests.
+
+    Every search mode must find the same survivor.
+    """
+
+    @parameterized.expand(fixtures)
+    def test_best_first(self, output, input_):
+        """
+        Running functional tests with the best-first search.
+        """
+        input_ = "\n".join(input_)
+        for module in (edith, edith2):
+            g = module.Genes(input_)
+            s = module.Sequence(genes=g, ages=g.size,
+                                search=module.Sequence.BEST_FIRST)
+            s.run()
+            self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                             output)
+
+    @parameterized.expand(fixtures)
+    def test_bidirectional(self, output, input_):
+        """
+        Running functional tests with the bidirectional search.
+        """
+        input_ = "\n".join(input_)
+        for module in (edith, edith2):
+            g = module.Genes(input_)
+            s = module.Sequence(genes=g, ages=g.size,
+                                search=module.Sequence.BIDIRECTIONAL)
+            s.run()
+            self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                             output)
+
+    @parameterized.expand(fixtures)
+    def test_iterative_deepening(self, output, input_):
+        """
+        Running functional tests with the iterative deepening search.
+        """
+        g = edith2.Genes("\n".join(input_))
+        s = edith2.Sequence(genes=g, ages=g.size,
+                            search=edith2.Sequence.ITERATIVE_DEEPENING)
+        s.run()
+        self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE), output)
+
+    @parameterized.expand(generated)
+    def test_iterative_deepening_generated(self, family, seed):
+        """
+        The iterative deepening search must find the same survivor
+        as the best-first search, keeping a limited amount of overhangs.
+        """
+        pairs = generate(family, seed)
+        g = edith2.Genes.from_pairs(pairs)
+        s = edith2.Sequence(genes=g, ages=g.size,
+                            search=edith2.Sequence.ITERATIVE_DEEPENING)
+        s.MAX_CANDIDATES = 2
+        s.run()
+        self.assertLessEqual(len(s.candidates), 2)
+        self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                         edith2.solve(pairs, search=edith2.Sequence.BEST_FIRST))
+
+    @parameterized.expand(fixtures)
+    def test_a_star(self, output, input_):
+        """
+        Running functional tests with the A* search.
+        """
+        g = edith2.Genes("\n".join(input_))
+        s = edith2.Sequence(genes=g, ages=g.size,
+                            search=edith2.Sequence.A_STAR)
+        s.run()
+        self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE), output)
+
+    @parameterized.expand(generated)
+    def test_a_star_generated(self, family, seed):
+        """
+        The A* search must find the same survivor as the best-first search.
+        """
+        pairs = generate(family, seed)
+        self.assertEqual(edith2.solve(pairs, search=edith2.Sequence.A_STAR),
+                         edith2.solve(pairs, search=edith2.Sequence.BEST_FIRST))
+
+
+class ReaderTests(unittest.TestCase):
+    """
+    Reader Tests.
+
+    The whole input must be parsed in a single pass,
+    either from a stream or from a file path.
+    """
+
+    def test_read_cases(self):
+        """
+        Cases must be split by case length.
+        """
+        source = io.StringIO("2\na ab\nb bb\n1\nabc ab\n")
+        self.assertEqual(list(reader.read_cases(source)),
+                         [[("a", "ab"), ("b", "bb")], [("abc", "ab")]])
+
+    def test_read_cases_from_path(self):
+        """
+        Files must be parsed in the same way with and without mmap.
+        """
+        with open("sample-01.in") as f:
+            expected = list(reader.read_cases(f))
+        for use_mmap in (False, True):
+            cases = reader.read_cases("sample-01.in", use_mmap=use_mmap)
+            self.assertEqual(list(cases), expected)
+
+    def test_factory(self):
+        """
+        Every engine must get ready-to-use genes.
+        """
+        for module in (edith, edith2):
+            source = io.StringIO("2\nare yo\nyou u\n")
+            cases = reader.read_cases(source, factory=module.Genes.from_pairs)
+            g = next(cases)
+            self.assertEqual(g.size, 2)
+            self.assertEqual(list(g.reverse().get_positions(a_startswith="u")),
+                             [1])
+
+    @parameterized.expand([
+        ("2\na ab\nx\nb bb\n", "line 3"),
+        ("1\na ab\nx\n", "line 3"),
+        ("2\na ab\n", "line 1"),
+    ])
+    def test_invalid_input(self, source, line):
+        """
+        Invalid lines must be reported with their line number.
+        """
+        with self.assertRaises(ValueError) as context:
+            list(reader.read_cases(io.StringIO(source)))
+        self.assertIn(line, context.exception.args[0])
+
+
+class WorkerTests(unittest.TestCase):
+    """
+    Worker Tests.
+
+    Every engine must solve a single case with a function
+    that can be sent to a pool of processes.
+    """
+
+    @parameterized.expand(fixtures)
+    def test_solve(self, output, input_):
+        """
+        Running functional tests with the solve functions.
+        """
+        pairs = [tuple(gene.split(" ")) for gene in input_]
+        for module in (edith, edith2, edith3):
+            self.assertEqual(module.solve(pairs), output)
+
+    def test_prefix_chains(self):
+        """
+        edith3 prefixes with the same characters must have the
+        same hash, regardless of the mutations that resolved them.
+        """
+        pairs = [("abc", "ab"), ("d", "cd"), ("a", "a"), ("bcd", "bcd"), ("a", "b")]
+        genotypes = []
+        for genotype_id, pair in enumerate(pairs):
+            a, b = (gene.encode() for gene in pair)
+            genotypes.append((a, b, len(a), len(b), 1 << genotype_id,
+                              edith3.get_hashes(a), edith3.get_hashes(b)))
+        root = edith3.Phenotype(edith3.FIT, edith3.EMPTY_PREFIX, b"", b"", 0)
+        first = edith3.mutate(edith3.mutate(root, genotypes[0], 0), genotypes[1], 0)
+        second = edith3.mutate(edith3.mutate(root, genotypes[2], 0), genotypes[3], 0)
+        for phenotype in (first, second):
+            self.assertEqual(phenotype.fitness, edith3.FITTEST)
+            self.assertEqual(edith3.get_prefix(phenotype.prefix), b"abcd")
+        self.assertEqual(first.prefix[:2], second.prefix[:2])
+        self.assertNotEqual(first.prefix[2], second.prefix[2])
+        self.assertEqual((first.used, second.used), (0b00011, 0b01100))
+        self.assertTrue(edith3.is_same_prefix(first.prefix, second.prefix))
+        self.assertFalse(edith3.is_same_prefix(
+            edith3.mutate(root, genotypes[0], 0).prefix,
+            edith3.mutate(edith3.mutate(root, genotypes[2], 0), genotypes[2], 0).prefix,
+        ))
+        self.assertEqual(edith3.mutate(root, genotypes[4], 0).fitness, edith3.UNFIT)
+
+    @parameterized.expand(fixtures)
+    def test_collisions(self, output, input_):
+        """
+        Prefixes with the same hash must not be merged
+        unless they have the same characters.
+        """
+        pairs = [tuple(gene.split(" ")) for gene in input_]
+        with unittest.mock.patch.object(edith3, "PREFIX_MODULUS", 1):
+            self.assertEqual(edith3.solve(pairs), output)
+
+    @parameterized.expand([
+        ([("añ", "a"), ("€", "ñ€")], "añ€"),
+        ([("€€", "€"), ("a", "€a"), ("ñ", "ñ")], "ñ"),
+        ([("€", "€"), ("ab", "ab")], "€"),
+    ])
+    def test_unicode(self, pairs, output):
+        """
+        edith3 must find the shortest survivor in characters,
+        even if its characters take more than a byte.
+        """
+        self.assertEqual(edith3.solve(pairs), output)
+
+    @parameterized.expand([
+        ([("a", "aaabb"), ("aab", "a"), ("aabbaaa", "aa"), ("a", "aa")], "aaabbaaaa"),
+        ([("aaa", "a"), ("b", "baaaaaa"), ("aaa", "b"), ("abb", "aba"),
+          ("aaaab", "b")], "baaaaaaab"),
+        ([("a", "abb"), ("b", "a"), ("baa", "baabb"), ("a", "ab"),
+          ("baabb", "abb")], "abbaabb"),
+    ])
+    def test_duplicated(self, pairs, output):
+        """
+        Phenotypes with the same prefix must only be merged
+        if both of their overhangs are the same.
+        """
+        self.assertEqual(edith3.solve(pairs), output)
+
+    @parameterized.expand(fixtures)
+    def test_shards(self, output, input_):
+        """
+        Running functional tests with a sharded population.
+        """
+        g = edith2.Genes("\n".join(input_))
+        s = edith2.Sequence(genes=g, ages=g.size, shards=2)
+        s.run()
+        self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                         output)
+        self.assertIsNone(s.population.pool)
+
+    def test_shared_memory(self):
+        """
+        The genetic code must be attached from shared memory.
+        """
+        g = edith2.Genes("\n".join(["are yo", "you u", "how nhoware"]))
+        memory, size = g.to_shared_memory()
+        try:
+            shared = edith2.Genes.from_shared_memory(memory.name, size)
+        finally:
+            memory.close()
+            memory.unlink()
+        self.assertEqual((shared.A, shared.B), (g.A, g.B))
+
+    def test_pool(self):
+        """
+        Survivors must be returned in input order.
+        """
+        cases = [
+            [tuple(gene.split(" ")) for gene in input_]
+            for _, input_ in fixtures
+        ]
+        with multiprocessing.Pool(2) as pool:
+            self.assertEqual(list(pool.imap(edith2.solve, cases)),
+                             [output for output, _ in fixtures])
+
+
+class CacheTests(unittest.TestCase):
+    """
+    Cache Tests.
+
+    Cases with the same canonical form must only be solved once.
+    """
+
+    def setUp(self):
+        """
+        Counting the cases solved by edith3.
+        """
+        self.solved = []
+
+    def solve(self, pairs: list) -> str:
+        """
+        Solving a case with edith3.
+        """
+        self.solved.append(pairs)
+        return edith3.solve(pairs)
+
+    def test_canonical_form(self):
+        """
+        Reordered genes and renamed characters must be cache hits.
+        """
+        c = solutions.Cache()
+        self.assertEqual(c.solve(self.solve, [("ab", "a"), ("c", "bc")]), "abc")
+        self.assertEqual(c.solve(self.solve, [("d", "cd"), ("bc", "b")]), "bcd")
+        self.assertEqual(c.solve(self.solve, [("a", "ab"), ("b", "bb")]),
+                         Sequence.IMPOSSIBLE)
+        self.assertEqual(c.solve(self.solve, [("x", "xz"), ("z", "zz")]),
+                         Sequence.IMPOSSIBLE)
+        self.assertEqual(len(self.solved), 2)
+
+    def test_alphabet_order(self):
+        """
+        Swapping characters changes the order of the survivors,
+        so it must not be a cache hit.
+        """
+        c = solutions.Cache()
+        self.assertEqual(c.solve(self.solve, [("ab", "ab"), ("c", "c")]), "c")
+        self.assertEqual(c.solve(self.solve, [("cb", "cb"), ("a", "a")]), "a")
+        self.assertEqual(len(self.solved), 2)
+
+    def test_lru(self):
+        """
+        Only the most recently used survivors must be kept in memory.
+        """
+        c = solutions.Cache(size=1)
+        c.solve(self.solve, [("ab", "a"), ("c", "bc")])
+        c.solve(self.solve, [("a", "a")])
+        c.solve(self.solve, [("ab", "a"), ("c", "bc")])
+        self.assertEqual(len(self.solved), 3)
+        self.assertEqual(len(c.entries), 1)
+
+    def test_database(self):
+        """
+        Survivors must be cached between runs.
+        """
+        path = os.path.join(tempfile.mkdtemp(), "solutions.db")
+        c = solutions.Cache(size=0, path=path)
+        c.solve(self.solve, [("ab", "a"), ("c", "bc")])
+        c = solutions.Cache(size=0, path=path)
+        self.assertEqual(c.get([("bc", "b"), ("d", "cd")]), "bcd")
+        self.assertEqual(c.get([("a", "a")], Sequence.IMPOSSIBLE),
+                         Sequence.IMPOSSIBLE)
+        self.assertEqual(len(self.solved), 1)
+
+
+class BenchmarkTests(unittest.TestCase):
+    """
+    Testing the generator of synthetic cases.
+    """
+
+    @parameterized.expand([(seed, ) for seed in range(10)])
+    def test_planted(self, seed):
+        """
+        Planted cases must have a survivor no longer than the planted one.
+        """
+        pairs = benchmark.generate("planted", pairs=4, solution=8, seed=seed)
+        self.assertEqual(len(pairs), 4)
+        survivor = edith2.solve(pairs)
+        self.assertNotEqual(survivor, Sequence.IMPOSSIBLE)
+        self.assertLessEqual(len(survivor), 8)
+
+    @parameterized.expand([
+        ("impossible-length", seed) for seed in range(5)
+    ] + [
+        ("impossible-count", seed) for seed in range(5)
+    ])
+    def test_impossible(self, family, seed):
+        """
+        Impossible cases must not have survivors.
+        """
+        pairs = benchmark.generate(family, pairs=4, seed=seed)
+        self.assertEqual(edith2.solve(pairs), Sequence.IMPOSSIBLE)
+        self.assertEqual(edith3.solve(pairs), Sequence.IMPOSSIBLE)
+
+    def test_seed(self):
+        """
+        The same seed must generate the same case.
+        """
+        self.assertEqual(benchmark.generate("random", seed=7),
+                         benchmark.generate("random", seed=7))
+        self.assertNotEqual(benchmark.generate("random", seed=7),
+                            benchmark.generate("random", seed=8))
+
+    def test_write(self):
+        """
+        Generated cases must be readable.
+        """
+        cases = [benchmark.generate("planted", seed=seed) for seed in range(3)]
+        stream = io.StringIO()
+        benchmark.write(cases, stream)
+        stream.seek(0)
+        self.assertEqual(list(reader.read_cases(stream)), cases)
+
+    @parameterized.expand([("edith2-bidirectional", ), ("edith3", )])
+    def test_in_process(self, engine):
+        """
+        Engines measured in this process must solve every case.
+        """
+        cases = [benchmark.generate("planted", seed=seed) for seed in range(3)]
+        run = benchmark.measure_in_process(engine, cases)
+        self.assertEqual(len(run["answers"]), 3)
+        self.assertNotIn(Sequence.IMPOSSIBLE, run["answers"])
+        self.assertIsNone(run["maxrss_kb"])
+
+
+class MetricsTests(unittest.TestCase):
+    """
+    Testing the hooks called after every generation.
+    """
+
+    pairs = [("a", "ab"), ("b", "ca"), ("ca", "a"), ("abc", "c")]
+
+    @parameterized.expand([
+        (edith.solve, {}),
+        (edith.solve, {"layout": edith.Population.COLUMNAR_LAYOUT}),
+        (edith2.solve, {}),
+        (edith2.solve, {"search": edith2.Sequence.BIDIRECTIONAL}),
+    ])
+    def test_hooks(self, solver, kwargs):
+        """
+        Hooks must receive one event per generation
+        without changing the survivor.
+        """
+        events = []
+        survivor = solver(self.pairs, hooks=[lambda event: events.append(dict(event))],
+                          **kwargs)
+        self.assertEqual(survivor, solver(self.pairs, **kwargs))
+        self.assertTrue(events)
+        for event in events:
+            self.assertEqual(set(event), set(metrics.FIELDS))
+            self.assertEqual((event["pairs"], event["reduced"]), (4, 4))
+            self.assertEqual(event["mutated"] - event["fitted"],
+                             event["unfit"] + event["fit"] +
+                             event["dominated"] + event["duplicated"])
+        generations = [event["generation"] for event in events
+                       if not event["reverse"]]
+        self.assertEqual(generations, list(range(len(generations))))
+        for reverse in (False, True):
+            hits = [event["transposition_hits"] for event in events
+                    if event["reverse"] == reverse]
+            self.assertEqual(hits, sorted(hits))
+            duplicated = sum(event["duplicated"] for event in events
+                             if event["reverse"] == reverse)
+            self.assertLessEqual(max(hits, default=0), duplicated)
+
+    @parameterized.expand([(edith.solve, ), (edith2.solve, )])
+    def test_transpositions(self, solver):
+        """
+        Events must count the chromosomes removed by the transposition
+        table, unless there is no table.
+        """
+        pairs = [("bb", "b"), ("bb", "ba"), ("aab", "abb"),
+                 ("a", "bb"), ("abb", "aaa"), ("baa", "abb")]
+        for max_overhangs, found in ((0, False), (100, True)):
+            events = []
+            solver(pairs, hooks=[events.append], max_overhangs=max_overhangs)
+            self.assertEqual(any(event["transposition_hits"] for event in events), found)
+
+    @parameterized.expand([
+        (metrics.Collector.CSV, ),
+        (metrics.Collector.JSONL, ),
+    ])
+    def test_collector(self, format_):
+        """
+        Collectors must write every event labeled with its case.
+        """
+        stream = io.StringIO()
+        c = metrics.Collector(stream=stream, format_=format_)
+        for pairs in c.label_cases([self.pairs, [("a", "a")]]):
+            edith2.solve(pairs, hooks=[c])
+        c.close()
+        stream.seek(0)
+        if format_ == metrics.Collector.CSV:
+            rows = pd.read_csv(stream).to_dict("records")
+        else:
+            rows = pd.read_json(stream, lines=True).to_dict("records")
+        self.assertEqual(len(rows), c.events)
+        self.assertEqual(rows[0]["case"], 1)
+        self.assertEqual(rows[-1]["case"], 2)
+        self.assertEqual(list(rows[0])[1:], list(metrics.FIELDS))
+
+
+class FrontierTests(unittest.TestCase):
+    """
+    Testing populations that are written to disk.
+    """
+
+    def test_merge(self):
+        """
+        Runs must be read in order and without repeated records.
+        """
+        runs = [
+            frontier.Run.write([("b", "bb"), ("a", "ab")]),
+            frontier.Run.write([("c", "cc"), ("a", "ab")]),
+        ]
+        try:
+            self.assertEqual(list(runs[0]), [("a", "ab"), ("b", "bb")])
+            self.assertEqual(list(frontier.merge(runs)),
+                             [("a", "ab"), ("b", "bb"), ("c", "cc")])
+        finally:
+            for run in runs:
+                run.close()
+        self.assertFalse(any(os.path.exists(run.path) for run in runs))
+
+    @parameterized.expand([
+        (output, input_, max_memory)
+        for output, input_ in fixtures
+        for max_memory in (1, 2000)
+    ])
+    def test_max_memory(self, output, input_, max_memory):
+        """
+        Running functional tests with a memory budget.
+        """
+        g = edith2.Genes("\n".join(input_))
+        s = edith2.Sequence(genes=g, ages=g.size, max_memory=max_memory)
+        population = s.population
+        s.run()
+        self.assertEqual(population.get_survivor(Sequence.IMPOSSIBLE), output)
+        self.assertEqual(population.runs, [])
+
+    @parameterized.expand([
+        ([("aaa", "b"), ("abb", "b"), ("a", "aba"), ("aaa", "bab"),
+          ("baabab", "ba"), ("a", "aaaaaab")], ),
+    ] + [
+        (benchmark.generate("planted", pairs=6, length=4, solution=12, seed=seed), )
+        for seed in (42, 44, 60, 96)
+    ])
+    def test_max_memory_transpositions(self, pairs):
+        """
+        Chromosomes mutated on disk must not be
+        removed as transposed by themselves.
+        """
+        self.assertEqual(edith2.solve(pairs, max_memory=3000), edith2.solve(pairs))
+
+    def test_spill(self):
+        """
+        Chromosomes must be written to disk
+        when they do not fit in the memory budget.
+        """
+        g = edith2.Genes("\n".join(["a aa", "aa a", "ab a", "b ba"]))
+        expected = edith2.Population(genes=g)
+        p = edith2.Population(genes=g, max_memory=1)
+        try:
+            self.assertEqual(p.chromosomes, [])
+            self.assertEqual(len(p.runs), 1)
+            self.assertEqual(p.size, expected.size)
+            self.assertEqual(p.shortest_chromosome, expected.shortest_chromosome)
+            for population in (p, expected):
+                population.mutate()
+                population.fit()
+            self.assertEqual(p.size, expected.size)
+            self.assertEqual(sorted(x[:2] for x in expected.chromosomes),
+                             [list(x) for x in frontier.merge(p.runs)])
+        finally:
+            p.close()
+        self.assertEqual(p.runs, [])
+
+    def test_invalid_search(self):
+        """
+        Only the GENERATIONS search supports a memory budget.
+        """
+        g = edith2.Genes("\n".join(["a aa", "aa a"]))
+        with self.assertRaises(ValueError):
+            edith2.Sequence(genes=g, search=Sequence.BEST_FIRST, max_memory=1)
+
+
+class CliTests(unittest.TestCase):
+    """
+    Testing the command line interface shared by every engine.
+    """
+
+    @parameterized.expand([
+        (["--engine", engine] + arguments, )
+        for engine in [cli.DEFAULT, "edith", "edith2", "edith3"]
+        for arguments in ([], ["--cache", "0"])
+    ] + [
+        (["--engine", "edith2", "--search", edith2.Sequence.BEST_FIRST], ),
+    ] + [
+        (["--search", search], )
+        for search in (edith2.Sequence.GENERATIONS, edith2.Sequence.BEST_FIRST,
+                       edith2.Sequence.A_STAR, edith2.Sequence.ITERATIVE_DEEPENING)
+    ])
+    def test_main(self, arguments):
+        """
+        Every engine must print the survivor of every case.
+        """
+        path = os.path.join(tempfile.mkdtemp(), "fixtures.in")
+        with open(path, "w") as f:
+            for _, input_ in fixtures:
+                f.write("{}\n{}\n".format(len(input_), "\n".join(input_)))
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            cli.main([path] + arguments)
+        self.assertEqual(stdout.getvalue().splitlines(), [
+            "Case {}: {}".format(case_number + 1, output)
+            for case_number, (output, _) in enumerate(fixtures)
+        ])
+
+    @parameterized.expand([(cli.DEFAULT, ), ("edith", ), ("edith2", ), ("edith3", )])
+    def test_sample(self, engine):
+        """
+        Every engine must print the known survivors of sample-01.in.
+        """
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            cli.main(["sample-01.in", "--engine", engine, "--cache", "0"])
+        self.assertEqual(stdout.getvalue().splitlines(), [
+            "Case {}: {}".format(case_number + 1, survivor)
+            for case_number, survivor in enumerate(sample)
+        ])
+
+    def test_edith3_main(self):
+        """
+        edith3 must print the winner of every case read from STDIN.
+        """
+        stdin = io.StringIO("".join(
+            "{}\n{}\n".format(len(input_), "\n".join(input_))
+            for _, input_ in fixtures
+        ))
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                unittest.mock.patch("sys.stdin", stdin):
+            edith3.main(["--cache", "0"])
+        self.assertEqual(stdout.getvalue().splitlines(), [
+            "Case {}: {}".format(case_number + 1, output)
+            for case_number, (output, _) in enumerate(fixtures)
+        ])
+
+    def test_edith3_streaming(self):
+        """
+        edith3 must write every winner before reading the next case.
+        """
+        read = []
+        stdout = io.StringIO()
+
+        def get_cases():
+            for output, input_ in fixtures[:3]:
+                read.append(stdout.getvalue().count("\n"))
+                yield [tuple(gene.split(" ")) for gene in input_]
+
+        edith3.write_cases(edith3.solve_cases(get_cases()), stream=stdout)
+        self.assertEqual(read, [0, 1, 2])
+
+    def test_lazy_import(self):
+        """
+        Pandas must only be imported by the 'edith' engine.
+        """
+        code = ("import sys, cli; cli.get_solver({!r}).solve([('a', 'a')]); "
+                "print('pandas' in sys.modules)")
+        for engine, imported in (("edith3", "False"), ("edith2", "False"),
+                                 (cli.DEFAULT, "False"), ("edith", "True")):
+            output = subprocess.check_output([sys.executable, "-c", code.format(engine)])
+            self.assertEqual(output.decode().strip(), imported)
+
+    def test_default(self):
+        """
+        Cases must be solved by the bidirectional search by default.
+        """
+        with unittest.mock.patch.object(engines.ENGINES["edith2-bidirectional"],
+                                        "solve", return_value="ab") as solve:
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout), \
+                    unittest.mock.patch("sys.stdin", io.StringIO("1\nab ab\n")):
+                cli.main(["--cache", "0"])
+        self.assertEqual(stdout.getvalue(), "Case 1: ab\n")
+        solve.assert_called_once_with([("ab", "ab")])
+
+    @parameterized.expand([
+        (None, None, "edith2-bidirectional"),
+        (None, "generations", "edith2"),
+        (None, "a-star", "edith2-a-star"),
+        ("edith", None, "edith"),
+        ("edith", "best-first", "edith-best-first"),
+    ])
+    def test_search(self, engine, search, expected):
+        """
+        Search modes without an engine must be search modes of edith2.
+        """
+        self.assertEqual(cli.get_solver(engine, search).name, expected)
+
+    def test_invalid_search(self):
+        """
+        edith3 does not have search modes.
+        """
+        with self.assertRaises(ValueError):
+            cli.get_solver("edith3", edith2.Sequence.BEST_FIRST)
+
+
+class EngineTests(unittest.TestCase):
+    """
+    Conformance Tests.
+
+    Every engine in a namespace must find the same survivors.
+    """
+
+    @parameterized.expand([
+        (name, output, input_)
+        for name in sorted(engines.ENGINES)
+        for output, input_ in fixtures
+    ])
+    def test_fixtures(self, name, output, input_):
+        """
+        Every engine must solve the fixtures.
+        """
+        pairs = [tuple(gene.split(" ")) for gene in input_]
+        self.assertEqual(engines.ENGINES[name].solve(pairs), output)
+
+    @parameterized.expand([
+        (family, seed)
+        for family in ("planted", "random", "impossible-length", "impossible-count")
+        for seed in range(5)
+    ])
+    def test_generated(self, family, seed):
+        """
+        Every engine in the same namespace must agree on generated cases.
+        """
+        pairs = benchmark.generate(family, pairs=5, length=3, solution=9, seed=seed)
+        survivors = {
+            name: engine.solve(pairs)
+            for name, engine in engines.ENGINES.items()
+            if engine.namespace == "edith"
+        }
+        self.assertEqual(len(set(survivors.values())), 1, survivors)
+
+
+class ReductionTests(unittest.TestCase):
+    """
+    Testing the reduction of the genetic code before any search.
+    """
+
+    @parameterized.expand([
+        ([("ab", "a"), ("c", "bc"), ("c", "bc")], True,
+         [("ab", "a"), ("c", "bc")], "duplicates", 1),
+        ([("ab", "a"), ("c", "bc"), ("c", "bc")], False,
+         [("ab", "a"), ("c", "bc"), ("c", "bc")], "duplicates", 0),
+        ([("a", "a"), ("xa", "a"), ("a", "ay")], True,
+         [("a", "a")], "alphabet", 2),
+        ([("a", "a"), ("ab", "b"), ("aab", "ab")], True,
+         [("a", "a")], "balance", 2),
+        ([("aba", "b"), ("ab", "aab")], True, [], "start", 2),
+        ([("ba", "baa"), ("aba", "ab")], True, [], "end", 2),
+        ([("aba", "baa"), ("aa", "aa")], True, [("aa", "aa")], "start", 1),
+        ([("b", "ba"), ("bb", "abb"), ("baa", "ba")], True,
+         [("bb", "abb"), ("baa", "ba")], "end", 1),
+    ])
+    def test_rules(self, pairs, reuse, expected, rule, removed):
+        """
+        Every rule must remove the genes that can not be part of a survivor.
+        """
+        reduced, stats = reduction.reduce(pairs, reuse=reuse)
+        self.assertEqual(reduced, expected)
+        self.assertEqual(stats[rule], removed)
+        self.assertEqual(stats["pairs"], len(pairs))
+        self.assertEqual(stats["reduced"], len(expected))
+
+    def test_max_overhangs(self):
+        """
+        Every gene must be kept if there are more overhangs than the limit.
+        """
+        pairs = [("aab", "a"), ("ba", "bba"), ("abb", "a")]
+        self.assertEqual(reduction.get_paths(pairs), ({0, 2}, set()))
+        self.assertEqual(reduction.get_paths(pairs, max_overhangs=1),
+                         ({0, 1, 2}, {0, 1, 2}))
+
+    def test_fixpoint(self):
+        """
+        Rules must be applied until no gene is removed.
+        """
+        pairs = [("a", "a"), ("e", "d"), ("f", "e"), ("x", "f")]
+        reduced, stats = reduction.reduce(pairs)
+        self.assertEqual(reduced, [("a", "a")])
+        self.assertEqual(stats["iterations"], 2)
+        self.assertEqual(sum(stats[rule] for rule in reduction.RULES), 3)
+
+    @parameterized.expand([
+        (family, seed)
+        for family in ("planted", "random", "impossible-length", "impossible-count")
+        for seed in range(5)
+    ])
+    def test_survivors(self, family, seed):
+        """
+        Survivors must not change when the genetic code is reduced.
+        """
+        pairs = benchmark.generate(family, pairs=5, seed=seed)
+        s = Sequence(genes=Genes.from_pairs(pairs), ages=len(pairs),
+                     search=Sequence.BIDIRECTIONAL)
+        s.run()
+        self.assertEqual(edith2.solve(pairs, search=Sequence.BIDIRECTIONAL),
+                         s.population.get_survivor(Sequence.IMPOSSIBLE))
+
+
+class ProofTests(unittest.TestCase):
+    """
+    Testing the detection of impossible cases before any search.
+    """
+
+    @parameterized.expand([
+        ([("ab", "a"), ("b", "bb")], None),
+        ([("a", "ab"), ("b", "ca"), ("ca", "a"), ("abc", "c")], None),
+        ([("a", "ax")], "alphabet"),
+        ([("ab", "a"), ("ba", "b")], "balance"),
+        ([("aba", "b"), ("ab", "aab")], "start"),
+        ([("ba", "baa"), ("aba", "ab")], "end"),
+        ([("bbb", "a"), ("aa", "bbb"), ("aaa", "aa")], "weights"),
+        ([("aab", "a"), ("ba", "bba"), ("abb", "a")], "end"),
+    ])
+    def test_reasons(self, pairs, reason):
+        """
+        Impossible cases must be proven with the right reason.
+        """
+        _, found, _ = proofs.prove(pairs)
+        self.assertEqual(found, proofs.REASONS[reason] if reason else None)
+        if reason:
+            self.assertEqual(edith2.solve(pairs), Sequence.IMPOSSIBLE)
+            self.assertEqual(edith3.solve(pairs), Sequence.IMPOSSIBLE)
+
+    @parameterized.expand([
+        ([(1, 0), (0, 1)], True),
+        ([(1, 0), (1, 0)], True),
+        ([(1, 0), (-1, 0)], False),
+        ([(1, 1), (-2, 1), (1, -2)], False),
+        ([(-1, 3), (2, -3), (1, 0)], True),
+    ])
+    def test_half_plane(self, vectors, expected):
+        """
+        Vectors must only be in an open half plane if no sum of them is zero.
+        """
+        self.assertEqual(proofs.is_open_half_plane(vectors), expected)
+
+    @parameterized.expand([
+        (family, seed)
+        for family in ("planted", "random")
+        for seed in range(10)
+    ])
+    def test_solvable(self, family, seed):
+        """
+        Cases with survivors must never be proven impossible,
+        whether genes can be reused or not.
+        """
+        pairs = benchmark.generate(family, pairs=5, seed=seed)
+        s = Sequence(genes=Genes.from_pairs(pairs), ages=len(pairs),
+                     search=Sequence.BIDIRECTIONAL)
+        s.run()
+        if s.population.get_survivor(Sequence.IMPOSSIBLE) != Sequence.IMPOSSIBLE:
+            self.assertIsNone(proofs.prove(pairs, reuse=True)[1])
+        survivors = [
+            permutation
+            for length in range(1, len(pairs) + 1)
+            for permutation in itertools.permutations(pairs, length)
+            if "".join(a for a, _ in permutation) == "".join(b for _, b in permutation)
+        ]
+        if survivors:
+            self.assertIsNone(proofs.prove(pairs, reuse=False)[1])
+
+
+class BoundsTests(unittest.TestCase):
+    """
+    Testing the lower bounds of the characters needed to resolve an overhang.
+    """
+
+    @parameterized.expand([
+        ([("ab", "a"), ("c", "bc")], ("b", ""), 1),
+        ([("ab", "a"), ("c", "bc")], ("", ""), 0),
+        ([("ab", "a"), ("c", "bc")], ("bbbb", ""), 4),
+        ([("ab", "a"), ("c", "bc"), ("ba", "b")], ("a", ""), None),
+        ([("a", "ab"), ("b", "ca"), ("ca", "a"), ("abc", "c")], ("", "ccababa"), None),
+    ])
+    def test_get(self, pairs, overhang, expected):
+        """
+        Overhangs must have the least amount of characters needed to
+        resolve them, or None if they can not be resolved.
+        """
+        self.assertEqual(bounds.Bounds(pairs).get(*overhang), expected)
+
+    @parameterized.expand([
+        ("", "", 0),
+        ("1", "", 1),
+        ("0000", "", 4),
+        ("", "1111", 2),
+    ])
+    def test_estimate(self, a, b, expected):
+        """
+        Overhangs must be estimated by their balance.
+        """
+        pairs = [("1", "10"), ("1101", "1"), ("1", "0"), ("0", "101")]
+        b_ = bounds.Bounds(pairs, max_overhangs=0)
+        self.assertFalse(b_.mutated)
+        self.assertEqual(b_.get(a, b), expected)
+
+    @parameterized.expand(generated)
+    def test_admissible(self, family, seed):
+        """
+        Bounds must never make a chromosome on the way
+        to the survivor longer than the survivor.
+        """
+        pairs = generate(family, seed)
+        survivor = edith2.solve(pairs, search=Sequence.BEST_FIRST)
+        if survivor == Sequence.IMPOSSIBLE:
+            return
+        b = bounds.Bounds(pairs)
+
+        # Every chromosome whose genes spell the survivor so far,
+        # as the lengths of its 'a' and 'b' in the survivor.
+        chromosomes = [(0, 0)]
+        visited = set()
+        while chromosomes:
+            a, b_ = chromosomes.pop()
+            if (a, b_) in visited:
+                continue
+            visited.add((a, b_))
+            if (a, b_) != (0, 0):
+                shared = min(a, b_)
+                bound = b.get(survivor[shared:a], survivor[shared:b_])
+                self.assertIsNotNone(bound)
+                self.assertLessEqual(max(a, b_) + bound, len(survivor))
+            for gene_a, gene_b in pairs:
+                if survivor.startswith(gene_a, a) and survivor.startswith(gene_b, b_):
+                    chromosomes.append((a + len(gene_a), b_ + len(gene_b)))
+        self.assertIn((len(survivor), len(survivor)), visited)
+
+    def test_max_overhangs(self):
+        """
+        Overhangs must not be mutated beyond their limit.
+        """
+        pairs = [("1", "10"), ("1101", "1"), ("1", "0"), ("0", "101")]
+        b = bounds.Bounds(pairs, max_overhangs=10)
+        self.assertEqual(len(b.mutated), 10)
+
+    def test_invalid(self):
+        """
+        Bounds must not be built without pairs.
+        """
+        with self.assertRaises(ValueError):
+            bounds.Bounds([])
+
+
+class TranspositionTests(unittest.TestCase):
+    """
+    Testing the transposition table shared across generations.
+    """
+
+    def test_visit(self):
+        """
+        Overhangs seen with a better prefix must be dominated.
+        """
+        t = transpositions.Transpositions()
+        self.assertTrue(t.visit("ab", "", 2, "xy"))
+        self.assertFalse(t.visit("ab", "", 3, "aaa"))
+        self.assertFalse(t.visit("ab", "", 2, "xz"))
+        self.assertTrue(t.visit("ab", "", 2, "xa"))
+        self.assertTrue(t.visit("ab", "", 1, "x"))
+        self.assertTrue(t.visit("", "ab", 3, "aaa"))
+        self.assertTrue(t.visit("", "ab", 3))
+        self.assertEqual(t.stats, {"hits": 2, "misses": 2, "updates": 3, "evictions": 0})
+
+    def test_evict(self):
+        """
+        The longest overhangs must be evicted first.
+        """
+        t = transpositions.Transpositions(4)
+        for overhang in ("a", "bb", "ccc", "dddd", "eeeee"):
+            t.visit(overhang, "", 1)
+        self.assertEqual(sorted(t.table), [("a", ""), ("bb", ""), ("ccc", "")])
+        self.assertEqual(t.stats["evictions"], 2)
+        self.assertTrue(t.visit("dddd", "", 1))
+
+    def test_invalid(self):
+        """
+        The table must not be built without room for overhangs.
+        """
+        with self.assertRaises(ValueError):
+            transpositions.Transpositions(0)
+
+    @parameterized.expand([
+        (family, seed, max_overhangs)
+        for family, seed in generated
+        if seed < 5
+        for max_overhangs in (0, 2, transpositions.Transpositions.MAX_SIZE)
+    ])
+    def test_survivors(self, family, seed, max_overhangs):
+        """
+        The transposition table must not change the survivor.
+        """
+        pairs = generate(family, seed)
+        expected = edith2.solve(pairs, search=Sequence.BEST_FIRST)
+        for search in (Sequence.GENERATIONS, Sequence.BIDIRECTIONAL):
+            g = edith2.Genes.from_pairs(pairs)
+            s = edith2.Sequence(genes=g, ages=12, search=search,
+                                max_overhangs=max_overhangs)
+            s.run()
+            self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE), expected)
+            for layout in (edith.Population.FRAME_LAYOUT,
+                           edith.Population.COLUMNAR_LAYOUT):
+                g = edith.Genes.from_pairs(pairs)
+                s = edith.Sequence(genes=g, ages=12, search=search,
+                                   layout=layout, max_overhangs=max_overhangs)
+                s.run()
+                self.assertEqual(s.population.get_survivor(Sequence.IMPOSSIBLE),
+                                 expected)
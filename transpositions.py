@@ -0,0 +1,104 @@
+"""
+This is the transposition table shared by edith.py and edith2.py.
+
+AUTHOR: Martin Alejandro Castro Alvarez
+EMAIL: martincastro.10.5@gmail.com
+HOME: https://www.martincastroalvarez.com
+DATE: 2019, Feb 21th.
+
+A chromosome mutates according to its overhang only, so chromosomes
+with the same overhang lead to the same survivors, each one after its
+own resolved prefix. The same overhang can come back in a later
+generation, after more genes, and it would be mutated all over again.
+
+The table records the shortest, and then alphabetically smallest,
+resolved prefix seen for every overhang across generations. A chromosome
+is dominated if its overhang was already seen with a prefix as good as
+its own, which was seen earlier and therefore has as many ages left.
+If the prefix is not known, only its length is compared.
+
+The table keeps at most MAX_SIZE overhangs. When it is full, the longest
+overhangs are evicted first, until it is down to 3/4 of MAX_SIZE.
+An evicted overhang can only be mutated again, so survivors do not change.
+
+For example:
+>>> t = Transpositions()
+>>> t.visit("ab", "", 1, "a")
+True
+>>> t.visit("ab", "", 2, "aa")
+False
+>>> t.stats
+{'hits': 1, 'misses': 1, 'updates': 0, 'evictions': 0}
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Transpositions(object):
+    """
+    This class represents the best resolved prefix of every overhang.
+
+    @constant MAX_SIZE: The amount of overhangs kept in the table.
+    """
+
+    MAX_SIZE = 100000
+
+    def __init__(self, max_size: int=MAX_SIZE):
+        """
+        Transpositions constructor.
+
+        @param max_size: The amount of overhangs kept in the table.
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Invalid size:", max_size)
+        self.max_size = max_size
+        self.table = {}
+        self.stats = dict.fromkeys(("hits", "misses", "updates", "evictions"), 0)
+
+    def __str__(self):
+        """ To String method. """
+        return "<Transpositions: {}>".format(len(self.table))
+
+    def __len__(self) -> int:
+        """ Length of the table. """
+        return len(self.table)
+
+    def visit(self, a: str, b: str, length: int, prefix: str=None) -> bool:
+        """
+        This function records a chromosome and returns False
+        if it is dominated by a chromosome seen before.
+
+        @param a: The overhang of gene 'a', if any.
+        @param b: The overhang of gene 'b', if any.
+        @param length: The length of the resolved prefix.
+        @param prefix: The resolved prefix, if it is known.
+        """
+        best = self.table.get((a, b))
+        if best is None:
+            self.stats["misses"] += 1
+        elif best[0] < length or (best[0] == length and best[1] is not None
+                                  and prefix is not None and best[1] <= prefix):
+            self.stats["hits"] += 1
+            return False
+        else:
+            self.stats["updates"] += 1
+            if best[0] == length and prefix is None:
+                return True
+        self.table[a, b] = length, prefix
+        if len(self.table) > self.max_size:
+            self.__evict()
+        return True
+
+    def __evict(self):
+        """
+        This private method evicts the longest overhangs
+        until the table is down to 3/4 of its size.
+        """
+        overhangs = sorted(self.table, key=lambda overhang: len(overhang[0] + overhang[1]))
+        evicted = overhangs[self.max_size * 3 // 4:]
+        for overhang in evicted:
+            del self.table[overhang]
+        self.stats["evictions"] += len(evicted)
+        logger.debug("Evicting %s overhang(s).", len(evicted))